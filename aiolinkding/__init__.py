@@ -1,8 +1,12 @@
 """Define the aiolinkding package."""
 
 from .client import Client, async_get_client
+from .pool import ClientPool
+from .sync import SyncClient
 
 __all__ = [
     "Client",
+    "ClientPool",
+    "SyncClient",
     "async_get_client",
 ]
@@ -2,24 +2,189 @@
 
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable
-from typing import Any
+import asyncio
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Iterable,
+    Mapping,
+)
+from contextlib import AbstractContextManager, nullcontext, suppress
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import IO, Any
 
-from aiolinkding.util import generate_api_payload
+from aiolinkding.endpoints import (
+    BOOKMARK,
+    BOOKMARK_ARCHIVE,
+    BOOKMARK_UNARCHIVE,
+    BOOKMARKS,
+    BOOKMARKS_ARCHIVED,
+)
+from aiolinkding.errors import ClientClosedError, UnknownEndpointError
+from aiolinkding.util import (
+    UNSET,
+    UnsetType,
+    diff_payload,
+    generate_api_payload,
+    project_fields,
+    retag,
+)
+from aiolinkding.util.cache import CacheNamespace, MemoryCache
+from aiolinkding.util.checkpoint import Checkpoint
+from aiolinkding.util.columnar import SNAPSHOT_FIELDS, BookmarkSnapshot
+from aiolinkding.util.concurrency import (
+    DEFAULT_BULK_CONCURRENCY,
+    aenumerate,
+    async_run_bounded,
+)
+from aiolinkding.util.dedupe import (
+    DEDUPE_FIELDS,
+    DEFAULT_TITLE_DISTANCE,
+    DuplicateFinder,
+    DuplicateGroup,
+)
+from aiolinkding.util.formats import BookmarkWriter, ExportFormat, iter_bookmarks
+from aiolinkding.util.limiter import AdaptiveLimiter
+from aiolinkding.util.priority import background, background_priority
+from aiolinkding.util.progress import Progress, ProgressCallback, ProgressReporter
+from aiolinkding.watch import (
+    DEFAULT_BACKOFF,
+    DEFAULT_MAX_INTERVAL,
+    DEFAULT_MIN_INTERVAL,
+    BookmarkEvent,
+    BookmarkWatcher,
+)
+
+DEFAULT_BOOKMARK_CACHE_TTL = 60.0
+DEFAULT_PAGE_SIZE = 100
+
+CREATE_FIELDS = (
+    "title",
+    "description",
+    "notes",
+    "tag_names",
+    "is_archived",
+    "unread",
+    "shared",
+)
+
+
+class BookmarkSort(StrEnum):
+    """Define the orders in which bookmarks can be listed."""
+
+    ADDED_ASC = "added_asc"
+    ADDED_DESC = "added_desc"
+    TITLE_ASC = "title_asc"
+    TITLE_DESC = "title_desc"
+
+
+@dataclass(slots=True)
+class BookmarkBatch:
+    """Define the result of fetching many bookmarks by ID."""
+
+    bookmarks: list[dict[str, Any]] = field(default_factory=list)
+    missing: list[int] = field(default_factory=list)
+
+
+async def _aiter_unexported(
+    bookmarks: AsyncIterable[dict[str, Any]], *, last_id: int | None, skip: int
+) -> AsyncGenerator[dict[str, Any], None]:
+    """Skip the bookmarks that an interrupted export already wrote.
+
+    At most ``skip`` bookmarks are skipped: fewer if the last exported bookmark turns
+    up earlier (e.g., because bookmarks before it were deleted in the meantime).
+
+    Args:
+    ----
+        bookmarks: The bookmarks, starting at or before the last exported one.
+        last_id: The ID of the last exported bookmark.
+        skip: The number of bookmarks up to (and including) the last exported one.
+
+    Yields:
+    ------
+        The bookmarks after the last exported one.
+
+    """
+    async for bookmark in bookmarks:
+        if skip:
+            skip = 0 if bookmark.get("id") == last_id else skip - 1
+            continue
+        yield bookmark
 
 
 class BookmarkManager:
     """Define the API manager object."""
 
-    def __init__(self, async_request: Callable[..., Awaitable[dict[str, Any]]]) -> None:
+    def __init__(
+        self,
+        async_request: Callable[..., Awaitable[dict[str, Any]]],
+        *,
+        async_get_search_preferences: Callable[[], Awaitable[Mapping[str, Any]]]
+        | None = None,
+        cache: CacheNamespace | None = None,
+        closing: asyncio.Event | None = None,
+        track_operation: Callable[[], AbstractContextManager[None]] = nullcontext,
+        concurrency_limiter: AdaptiveLimiter | None = None,
+    ) -> None:
         """Initialize.
 
         Args:
         ----
             async_request: The request method from the Client object.
+            async_get_search_preferences: An optional callable that returns the
+                user's search preferences (used to pick default sort orders).
+            cache: An optional cache namespace for bookmarks (keyed by ID).
+            closing: An optional event that is set once the client starts closing
+                (which stops watchers).
+            track_operation: An optional callable that returns a context in which a
+                bulk write counts as in flight (so that draining waits for it).
+            concurrency_limiter: The client's adaptive concurrency limiter (if any),
+                whose limit sets the default concurrency of bulk operations.
 
         """
+        self._cache = cache or CacheNamespace(MemoryCache(), "bookmarks")
+        self._async_get_search_preferences = async_get_search_preferences
         self._async_request = async_request
+        self._closing = closing or asyncio.Event()
+        self._concurrency_limiter = concurrency_limiter
+        self._track_operation = track_operation
+
+    def _bulk_concurrency(self, concurrency: int | None) -> int | Callable[[], int]:
+        """Return the concurrency of a bulk operation.
+
+        Args:
+        ----
+            concurrency: The concurrency requested by the caller (if any).
+
+        Returns:
+        -------
+            The requested concurrency, the (live) limit of the adaptive limiter if the
+            client has one, or the default bulk concurrency.
+
+        """
+        if concurrency is not None:
+            return concurrency
+        if (limiter := self._concurrency_limiter) is not None:
+            return lambda: limiter.limit
+        return DEFAULT_BULK_CONCURRENCY
+
+    async def _async_default_sort(self) -> str | None:
+        """Return the sort order of a single page when the caller doesn't provide one.
+
+        Returns
+        -------
+            A sort order (or None to use the server's default).
+
+        """
+        if self._async_get_search_preferences is None:
+            return None
+        preferences = await self._async_get_search_preferences()
+        return preferences.get("sort")
 
     async def _async_get_bookmarks(
         self,
@@ -28,6 +193,9 @@ class BookmarkManager:
         query: str | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        fields: Iterable[str] | None = None,
+        modified_since: str | None = None,
+        sort: str | None = None,
     ) -> dict[str, Any]:
         """Return all bookmarks.
 
@@ -37,6 +205,9 @@ class BookmarkManager:
             query: Return bookmarks matching a query string.
             limit: Limit the number of returned bookmarks.
             offset: The index at which to return results.
+            fields: An optional subset of bookmark fields to return.
+            modified_since: Only return bookmarks modified since an ISO 8601 datetime.
+            sort: The order in which to return bookmarks.
 
         Returns:
         -------
@@ -48,14 +219,24 @@ class BookmarkManager:
                 ("q", query),
                 ("limit", limit),
                 ("offset", offset),
+                ("modified_since", modified_since),
+                ("sort", sort),
             )
         )
 
-        endpoint = "/api/bookmarks/"
-        if archived:
-            endpoint += "archived/"
+        route = BOOKMARKS_ARCHIVED if archived else BOOKMARKS
+        data = await self._async_request("get", route.path(), params=params)
 
-        return await self._async_request("get", endpoint, params=params)
+        if fields is not None:
+            # linkding doesn't offer server-side field selection, so we project each
+            # result as soon as the page is decoded; this way, the full objects are
+            # never retained by the caller:
+            fields = tuple(fields)
+            data["results"] = [
+                project_fields(bookmark, fields) for bookmark in data["results"]
+            ]
+
+        return data
 
     async def async_archive(self, bookmark_id: int) -> None:
         """Archive a bookmark.
@@ -65,7 +246,10 @@ class BookmarkManager:
             bookmark_id: The ID of the bookmark to archive.
 
         """
-        await self._async_request("post", f"/api/bookmarks/{bookmark_id}/archive/")
+        await self._async_request(
+            "post", BOOKMARK_ARCHIVE.path(bookmark_id=bookmark_id)
+        )
+        await self._cache.async_invalidate(str(bookmark_id))
 
     async def async_delete(self, bookmark_id: int) -> None:
         """Delete a bookmark.
@@ -75,7 +259,8 @@ class BookmarkManager:
             bookmark_id: The ID of the bookmark to delete.
 
         """
-        await self._async_request("delete", f"/api/bookmarks/{bookmark_id}/")
+        await self._async_request("delete", BOOKMARK.path(bookmark_id=bookmark_id))
+        await self._cache.async_invalidate(str(bookmark_id))
 
     async def async_get_all(
         self,
@@ -83,6 +268,8 @@ class BookmarkManager:
         query: str | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        fields: Iterable[str] | None = None,
+        sort: str | None = None,
     ) -> dict[str, Any]:
         """Return all bookmarks.
 
@@ -91,13 +278,106 @@ class BookmarkManager:
             query: Return bookmarks matching a query string.
             limit: Limit the number of returned bookmarks.
             offset: The index at which to return results.
+            fields: An optional subset of bookmark fields to return.
+            sort: The order in which to return bookmarks.
 
         Returns:
         -------
             An API response payload.
 
         """
-        return await self._async_get_bookmarks(query=query, limit=limit, offset=offset)
+        if sort is None:
+            sort = await self._async_default_sort()
+        return await self._async_get_bookmarks(
+            query=query, limit=limit, offset=offset, fields=fields, sort=sort
+        )
+
+    async def async_iter_all(
+        self,
+        *,
+        archived: bool = False,
+        query: str | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        fields: Iterable[str] | None = None,
+        prefetch: bool = False,
+        modified_since: str | None = None,
+        sort: str | None = None,
+        offset: int = 0,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Iterate over every bookmark, transparently requesting page after page.
+
+        Args:
+        ----
+            archived: Iterate over archived bookmarks instead.
+            query: Return bookmarks matching a query string.
+            page_size: The number of bookmarks to request per page.
+            fields: An optional subset of bookmark fields to return.
+            prefetch: Request the next page while the current one is consumed.
+            modified_since: Only return bookmarks modified since an ISO 8601 datetime.
+            sort: The order in which to return bookmarks (defaults to "added_asc",
+                which keeps offsets stable).
+            offset: The index at which to start (e.g., to resume an iteration).
+
+        Yields:
+        ------
+            Individual bookmarks.
+
+        """
+        if fields is not None:
+            fields = tuple(fields)
+        if sort is None:
+            # Offset pagination is only stable if bookmarks created mid-scan land on
+            # the last page, whatever the server's (or the user's preferred) order:
+            sort = BookmarkSort.ADDED_ASC
+
+        async def fetch(offset: int) -> dict[str, Any]:
+            """Fetch the page at an offset (at bulk priority, unless one is set).
+
+            The priority is applied per page (rather than around this generator) so
+            that it never leaks into the consumer's context between pages.
+
+            Args:
+            ----
+                offset: The index at which to return results.
+
+            Returns:
+            -------
+                An API response payload.
+
+            """
+            with background_priority():
+                return await self._async_get_bookmarks(
+                    archived=archived,
+                    query=query,
+                    limit=page_size,
+                    offset=offset,
+                    fields=fields,
+                    modified_since=modified_since,
+                    sort=sort,
+                )
+
+        next_page: Awaitable[dict[str, Any]] | None = fetch(offset)
+
+        try:
+            while next_page is not None:
+                data = await next_page
+                results = data["results"]
+                next_page = None
+
+                if data.get("next") and results:
+                    offset += len(results)
+                    next_page = fetch(offset)
+                    if prefetch:
+                        # Request the next page while the caller consumes this one:
+                        next_page = asyncio.ensure_future(next_page)
+
+                for bookmark in results:
+                    yield bookmark
+        finally:
+            if isinstance(next_page, asyncio.Future):
+                next_page.cancel()
+            elif isinstance(next_page, Coroutine):
+                next_page.close()
 
     async def async_get_archived(
         self,
@@ -105,6 +385,8 @@ class BookmarkManager:
         query: str | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        fields: Iterable[str] | None = None,
+        sort: str | None = None,
     ) -> dict[str, Any]:
         """Return all archived bookmarks.
 
@@ -113,14 +395,23 @@ class BookmarkManager:
             query: Return bookmarks matching a query string.
             limit: Limit the number of returned bookmarks.
             offset: The index at which to return results.
+            fields: An optional subset of bookmark fields to return.
+            sort: The order in which to return bookmarks.
 
         Returns:
         -------
             An API response payload.
 
         """
+        if sort is None:
+            sort = await self._async_default_sort()
         return await self._async_get_bookmarks(
-            archived=True, query=query, limit=limit, offset=offset
+            archived=True,
+            query=query,
+            limit=limit,
+            offset=offset,
+            fields=fields,
+            sort=sort,
         )
 
     async def async_create(
@@ -166,21 +457,598 @@ class BookmarkManager:
             )
         )
 
-        return await self._async_request("post", "/api/bookmarks/", json=payload)
+        data = await self._async_request("post", BOOKMARKS.path(), json=payload)
+        if "id" in data:
+            await self._cache.async_set(str(data["id"]), data)
+        return data
+
+    async def async_create_many(
+        self,
+        bookmarks: Iterable[Mapping[str, Any]] | AsyncIterable[Mapping[str, Any]],
+        *,
+        concurrency: int | None = None,
+        progress: ProgressCallback | None = None,
+        checkpoint: Checkpoint | None = None,
+    ) -> Progress:
+        """Create many bookmarks with bounded concurrency.
+
+        Bookmarks are pulled from the iterable lazily, so it may be arbitrarily large.
+        If a checkpoint is provided, bookmarks created by a previous (interrupted) run
+        over the same iterable are skipped.
+
+        Args:
+        ----
+            bookmarks: Bookmark dicts (containing at least a "url" key).
+            concurrency: The maximum number of concurrent create requests (defaults to
+                the adaptive limit if the client has a limiter, otherwise 8).
+            progress: An optional callable that receives progress updates.
+            checkpoint: An optional checkpoint to resume from and save progress to.
+
+        Returns:
+        -------
+            The final progress of the operation.
+
+        """
+        checkpoint = checkpoint or Checkpoint(None)
+        reporter = ProgressReporter(progress)
+
+        async def pending_bookmarks() -> AsyncIterator[tuple[int, Mapping[str, Any]]]:
+            """Yield bookmarks that a previous run didn't create.
+
+            Yields
+            ------
+                (index, bookmark) tuples.
+
+            """
+            async for index, bookmark in aenumerate(bookmarks):
+                if checkpoint.is_done(index):
+                    reporter.advance(skipped=True)
+                    continue
+                yield index, bookmark
+
+        await self._async_create_many(
+            pending_bookmarks(), reporter, checkpoint, concurrency=concurrency
+        )
+        return reporter.finish()
+
+    @background
+    async def _async_create_many(
+        self,
+        bookmarks: AsyncIterable[tuple[int, Mapping[str, Any]]],
+        reporter: ProgressReporter,
+        checkpoint: Checkpoint,
+        *,
+        concurrency: int | None,
+    ) -> None:
+        """Create many bookmarks with bounded concurrency.
+
+        The checkpoint is saved if creation fails and cleared once it completes.
+
+        Args:
+        ----
+            bookmarks: (index, bookmark dict) tuples (each containing a "url" key).
+            reporter: The progress reporter to advance.
+            checkpoint: The checkpoint to mark created bookmarks in.
+            concurrency: The maximum number of concurrent create requests.
+
+        """
+
+        async def create(item: tuple[int, Mapping[str, Any]]) -> None:
+            """Create a single bookmark.
+
+            Args:
+            ----
+                item: The index of the bookmark and the bookmark dict.
+
+            """
+            index, bookmark = item
+            await self.async_create(
+                bookmark["url"],
+                **{key: bookmark[key] for key in CREATE_FIELDS if key in bookmark},
+            )
+            checkpoint.mark_done(index)
+            reporter.advance()
+
+        with self._track_operation():
+            try:
+                await async_run_bounded(
+                    bookmarks, create, concurrency=self._bulk_concurrency(concurrency)
+                )
+            except BaseException:
+                checkpoint.save()
+                raise
+            checkpoint.clear()
+
+    async def async_export(
+        self,
+        fp: IO[str],
+        *,
+        format: str = ExportFormat.NDJSON,  # noqa: A002
+        include_archived: bool = True,
+        query: str | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        progress: ProgressCallback | None = None,
+        checkpoint: Checkpoint | None = None,
+    ) -> Progress:
+        """Stream every bookmark to a text file while paginating.
+
+        Pages are prefetched while the previous one is written, and only one page is
+        held in memory at a time. If a checkpoint is provided, an interrupted export
+        resumes after the last bookmark it exported (the stream must be seekable, since
+        anything written after the last save is discarded).
+
+        Args:
+        ----
+            fp: A writable text stream.
+            format: The export format ("ndjson", "html", or "csv").
+            include_archived: Also export archived bookmarks.
+            query: Only export bookmarks matching a query string.
+            page_size: The number of bookmarks to request per page.
+            progress: An optional callable that receives progress updates.
+            checkpoint: An optional checkpoint to resume from and save progress to.
+
+        Returns:
+        -------
+            The final progress of the operation.
+
+        """
+        checkpoint = checkpoint or Checkpoint(None)
+        checkpoint.bind(fp)
+        writer = BookmarkWriter(fp, ExportFormat(format), resume=checkpoint.resumed)
+        reporter = ProgressReporter(progress)
+
+        # The number of bookmarks in each fully exported phase (so that a resumed
+        # export knows where the phase it was interrupted in begins):
+        completed: dict[str, int] = checkpoint.data.setdefault("completed", {})
+        index = 0
+
+        try:
+            for archived in (False, True) if include_archived else (False,):
+                phase = "archived" if archived else "active"
+                if phase in completed:
+                    index += completed[phase]
+                    continue
+
+                start = index
+                index = max(index, checkpoint.offset)
+                # Resume after the last exported bookmark rather than at a bare offset,
+                # starting a page early in case bookmarks before it were deleted:
+                exported = index - start
+                skip = min(exported, page_size) if exported else 0
+                async for bookmark in _aiter_unexported(
+                    self.async_iter_all(
+                        archived=archived,
+                        query=query,
+                        page_size=page_size,
+                        prefetch=True,
+                        offset=exported - skip,
+                    ),
+                    last_id=checkpoint.data.get("last_id"),
+                    skip=skip,
+                ):
+                    writer.write(bookmark)
+                    checkpoint.data["last_id"] = bookmark.get("id")
+                    checkpoint.mark_done(index)
+                    reporter.advance()
+                    index += 1
+                completed[phase] = index - start
+        except BaseException:
+            checkpoint.save()
+            raise
+
+        writer.close()
+        checkpoint.clear()
+        return reporter.finish()
+
+    async def async_find_duplicates(
+        self,
+        *,
+        include_archived: bool = True,
+        query: str | None = None,
+        title_distance: int | None = DEFAULT_TITLE_DISTANCE,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> list[DuplicateGroup]:
+        """Find groups of (likely) duplicate bookmarks.
+
+        The collection is streamed once: bookmarks are grouped by canonical URL (e.g.,
+        ignoring the scheme, "www.", tracking parameters, AMP variants, and trailing
+        slashes) and by SimHash buckets of their titles, so the work grows roughly
+        linearly with the collection rather than comparing every pair.
+
+        Args:
+        ----
+            include_archived: Also include archived bookmarks.
+            query: Only include bookmarks matching a query string.
+            title_distance: The maximum number of differing SimHash bits for two
+                titles to be considered duplicates (None only compares URLs).
+            page_size: The number of bookmarks to request per page.
+
+        Returns:
+        -------
+            DuplicateGroup objects (each with at least two bookmarks).
+
+        """
+        finder = DuplicateFinder(title_distance=title_distance)
+
+        for archived in (False, True) if include_archived else (False,):
+            async for bookmark in self.async_iter_all(
+                archived=archived,
+                query=query,
+                page_size=page_size,
+                fields=DEDUPE_FIELDS,
+                prefetch=True,
+            ):
+                finder.add(bookmark)
+
+        return finder.groups()
+
+    async def async_get_snapshot(
+        self,
+        *,
+        include_archived: bool = True,
+        query: str | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> BookmarkSnapshot:
+        """Load every bookmark into a compact, columnar snapshot for analytics.
+
+        Only the fields needed by the snapshot are kept from each page, and each page
+        is released once it has been appended.
+
+        Args:
+        ----
+            include_archived: Also include archived bookmarks.
+            query: Only include bookmarks matching a query string.
+            page_size: The number of bookmarks to request per page.
+
+        Returns:
+        -------
+            A BookmarkSnapshot object.
+
+        """
+        snapshot = BookmarkSnapshot()
+
+        for archived in (False, True) if include_archived else (False,):
+            async for bookmark in self.async_iter_all(
+                archived=archived,
+                query=query,
+                page_size=page_size,
+                fields=SNAPSHOT_FIELDS,
+                prefetch=True,
+            ):
+                snapshot.append(bookmark)
+
+        return snapshot
+
+    async def async_import(
+        self,
+        fp: IO[str],
+        *,
+        format: str = ExportFormat.NDJSON,  # noqa: A002
+        skip_existing: bool = True,
+        concurrency: int | None = None,
+        progress: ProgressCallback | None = None,
+        checkpoint: Checkpoint | None = None,
+    ) -> Progress:
+        """Incrementally parse a text file and create its bookmarks.
+
+        Bookmarks are deduplicated by URL (both within the file and, optionally,
+        against bookmarks that already exist); apart from the set of known URLs,
+        memory usage is constant. If a checkpoint is provided, rows handled by a
+        previous (interrupted) import of the same file are skipped.
+
+        Args:
+        ----
+            fp: A readable text stream.
+            format: The import format ("ndjson", "html", or "csv").
+            skip_existing: Skip URLs that already exist on the server.
+            concurrency: The maximum number of concurrent create requests (defaults to
+                the adaptive limit if the client has a limiter, otherwise 8).
+            progress: An optional callable that receives progress updates.
+            checkpoint: An optional checkpoint to resume from and save progress to.
+
+        Returns:
+        -------
+            The final progress of the operation.
+
+        """
+        checkpoint = checkpoint or Checkpoint(None)
+        known_urls: set[str] = set()
+        if skip_existing:
+            for archived in (False, True):
+                async for bookmark in self.async_iter_all(
+                    archived=archived, fields=("url",), prefetch=True
+                ):
+                    known_urls.add(bookmark["url"])
+
+        reporter = ProgressReporter(progress)
+
+        async def new_bookmarks() -> AsyncIterator[tuple[int, dict[str, Any]]]:
+            """Yield bookmarks from the file whose URLs aren't known yet.
+
+            Yields
+            ------
+                (index, bookmark dict) tuples.
+
+            """
+            for index, bookmark in enumerate(iter_bookmarks(fp, ExportFormat(format))):
+                url = bookmark.get("url")
+                if checkpoint.is_done(index):
+                    if url:
+                        known_urls.add(url)
+                    reporter.advance(skipped=True)
+                    continue
+                if not url or url in known_urls:
+                    checkpoint.mark_done(index)
+                    reporter.advance(skipped=True)
+                    continue
+                known_urls.add(url)
+                yield index, bookmark
+
+        await self._async_create_many(
+            new_bookmarks(), reporter, checkpoint, concurrency=concurrency
+        )
+        return reporter.finish()
+
+    async def async_get_many(
+        self,
+        bookmark_ids: Iterable[int],
+        *,
+        max_age: float = DEFAULT_BOOKMARK_CACHE_TTL,
+        concurrency: int | None = None,
+    ) -> BookmarkBatch:
+        """Return many bookmarks by ID.
+
+        Bookmarks that were fetched, created, or updated within the maximum age are
+        served from the cache. The API has no multi-ID filter, so each remaining ID
+        (after deduplication) costs a request of its own; up to ``concurrency`` of
+        them are in flight at once.
+
+        Args:
+        ----
+            bookmark_ids: The IDs of the bookmarks to get.
+            max_age: The maximum age (in seconds) of cached bookmarks (0 bypasses the
+                cache).
+            concurrency: The maximum number of concurrent requests (defaults to
+                the adaptive limit if the client has a limiter, otherwise 8).
+
+        Returns:
+        -------
+            A BookmarkBatch object (with bookmarks in the order of their IDs).
+
+        """
+        bookmark_ids = list(bookmark_ids)
+        found: dict[int, dict[str, Any]] = {}
+        to_fetch: list[int] = []
+
+        for bookmark_id in dict.fromkeys(bookmark_ids):
+            if (
+                bookmark := await self._cache.async_get(
+                    str(bookmark_id), max_age=max_age
+                )
+            ) is None:
+                to_fetch.append(bookmark_id)
+            else:
+                found[bookmark_id] = bookmark
+
+        async def fetch(bookmark_id: int) -> None:
+            """Fetch a single bookmark (if it exists).
+
+            Args:
+            ----
+                bookmark_id: The ID of the bookmark.
+
+            """
+            # Missing bookmarks are reported in the batch rather than raised:
+            with suppress(UnknownEndpointError):
+                found[bookmark_id] = await self.async_get_single(bookmark_id)
+
+        await async_run_bounded(
+            to_fetch, fetch, concurrency=self._bulk_concurrency(concurrency)
+        )
+
+        return BookmarkBatch(
+            bookmarks=[
+                found[bookmark_id]
+                for bookmark_id in bookmark_ids
+                if bookmark_id in found
+            ],
+            missing=[
+                bookmark_id
+                for bookmark_id in dict.fromkeys(bookmark_ids)
+                if bookmark_id not in found
+            ],
+        )
 
-    async def async_get_single(self, bookmark_id: int) -> dict[str, Any]:
+    async def async_get_single(
+        self, bookmark_id: int, *, fields: Iterable[str] | None = None
+    ) -> dict[str, Any]:
         """Return a single bookmark.
 
         Args:
         ----
             bookmark_id: The ID of the bookmark to get.
+            fields: An optional subset of bookmark fields to return.
 
         Returns:
         -------
             An API response payload.
 
         """
-        return await self._async_request("get", f"/api/bookmarks/{bookmark_id}/")
+        data = await self._async_request("get", BOOKMARK.path(bookmark_id=bookmark_id))
+        await self._cache.async_set(str(bookmark_id), data)
+
+        if fields is not None:
+            return project_fields(data, fields)
+        return data
+
+    @background
+    async def async_merge_duplicates(
+        self,
+        groups: Iterable[DuplicateGroup],
+        *,
+        keep: Callable[[list[dict[str, Any]]], dict[str, Any]] | None = None,
+        include_title_matches: bool = False,
+        concurrency: int | None = None,
+        progress: ProgressCallback | None = None,
+    ) -> Progress:
+        """Merge groups of duplicate bookmarks into a single bookmark each.
+
+        The kept bookmark receives the tags of every other bookmark in its group (and
+        is only patched if its tags change); the other bookmarks are then deleted.
+
+        Since similar titles don't make bookmarks identical, only bookmarks that share
+        a canonical URL are merged by default: each group is split by URL, and
+        bookmarks that were only grouped by title are left alone.
+
+        Args:
+        ----
+            groups: The groups to merge (e.g., from async_find_duplicates()).
+            keep: An optional callable that picks the bookmark to keep from a group
+                (by default, the oldest one).
+            include_title_matches: Also merge bookmarks that were only grouped
+                because of their titles (which deletes bookmarks with other URLs).
+            concurrency: The maximum number of groups to merge concurrently (defaults to
+                the adaptive limit if the client has a limiter, otherwise 8).
+            progress: An optional callable that receives progress updates (per
+                group).
+
+        Returns:
+        -------
+            The final progress of the operation.
+
+        """
+        reporter = ProgressReporter(progress)
+
+        async def merge(group: DuplicateGroup) -> None:
+            """Merge a single group.
+
+            Args:
+            ----
+                group: The group of duplicates.
+
+            """
+            if keep is None:
+                kept = min(group.bookmarks, key=lambda bookmark: bookmark["id"])
+            else:
+                kept = keep(group.bookmarks)
+            extras = [
+                bookmark for bookmark in group.bookmarks if bookmark["id"] != kept["id"]
+            ]
+
+            tag_names = retag(
+                kept["tag_names"],
+                add=[tag for bookmark in extras for tag in bookmark["tag_names"]],
+            )
+            if tag_names != kept["tag_names"]:
+                await self.async_update(kept["id"], tag_names=tag_names)
+            for bookmark in extras:
+                await self.async_delete(bookmark["id"])
+            reporter.advance()
+
+        if not include_title_matches:
+            groups = [url_group for group in groups for url_group in group.url_groups()]
+
+        with self._track_operation():
+            await async_run_bounded(
+                groups, merge, concurrency=self._bulk_concurrency(concurrency)
+            )
+        return reporter.finish()
+
+    @background
+    async def async_retag(
+        self,
+        query_or_ids: str | Iterable[int],
+        *,
+        add: Iterable[str] = (),
+        remove: Iterable[str] = (),
+        rename: Mapping[str, str] | None = None,
+        include_archived: bool = True,
+        concurrency: int | None = None,
+        progress: ProgressCallback | None = None,
+    ) -> Progress:
+        """Add, remove, and/or rename tags across many bookmarks.
+
+        Only bookmarks whose tags actually change are patched, and each patch only
+        contains the tag_names field (so no other field is touched).
+
+        Args:
+        ----
+            query_or_ids: A query string that matches bookmarks or a list of IDs.
+            add: Tag names to add.
+            remove: Tag names to remove.
+            rename: A mapping of old tag names to new tag names.
+            include_archived: When using a query, also retag archived bookmarks.
+            concurrency: The maximum number of concurrent requests (defaults to
+                the adaptive limit if the client has a limiter, otherwise 8).
+            progress: An optional callable that receives progress updates.
+
+        Returns:
+        -------
+            The final progress of the operation (unchanged bookmarks are skipped).
+
+        """
+        add = tuple(add)
+        remove = tuple(remove)
+        reporter = ProgressReporter(progress)
+
+        async def apply(bookmark: dict[str, Any]) -> None:
+            """Patch a single bookmark's tags (if they change).
+
+            Args:
+            ----
+                bookmark: The bookmark (containing at least its ID and tag names).
+
+            """
+            tag_names = retag(
+                bookmark["tag_names"], add=add, remove=remove, rename=rename
+            )
+            if tag_names == bookmark["tag_names"]:
+                reporter.advance(skipped=True)
+                return
+            await self.async_update(bookmark["id"], tag_names=tag_names)
+            reporter.advance()
+
+        if isinstance(query_or_ids, str):
+            # Retagging may remove bookmarks from the query's results (e.g., when
+            # renaming a tag that is part of the query), which would shift the
+            # offsets of later pages; so, the (compact) matches are collected
+            # before any of them are patched:
+            matches = [
+                bookmark
+                for archived in ((False, True) if include_archived else (False,))
+                async for bookmark in self.async_iter_all(
+                    archived=archived,
+                    query=query_or_ids,
+                    fields=("id", "tag_names"),
+                    prefetch=True,
+                )
+            ]
+            with self._track_operation():
+                await async_run_bounded(
+                    matches, apply, concurrency=self._bulk_concurrency(concurrency)
+                )
+        else:
+
+            async def fetch_and_apply(bookmark_id: int) -> None:
+                """Fetch a single bookmark's tags and patch them (if they change).
+
+                Args:
+                ----
+                    bookmark_id: The ID of the bookmark.
+
+                """
+                await apply(
+                    await self.async_get_single(bookmark_id, fields=("id", "tag_names"))
+                )
+
+            with self._track_operation():
+                await async_run_bounded(
+                    query_or_ids,
+                    fetch_and_apply,
+                    concurrency=self._bulk_concurrency(concurrency),
+                )
+
+        return reporter.finish()
 
     async def async_unarchive(self, bookmark_id: int) -> None:
         """Unarchive a bookmark.
@@ -190,22 +1058,30 @@ class BookmarkManager:
             bookmark_id: The ID of the bookmark to unarchive.
 
         """
-        await self._async_request("post", f"/api/bookmarks/{bookmark_id}/unarchive/")
+        await self._async_request(
+            "post", BOOKMARK_UNARCHIVE.path(bookmark_id=bookmark_id)
+        )
+        await self._cache.async_invalidate(str(bookmark_id))
 
     async def async_update(
         self,
         bookmark_id: int,
         *,
-        url: str | None = None,
-        title: str | None = None,
-        description: str | None = None,
-        notes: str | None = None,
-        tag_names: list[str] | None = None,
-        unread: bool = False,
-        shared: bool = False,
+        url: str | None | UnsetType = UNSET,
+        title: str | None | UnsetType = UNSET,
+        description: str | None | UnsetType = UNSET,
+        notes: str | None | UnsetType = UNSET,
+        tag_names: list[str] | None | UnsetType = UNSET,
+        unread: bool | UnsetType = UNSET,
+        shared: bool | UnsetType = UNSET,
+        previous: Mapping[str, Any] | None = None,
     ) -> dict[str, Any]:
         """Update an existing bookmark.
 
+        Only the provided fields are sent; if a known previous state of the bookmark
+        is provided, fields that wouldn't change are dropped as well (and if nothing
+        would change, no request is made at all).
+
         Args:
         ----
             bookmark_id: The ID of the bookmark to update.
@@ -214,12 +1090,13 @@ class BookmarkManager:
             description: The bookmark description.
             notes: Any Markdown-formatted notes.
             tag_names: A list of strings to use as tags.
-            unread: Immediately mark the bookmark as unread.
-            shared: Immediately mark the bookmark as shared.
+            unread: Mark the bookmark as unread (or not).
+            shared: Mark the bookmark as shared (or not).
+            previous: An optional, known previous state of the bookmark.
 
         Returns:
         -------
-            An API response payload.
+            An API response payload (or the previous state if nothing would change).
 
         """
         payload = generate_api_payload(
@@ -234,6 +1111,56 @@ class BookmarkManager:
             )
         )
 
-        return await self._async_request(
-            "patch", f"/api/bookmarks/{bookmark_id}/", json=payload
+        if previous is not None and not (payload := diff_payload(payload, previous)):
+            return dict(previous)
+
+        data = await self._async_request(
+            "patch", BOOKMARK.path(bookmark_id=bookmark_id), json=payload
         )
+        await self._cache.async_set(str(bookmark_id), data)
+        return data
+
+    async def async_watch(
+        self,
+        *,
+        min_interval: float = DEFAULT_MIN_INTERVAL,
+        max_interval: float = DEFAULT_MAX_INTERVAL,
+        backoff: float = DEFAULT_BACKOFF,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> AsyncIterator[BookmarkEvent]:
+        """Watch for bookmark changes, yielding an event for each one.
+
+        The polling interval tightens to the minimum as soon as changes are seen and
+        grows by the backoff factor (up to the maximum) after every idle poll. Watching
+        stops (without an error) once the client starts closing, even mid-sleep.
+
+        Args:
+        ----
+            min_interval: The polling interval (in seconds) during activity.
+            max_interval: The longest polling interval (in seconds) when idle.
+            backoff: The factor by which the interval grows after an idle poll.
+            page_size: The number of bookmarks to request per page.
+
+        Yields:
+        ------
+            BookmarkEvent objects.
+
+        """
+        watcher = BookmarkWatcher(
+            self,
+            min_interval=min_interval,
+            max_interval=max_interval,
+            backoff=backoff,
+            page_size=page_size,
+        )
+        with suppress(ClientClosedError):
+            await watcher.async_snapshot()
+
+            while True:
+                # Sleep until the next poll, unless the client starts closing first:
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(self._closing.wait(), watcher.interval)
+                if self._closing.is_set():
+                    return
+                for event in await watcher.async_poll():
+                    yield event
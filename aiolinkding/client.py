@@ -2,25 +2,70 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Iterator, Mapping
+from concurrent.futures import Executor
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
 from http import HTTPStatus
-from typing import Any
-
-from aiohttp import ClientSession, ClientTimeout
-from aiohttp.client_exceptions import ClientResponseError
+import json
+import logging
+from typing import Any, Self, cast
+
+from aiohttp import ClientResponse, ClientSession, ClientTimeout
+from aiohttp.client_exceptions import (
+    ClientConnectionError,
+    ClientError,
+    ContentTypeError,
+)
 from packaging import version
+from yarl import URL
 
 from aiolinkding.bookmark import BookmarkManager
 from aiolinkding.const import LOGGER
+from aiolinkding.endpoints import HEALTH, resolve_route
 from aiolinkding.errors import (
+    CircuitOpenError,
+    ClientClosedError,
+    ConnectionFailedError,
+    DeadlineExceededError,
     InvalidServerVersionError,
     InvalidTokenError,
+    LinkDingError,
+    RateLimitedError,
     RequestError,
+    RequestTimeoutError,
+    ServerError,
     UnknownEndpointError,
+    ValidationError,
 )
 from aiolinkding.tag import TagManager
-from aiolinkding.user import UserManager
+from aiolinkding.user import DEFAULT_PROFILE_TTL, UserManager
+from aiolinkding.util.cache import (
+    CacheBackend,
+    CacheNamespace,
+    MemoryCache,
+    cache_scope,
+)
+from aiolinkding.util.circuit import CircuitBreaker, CircuitState
+from aiolinkding.util.deadline import remaining_time
+from aiolinkding.util.limiter import AdaptiveLimiter
+from aiolinkding.util.priority import PriorityScheduler
+from aiolinkding.util.replay import Transport, TransportResponse
 
+DEFAULT_DRAIN_TIMEOUT = 30.0
 DEFAULT_REQUEST_TIMEOUT = 10
+DEFAULT_WARMUP_CONNECTIONS = 4
+
+# The maximum number of endpoint URLs cached per client (endpoints that contain IDs
+# are unbounded, so the cache is simply reset once it fills up):
+ENDPOINT_URL_CACHE_SIZE = 1024
+
+# Accessing an HTTPStatus member goes through an enum descriptor (which costs more than
+# the comparison itself), so the statuses checked on every response are plain ints:
+STATUS_BAD_REQUEST = int(HTTPStatus.BAD_REQUEST)
+STATUS_TOO_MANY_REQUESTS = int(HTTPStatus.TOO_MANY_REQUESTS)
 
 SERVER_VERSION_HEALTH_CHECK_INTRODUCED = version.parse("1.17.0")
 SERVER_VERSION_MINIMUM_REQUIRED = version.parse("1.22.0")
@@ -35,7 +80,24 @@ class Client:  # pylint: disable=too-few-public-methods
     """Define a client for the linkding API."""
 
     def __init__(
-        self, url: str, token: str, *, session: ClientSession | None = None
+        self,
+        url: str,
+        token: str,
+        *,
+        session: ClientSession | None = None,
+        max_concurrent_requests: int | None = None,
+        concurrency_limiter: AdaptiveLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        request_timeout: ClientTimeout | None = None,
+        method_timeouts: Mapping[str, ClientTimeout] | None = None,
+        scheduler: PriorityScheduler | None = None,
+        transport: Transport | None = None,
+        profile_ttl: float = DEFAULT_PROFILE_TTL,
+        use_profile_defaults: bool = False,
+        log_payloads: bool = True,
+        cache: CacheBackend | None = None,
+        decode_offload_threshold: int | None = None,
+        decode_executor: Executor | None = None,
     ) -> None:
         """Initialize.
 
@@ -44,15 +106,228 @@ class Client:  # pylint: disable=too-few-public-methods
             url: The full URL to a linkding instance.
             token: A linkding API token.
             session: An optional aiohttp ClientSession.
+            max_concurrent_requests: An optional cap on in-flight requests.
+            concurrency_limiter: An optional adaptive concurrency limiter.
+            circuit_breaker: An optional circuit breaker.
+            request_timeout: An optional timeout for every request.
+            method_timeouts: Optional timeouts per HTTP method (e.g., "get").
+            scheduler: An optional priority scheduler.
+            transport: An optional transport that replaces the session (e.g., to
+                record or replay traffic).
+            profile_ttl: The number of seconds for which the user profile is cached.
+            use_profile_defaults: Pick default bookmark sort orders from the user's
+                (cached) search preferences.
+            log_payloads: Include response payloads in debug logs.
+            cache: An optional cache backend for bookmarks, tags, and the user
+                profile (e.g., a SharedCache used by every worker process).
+            decode_offload_threshold: Decode response bodies of at least this many
+                bytes in an executor (rather than on the event loop).
+            decode_executor: The executor for large bodies (defaults to the event
+                loop's default thread pool).
 
         """
+        self._base_headers = {"Authorization": f"Token {token}"}
+        self._circuit_breaker = circuit_breaker
+        self._decode_executor = decode_executor
+        self._decode_offload_threshold = decode_offload_threshold
+        self._method_timeouts = {
+            method.lower(): timeout
+            for method, timeout in (method_timeouts or {}).items()
+        }
+        self._request_timeout = request_timeout
+        self._scheduler = scheduler
+        self._transport = transport
+        self._concurrency_limiter = concurrency_limiter
+        self._max_concurrent_requests = max_concurrent_requests
+        self._request_semaphore: asyncio.Semaphore | None = None
+        if max_concurrent_requests is not None:
+            self._request_semaphore = asyncio.Semaphore(max_concurrent_requests)
+
+        self._closing = asyncio.Event()
+        self._endpoint_urls: dict[str, URL] = {}
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._in_flight = 0
+        self._log_payloads = log_payloads
+        self._owned_sessions: set[ClientSession] = set()
         self._session = session
-        self._token = token
+        self._unguarded = (
+            circuit_breaker is None
+            and concurrency_limiter is None
+            and max_concurrent_requests is None
+            and scheduler is None
+        )
         self._url = url
 
-        self.bookmarks = BookmarkManager(self.async_request)
-        self.tags = TagManager(self.async_request)
-        self.user = UserManager(self.async_request)
+        cache = cache or MemoryCache()
+        scope = cache_scope(url, token)
+
+        self.user = UserManager(
+            self.async_request,
+            profile_ttl=profile_ttl,
+            cache=CacheNamespace(cache, f"{scope}/user"),
+        )
+        self.bookmarks = BookmarkManager(
+            self.async_request,
+            async_get_search_preferences=(
+                self.user.async_get_search_preferences if use_profile_defaults else None
+            ),
+            cache=CacheNamespace(cache, f"{scope}/bookmarks"),
+            closing=self._closing,
+            track_operation=self._track_in_flight,
+            concurrency_limiter=concurrency_limiter,
+        )
+        self.tags = TagManager(
+            self.async_request, cache=CacheNamespace(cache, f"{scope}/tags")
+        )
+
+    async def __aenter__(self) -> Self:
+        """Enter the context manager.
+
+        Returns
+        -------
+            This client.
+
+        """
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Exit the context manager (draining and closing the client).
+
+        Args:
+        ----
+            *exc_info: Exception info (if any).
+
+        """
+        await self.async_close()
+
+    @property
+    def closed(self) -> bool:
+        """Return whether the client has stopped accepting requests.
+
+        Returns
+        -------
+            Whether the client is draining or closed.
+
+        """
+        return self._closing.is_set()
+
+    @property
+    def concurrency_limit(self) -> int | None:
+        """Return the current in-flight request limit (if any).
+
+        Returns
+        -------
+            The adaptive limit if a limiter is in use, otherwise the static cap.
+
+        """
+        if self._concurrency_limiter is not None:
+            return self._concurrency_limiter.limit
+        return self._max_concurrent_requests
+
+    async def async_warmup(
+        self, *, connections: int = DEFAULT_WARMUP_CONNECTIONS
+    ) -> int:
+        """Pre-open keep-alive connections to the server.
+
+        This sends concurrent, lightweight health checks so that DNS resolution and
+        TCP/TLS handshakes are paid up front (rather than by the first real requests).
+        Warm-up is only meaningful with a persistent session; failed health checks
+        are logged and otherwise ignored. The health checks count as in-flight
+        requests, so a drain waits for them.
+
+        Args:
+        ----
+            connections: The number of connections to open.
+
+        Returns:
+        -------
+            The number of health checks that succeeded.
+
+        Raises:
+        ------
+            ClientClosedError: Raised when the client is draining or closed.
+
+        """
+        if self.closed:
+            msg = "The client has been closed (while warming up)"
+            raise ClientClosedError(msg)
+
+        if self._session is None or self._session.closed:
+            LOGGER.debug("Skipping warm-up: no persistent session to keep connections")
+            return 0
+
+        with self._track_in_flight():
+            results = await asyncio.gather(
+                *(self._async_send("get", HEALTH.path()) for _ in range(connections)),
+                return_exceptions=True,
+            )
+
+        warmed = 0
+        for result in results:
+            if isinstance(result, Exception):
+                LOGGER.debug("Warm-up request failed: %s", result)
+            else:
+                warmed += 1
+        return warmed
+
+    async def async_close(
+        self,
+        timeout: float | None = DEFAULT_DRAIN_TIMEOUT,  # noqa: ASYNC109
+    ) -> bool:
+        """Drain the client, then close the sessions it opened itself.
+
+        Without a session, the client opens one per request; any that are still open
+        once the drain ends (i.e., those of requests that outlived the timeout) are
+        closed, which aborts their requests. A session (or transport) passed to the
+        client belongs to the caller, so it is left open; it is safe to close once
+        this returns.
+
+        Args:
+        ----
+            timeout: The maximum number of seconds to wait (None waits forever).
+
+        Returns:
+        -------
+            Whether every in-flight request finished in time.
+
+        """
+        drained = await self.async_drain(timeout)
+        await asyncio.gather(*(session.close() for session in self._owned_sessions))
+        return drained
+
+    async def async_drain(
+        self,
+        timeout: float | None = DEFAULT_DRAIN_TIMEOUT,  # noqa: ASYNC109
+    ) -> bool:
+        """Stop accepting requests and wait for in-flight ones to finish.
+
+        Once draining starts, new requests raise ClientClosedError. Bulk writes stop
+        taking new items, let their running requests finish, and save their
+        checkpoint (if they have one); they count as in flight until then. Watchers
+        are woken up from their sleep and stop.
+
+        Args:
+        ----
+            timeout: The maximum number of seconds to wait (None waits forever).
+
+        Returns:
+        -------
+            Whether every in-flight request finished in time.
+
+        """
+        self._closing.set()
+
+        try:
+            async with asyncio.timeout(timeout):
+                await self._idle.wait()
+        except TimeoutError:
+            LOGGER.warning(
+                "Timed out waiting for %s in-flight request(s)/operation(s) to finish",
+                self._in_flight,
+            )
+            return False
+        return True
 
     async def async_request(
         self, method: str, endpoint: str, **kwargs: dict[str, Any]
@@ -71,56 +346,589 @@ class Client:  # pylint: disable=too-few-public-methods
 
         Raises:
         ------
+            ClientClosedError: Raised when the client is draining or closed.
+            DeadlineExceededError: Raised when the current deadline expires.
             InvalidTokenError: Raised upon an invalid API token.
             RequestError: Raised upon an underlying HTTP error.
             UnknownEndpointError: Raised when requesting an unknown API endpoint.
 
         """
-        kwargs.setdefault("headers", {})
-        kwargs["headers"]["Authorization"] = f"Token {self._token}"
+        if self._closing.is_set():
+            msg = f"The client has been closed (while requesting {endpoint})"
+            raise ClientClosedError(msg)
+
+        # The in-flight count is tracked inline (rather than via _track_in_flight),
+        # since this runs for every request:
+        self._in_flight += 1
+        self._idle.clear()
+        try:
+            if self._unguarded and remaining_time() is None:
+                # Without a deadline, circuit breaker, scheduler, or concurrency cap,
+                # none of the intermediate layers would do anything:
+                return await self._async_send(method, endpoint, **kwargs)
+            return await self._async_request_within_deadline(method, endpoint, **kwargs)
+        finally:
+            self._in_flight -= 1
+            if not self._in_flight:
+                self._idle.set()
+
+    @contextmanager
+    def _track_in_flight(self) -> Iterator[None]:
+        """Count a request (or bulk operation) as in flight while the context is open.
+
+        Yields
+        ------
+            Nothing.
+
+        """
+        self._in_flight += 1
+        self._idle.clear()
+        try:
+            yield
+        finally:
+            self._in_flight -= 1
+            if not self._in_flight:
+                self._idle.set()
+
+    async def _async_request_within_deadline(
+        self, method: str, endpoint: str, **kwargs: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Make an API request bounded by the current deadline (if any).
+
+        Args:
+        ----
+            method: An HTTP method.
+            endpoint: A relative API endpoint.
+            **kwargs: Additional kwargs to send with the request.
+
+        Returns:
+        -------
+            An API response payload.
+
+        Raises:
+        ------
+            DeadlineExceededError: Raised when the current deadline expires.
+
+        """
+        if (remaining := remaining_time()) is None:
+            return await self._async_request_guarded(method, endpoint, **kwargs)
+
+        msg = f"Deadline exceeded while requesting {endpoint}"
+        if remaining <= 0:
+            raise DeadlineExceededError(msg)
+
+        try:
+            async with asyncio.timeout(remaining) as deadline_timeout:
+                return await self._async_request_guarded(method, endpoint, **kwargs)
+        except TimeoutError as err:
+            if deadline_timeout.expired():
+                raise DeadlineExceededError(msg) from err
+            raise
+
+    async def _async_request_guarded(
+        self, method: str, endpoint: str, **kwargs: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Make an API request guarded by the circuit breaker (if any).
+
+        Args:
+        ----
+            method: An HTTP method.
+            endpoint: A relative API endpoint.
+            **kwargs: Additional kwargs to send with the request.
+
+        Returns:
+        -------
+            An API response payload.
+
+        """
+        if (breaker := self._circuit_breaker) is None:
+            return await self._async_request_scheduled(method, endpoint, **kwargs)
+
+        if breaker.state is not CircuitState.CLOSED:
+            await self._async_probe_circuit(breaker, endpoint)
+
+        try:
+            data = await self._async_request_scheduled(method, endpoint, **kwargs)
+        except (RequestError, TimeoutError) as err:
+            if _is_server_failure(err):
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+            raise
+
+        breaker.record_success()
+        return data
+
+    async def _async_probe_circuit(
+        self, breaker: CircuitBreaker, endpoint: str
+    ) -> None:
+        """Probe the server's health if a non-closed circuit allows it.
+
+        Args:
+        ----
+            breaker: The circuit breaker.
+            endpoint: The endpoint of the request that is waiting on the circuit.
+
+        Raises:
+        ------
+            CircuitOpenError: Raised when the circuit doesn't allow the request.
+
+        """
+        if breaker.try_begin_probe():
+            try:
+                await self._async_send("get", HEALTH.path())
+            except (RequestError, TimeoutError):
+                breaker.record_failure()
+            except BaseException:
+                # A cancelled probe (e.g., by an expiring deadline) says nothing about
+                # the server's health, but must not hold the single probe slot:
+                breaker.abandon_probe()
+                raise
+            else:
+                breaker.record_success()
+                return
+
+        msg = (
+            f"Circuit is open; refusing to request {endpoint} "
+            f"(retry in {breaker.retry_after:.1f}s)"
+        )
+        raise CircuitOpenError(msg)
+
+    async def _async_request_scheduled(
+        self, method: str, endpoint: str, **kwargs: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Make an API request once the priority scheduler (if any) allows it.
+
+        Args:
+        ----
+            method: An HTTP method.
+            endpoint: A relative API endpoint.
+            **kwargs: Additional kwargs to send with the request.
+
+        Returns:
+        -------
+            An API response payload.
+
+        """
+        if self._scheduler is None:
+            return await self._async_request_limited(method, endpoint, **kwargs)
+
+        async with self._scheduler.slot():
+            return await self._async_request_limited(method, endpoint, **kwargs)
+
+    async def _async_request_limited(
+        self, method: str, endpoint: str, **kwargs: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Make an API request under the configured concurrency caps.
+
+        Args:
+        ----
+            method: An HTTP method.
+            endpoint: A relative API endpoint.
+            **kwargs: Additional kwargs to send with the request.
+
+        Returns:
+        -------
+            An API response payload.
+
+        """
+        if self._request_semaphore is None:
+            return await self._async_send_limited(method, endpoint, **kwargs)
+
+        async with self._request_semaphore:
+            return await self._async_send_limited(method, endpoint, **kwargs)
+
+    async def _async_send_limited(
+        self, method: str, endpoint: str, **kwargs: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Send an API request under the adaptive concurrency limiter (if any).
+
+        Args:
+        ----
+            method: An HTTP method.
+            endpoint: A relative API endpoint.
+            **kwargs: Additional kwargs to send with the request.
+
+        Returns:
+        -------
+            An API response payload.
+
+        """
+        if self._concurrency_limiter is None:
+            return await self._async_send(method, endpoint, **kwargs)
+
+        async with self._concurrency_limiter.slot() as slot:
+            try:
+                return await self._async_send(method, endpoint, **kwargs)
+            except (RequestError, TimeoutError) as err:
+                slot.overloaded = _is_overload_error(err)
+                raise
+
+    async def _async_send(
+        self,
+        method: str,
+        endpoint: str,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> dict[str, Any]:
+        """Send an API request over HTTP.
+
+        Args:
+        ----
+            method: An HTTP method.
+            endpoint: A relative API endpoint.
+            **kwargs: Additional kwargs to send with the request.
+
+        Returns:
+        -------
+            An API response payload.
+
+        Raises:
+        ------
+            ConnectionFailedError: Raised when the server can't be reached.
+            InvalidTokenError: Raised upon an invalid API token.
+            RequestError: Raised upon an underlying HTTP error (see its subclasses).
+            RequestTimeoutError: Raised when the request times out.
+            UnknownEndpointError: Raised when requesting an unknown API endpoint.
+
+        """
+        self._prepare_request_kwargs(method, kwargs)
 
-        if use_running_session := self._session and not self._session.closed:
+        owned_session: ClientSession | None = None
+        session: Transport
+        if self._transport is not None:
+            session = self._transport
+        elif self._session and not self._session.closed:
             session = self._session
         else:
-            session = ClientSession(
+            session = owned_session = ClientSession(
                 timeout=ClientTimeout(total=DEFAULT_REQUEST_TIMEOUT)
             )
+            self._owned_sessions.add(owned_session)
 
-        data: dict[str, Any] = {}
+        retry_after: str | None = None
 
         try:
             async with session.request(
-                method, f"{self._url}{endpoint}", **kwargs
+                method, self._endpoint_url(endpoint), **kwargs
             ) as resp:
-                data = await resp.json()
-                resp.raise_for_status()
-        except ClientResponseError as err:
-            if resp.status == HTTPStatus.NO_CONTENT:
-                # An HTTP 204 will not return parsable JSON data, but it's still a
-                # successful response, so we swallow the exception and return:
-                return {}
-            if resp.status == HTTPStatus.UNAUTHORIZED:
-                msg = "Invalid API token"
-                raise InvalidTokenError(msg) from err
-            if resp.status == HTTPStatus.NOT_FOUND:
-                # We break out this particular response for the health check; if we
-                # catch this when querying GET /health, we can raise a better final
-                # exception than what would normally occur:
-                msg = f"Unknown API endpoint: {endpoint}"
-                raise UnknownEndpointError(msg) from err
-            msg = f"Error while requesting {endpoint}: {data}"
-            raise RequestError(msg) from err
+                status = resp.status
+                if status == STATUS_TOO_MANY_REQUESTS:
+                    retry_after = resp.headers.get("Retry-After")
+                data = await self._async_read_body(resp)
+        except TimeoutError as err:
+            msg = f"Timed out while requesting {endpoint}"
+            raise RequestTimeoutError(msg, route=_route_template(endpoint)) from err
+        except ClientConnectionError as err:
+            msg = f"Connection failed while requesting {endpoint}: {err}"
+            raise ConnectionFailedError(msg, route=_route_template(endpoint)) from err
+        except ClientError as err:
+            msg = f"Error while requesting {endpoint}: {err}"
+            raise RequestError(msg, route=_route_template(endpoint)) from err
         finally:
-            if not use_running_session:
-                await session.close()
+            if owned_session is not None:
+                self._owned_sessions.discard(owned_session)
+                await owned_session.close()
+
+        data = _checked_payload(endpoint, status, data, retry_after)
 
-        LOGGER.debug("Data received for %s: %s", endpoint, data)
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            self._log_response(endpoint, data)
 
         return data
 
+    async def _async_read_body(self, resp: TransportResponse) -> Any:  # noqa: ANN401
+        """Return a response's decoded JSON body.
+
+        Args:
+        ----
+            resp: The response (from the session or a custom transport).
+
+        Returns:
+        -------
+            The decoded body (or None if the body isn't JSON).
+
+        """
+        try:
+            if (
+                isinstance(resp, ClientResponse)
+                and (threshold := self._decode_offload_threshold) is not None
+            ):
+                return await self._async_decode_json(resp, threshold)
+            return await resp.json()
+        except (ContentTypeError, ValueError):
+            # The body isn't JSON (e.g., an HTTP 204 or an HTML error page):
+            return None
+
+    async def _async_decode_json(self, resp: ClientResponse, threshold: int) -> Any:  # noqa: ANN401
+        """Decode a JSON response body, offloading large bodies to an executor.
+
+        Decoding a multi-megabyte page can block the event loop for hundreds of
+        milliseconds; above the threshold, the raw bytes are handed to the executor
+        (without being copied, for a thread pool) and decoded there.
+
+        Args:
+        ----
+            resp: The response.
+            threshold: The body size (in bytes) from which decoding is offloaded.
+
+        Returns:
+        -------
+            The decoded body.
+
+        """
+        if (
+            resp.content_length is not None and resp.content_length < threshold
+        ) or resp.content_type != "application/json":
+            # Small bodies aren't worth the handoff (and aiohttp raises the usual
+            # error for bodies that aren't JSON):
+            return await resp.json()
+
+        body = await resp.read()
+        if len(body) < threshold:
+            # aiohttp reuses the body that was already read:
+            return await resp.json()
+
+        return await asyncio.get_running_loop().run_in_executor(
+            self._decode_executor, json.loads, body
+        )
+
+    def _log_response(self, endpoint: str, data: dict[str, Any]) -> None:
+        """Log a received response.
+
+        Args:
+        ----
+            endpoint: A relative API endpoint.
+            data: The response payload.
+
+        """
+        if self._log_payloads:
+            LOGGER.debug("Data received for %s: %s", endpoint, data)
+        else:
+            LOGGER.debug("Data received for %s", endpoint)
+
+    def _prepare_request_kwargs(self, method: str, kwargs: dict[str, Any]) -> None:
+        """Add the authorization header and timeout to a request's kwargs.
+
+        Args:
+        ----
+            method: An HTTP method.
+            kwargs: The kwargs to send with the request (modified in place).
+
+        """
+        if "headers" in kwargs:
+            kwargs["headers"] = {**kwargs["headers"], **self._base_headers}
+        else:
+            # aiohttp copies the headers it's given, so the base headers can be shared
+            # by every request:
+            kwargs["headers"] = self._base_headers
+
+        if "timeout" not in kwargs and (
+            timeout := (
+                self._method_timeouts.get(method.lower(), self._request_timeout)
+                if self._method_timeouts
+                else self._request_timeout
+            )
+        ):
+            kwargs["timeout"] = timeout
+
+    def _endpoint_url(self, endpoint: str) -> URL:
+        """Return the (cached) full URL of an API endpoint.
+
+        Args:
+        ----
+            endpoint: A relative API endpoint.
+
+        Returns:
+        -------
+            The full URL.
+
+        """
+        if (url := self._endpoint_urls.get(endpoint)) is None:
+            if len(self._endpoint_urls) >= ENDPOINT_URL_CACHE_SIZE:
+                self._endpoint_urls.clear()
+            # Endpoints may carry a query string, so they're appended rather than
+            # joined as a path (which would percent-encode the "?"):
+            url = self._endpoint_urls[endpoint] = URL(f"{self._url}{endpoint}")
+        return url
+
+
+def _checked_payload(
+    endpoint: str,
+    status: int,
+    payload: Any,  # noqa: ANN401
+    retry_after: str | None,
+) -> dict[str, Any]:
+    """Return the payload of a successful response (or raise the appropriate error).
+
+    Args:
+    ----
+        endpoint: A relative API endpoint.
+        status: The HTTP status of the response.
+        payload: The decoded response body (None if it wasn't JSON).
+        retry_after: The response's Retry-After header (if any).
+
+    Returns:
+    -------
+        An API response payload.
+
+    Raises:
+    ------
+        RequestError: Raised upon an unsuccessful or non-JSON response.
+
+    """
+    if status >= STATUS_BAD_REQUEST:
+        raise _error_from_response(endpoint, status, payload, retry_after)
+
+    if payload is None:
+        if status == HTTPStatus.NO_CONTENT:
+            # An HTTP 204 has no body, but it's still a successful response:
+            return {}
+        msg = f"Unexpected non-JSON response from {endpoint} (HTTP {status})"
+        raise RequestError(msg, status=status, route=_route_template(endpoint))
+
+    return cast(dict[str, Any], payload)
+
+
+def _error_from_response(
+    endpoint: str,
+    status: int,
+    payload: Any,  # noqa: ANN401
+    retry_after: str | None,
+) -> LinkDingError:
+    """Return the error that corresponds to an unsuccessful response.
+
+    Args:
+    ----
+        endpoint: A relative API endpoint.
+        status: The HTTP status of the response.
+        payload: The decoded response body (None if it wasn't JSON).
+        retry_after: The response's Retry-After header (if any).
+
+    Returns:
+    -------
+        An error.
+
+    """
+    if status == HTTPStatus.UNAUTHORIZED:
+        return InvalidTokenError("Invalid API token")
+
+    details: dict[str, Any] = {
+        "status": status,
+        "route": _route_template(endpoint),
+        "payload": payload,
+    }
+
+    if status == HTTPStatus.NOT_FOUND:
+        # We break out this particular response for the health check; if we catch
+        # this when querying GET /health, we can raise a better final exception than
+        # what would normally occur:
+        return UnknownEndpointError(f"Unknown API endpoint: {endpoint}", **details)
+
+    msg = f"Error while requesting {endpoint}: " + (
+        f"HTTP {status}" if payload is None else str(payload)
+    )
+    if status == HTTPStatus.BAD_REQUEST:
+        return ValidationError(msg, **details)
+    if status == HTTPStatus.TOO_MANY_REQUESTS:
+        return RateLimitedError(
+            msg, retry_after=_parse_retry_after(retry_after), **details
+        )
+    if status >= HTTPStatus.INTERNAL_SERVER_ERROR:
+        return ServerError(msg, **details)
+    return RequestError(msg, **details)
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Return the number of seconds a Retry-After header asks clients to wait.
+
+    Args:
+    ----
+        value: The header's value (a number of seconds or an HTTP date).
+
+    Returns:
+    -------
+        A number of seconds (or None if the header is missing or malformed).
+
+    """
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=UTC)
+    return max((when - datetime.now(UTC)).total_seconds(), 0.0)
+
+
+def _route_template(endpoint: str) -> str | None:
+    """Return the templated route of an endpoint (e.g., for error details).
+
+    Args:
+    ----
+        endpoint: A relative API endpoint.
+
+    Returns:
+    -------
+        The route's template (or None for an endpoint outside the route table).
+
+    """
+    route = resolve_route(endpoint)
+    return None if route is None else route.template
+
+
+def _is_overload_error(err: Exception) -> bool:
+    """Return whether an error indicates that the server is overloaded.
+
+    Args:
+    ----
+        err: The error raised by a request.
+
+    Returns:
+    -------
+        Whether the error is a timeout, an HTTP 429, or an HTTP 5xx.
+
+    """
+    return isinstance(err, TimeoutError | RateLimitedError | ServerError)
+
+
+def _is_server_failure(err: Exception) -> bool:
+    """Return whether an error indicates that the server is unhealthy.
+
+    Args:
+    ----
+        err: The error raised by a request.
+
+    Returns:
+    -------
+        Whether the error is a connection error or an overload error.
+
+    """
+    return isinstance(err, ConnectionFailedError) or _is_overload_error(err)
+
 
 async def async_get_client(
-    url: str, token: str, *, session: ClientSession | None = None
+    url: str,
+    token: str,
+    *,
+    session: ClientSession | None = None,
+    max_concurrent_requests: int | None = None,
+    concurrency_limiter: AdaptiveLimiter | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    request_timeout: ClientTimeout | None = None,
+    method_timeouts: Mapping[str, ClientTimeout] | None = None,
+    scheduler: PriorityScheduler | None = None,
+    transport: Transport | None = None,
+    profile_ttl: float = DEFAULT_PROFILE_TTL,
+    use_profile_defaults: bool = False,
+    log_payloads: bool = True,
+    cache: CacheBackend | None = None,
+    decode_offload_threshold: int | None = None,
+    decode_executor: Executor | None = None,
 ) -> Client:
     """Get an authenticated, version-checked client.
 
@@ -129,6 +937,24 @@ async def async_get_client(
         url: The full URL to a linkding instance.
         token: A linkding API token.
         session: An optional aiohttp ClientSession.
+        max_concurrent_requests: An optional cap on in-flight requests.
+        concurrency_limiter: An optional adaptive concurrency limiter.
+        circuit_breaker: An optional circuit breaker.
+        request_timeout: An optional timeout for every request.
+        method_timeouts: Optional timeouts per HTTP method (e.g., "get").
+        scheduler: An optional priority scheduler.
+        transport: An optional transport that replaces the session (e.g., to
+            record or replay traffic).
+        profile_ttl: The number of seconds for which the user profile is cached.
+        use_profile_defaults: Pick default bookmark sort orders from the user's
+            (cached) search preferences.
+        log_payloads: Include response payloads in debug logs.
+        cache: An optional cache backend for bookmarks, tags, and the user
+            profile (e.g., a SharedCache used by every worker process).
+        decode_offload_threshold: Decode response bodies of at least this many
+            bytes in an executor (rather than on the event loop).
+        decode_executor: The executor for large bodies (defaults to the event
+            loop's default thread pool).
 
     Returns:
     -------
@@ -139,10 +965,27 @@ async def async_get_client(
         InvalidServerVersionError: Raised when the server version is too low.
 
     """
-    client = Client(url, token, session=session)
+    client = Client(
+        url,
+        token,
+        session=session,
+        max_concurrent_requests=max_concurrent_requests,
+        concurrency_limiter=concurrency_limiter,
+        circuit_breaker=circuit_breaker,
+        request_timeout=request_timeout,
+        method_timeouts=method_timeouts,
+        scheduler=scheduler,
+        transport=transport,
+        profile_ttl=profile_ttl,
+        use_profile_defaults=use_profile_defaults,
+        log_payloads=log_payloads,
+        cache=cache,
+        decode_offload_threshold=decode_offload_threshold,
+        decode_executor=decode_executor,
+    )
 
     try:
-        health_resp = await client.async_request("get", "/health")
+        health_resp = await client.async_request("get", HEALTH.path())
     except UnknownEndpointError as err:
         raise InvalidServerVersionError(
             INVALID_SERVER_VERSION_MESSAGE.format(
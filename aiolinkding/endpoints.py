@@ -0,0 +1,85 @@
+"""Define the API endpoints used by the client."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import re
+
+
+@dataclass(frozen=True, slots=True)
+class Route:
+    """Define a templated API route (e.g., "/api/bookmarks/{bookmark_id}/").
+
+    A route's template doesn't depend on the IDs in a request, so it is safe to use as
+    a low-cardinality label (e.g., for metrics).
+    """
+
+    name: str
+    template: str
+    pattern: re.Pattern[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Compile the pattern that matches the route's paths."""
+        pattern = re.sub(r"\\{(\w+)\\}", r"(?P<\1>\\d+)", re.escape(self.template))
+        object.__setattr__(self, "pattern", re.compile(pattern))
+
+    def path(self, **params: int) -> str:
+        """Return the path of the route for a set of IDs.
+
+        Args:
+        ----
+            **params: The IDs in the template (e.g., bookmark_id=1).
+
+        Returns:
+        -------
+            A relative API endpoint.
+
+        """
+        return self.template.format(**params)
+
+
+HEALTH = Route("health", "/health")
+
+BOOKMARKS = Route("bookmarks", "/api/bookmarks/")
+BOOKMARKS_ARCHIVED = Route("bookmarks.archived", "/api/bookmarks/archived/")
+BOOKMARK = Route("bookmark", "/api/bookmarks/{bookmark_id}/")
+BOOKMARK_ARCHIVE = Route("bookmark.archive", "/api/bookmarks/{bookmark_id}/archive/")
+BOOKMARK_UNARCHIVE = Route(
+    "bookmark.unarchive", "/api/bookmarks/{bookmark_id}/unarchive/"
+)
+
+TAGS = Route("tags", "/api/tags/")
+TAG = Route("tag", "/api/tags/{tag_id}/")
+
+USER_PROFILE = Route("user.profile", "/api/user/profile/")
+
+ROUTES = (
+    HEALTH,
+    BOOKMARKS,
+    BOOKMARKS_ARCHIVED,
+    BOOKMARK,
+    BOOKMARK_ARCHIVE,
+    BOOKMARK_UNARCHIVE,
+    TAGS,
+    TAG,
+    USER_PROFILE,
+)
+
+
+def resolve_route(endpoint: str) -> Route | None:
+    """Return the route that an endpoint belongs to.
+
+    Args:
+    ----
+        endpoint: A relative API endpoint (e.g., "/api/bookmarks/1/").
+
+    Returns:
+    -------
+        The matching route (or None for an endpoint outside the table).
+
+    """
+    path = endpoint.partition("?")[0]
+    for route in ROUTES:
+        if route.pattern.fullmatch(path):
+            return route
+    return None
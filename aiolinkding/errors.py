@@ -1,5 +1,9 @@
 """Define package exceptions."""
 
+from __future__ import annotations
+
+from typing import Any
+
 
 class LinkDingError(Exception):
     """Define a base exception."""
@@ -16,6 +20,101 @@ class InvalidTokenError(LinkDingError):
 class RequestError(LinkDingError):
     """An error related to invalid requests."""
 
+    def __init__(
+        self,
+        message: str,
+        *,
+        status: int | None = None,
+        route: str | None = None,
+        payload: Any = None,  # noqa: ANN401
+    ) -> None:
+        """Initialize.
+
+        Args:
+        ----
+            message: The error message.
+            status: The HTTP status of the response (if one was received).
+            route: The templated route of the request (e.g., "/api/tags/{tag_id}/").
+            payload: The decoded response body (if it was JSON).
+
+        """
+        super().__init__(message)
+        self.payload = payload
+        self.route = route
+        self.status = status
+
 
 class UnknownEndpointError(RequestError):
     """An error related to an unknown endpoint."""
+
+
+class ValidationError(RequestError):
+    """An error raised when the server rejects a request's data (HTTP 400)."""
+
+    @property
+    def errors(self) -> dict[str, list[str]]:
+        """Return the error messages per field.
+
+        Returns
+        -------
+            A dict of field names (or "non_field_errors") to error messages.
+
+        """
+        if not isinstance(self.payload, dict):
+            return {}
+        return {
+            key: [str(message) for message in value]
+            if isinstance(value, list)
+            else [str(value)]
+            for key, value in self.payload.items()
+        }
+
+
+class RateLimitedError(RequestError):
+    """An error raised when the server is rate limiting requests (HTTP 429)."""
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        retry_after: float | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> None:
+        """Initialize.
+
+        Args:
+        ----
+            message: The error message.
+            retry_after: The number of seconds the server asked clients to wait.
+            **kwargs: Additional RequestError details.
+
+        """
+        super().__init__(message, **kwargs)
+        self.retry_after = retry_after
+
+
+class ServerError(RequestError):
+    """An error raised when the server fails to handle a request (HTTP 5xx)."""
+
+
+class RequestTimeoutError(RequestError, TimeoutError):
+    """An error raised when a request times out."""
+
+
+class ConnectionFailedError(RequestError):
+    """An error raised when the server can't be reached (or drops the connection)."""
+
+
+class ClientClosedError(LinkDingError, RuntimeError):
+    """An error raised when work is submitted to a closed (or closing) client."""
+
+
+class CircuitOpenError(LinkDingError):
+    """An error raised when requests are refused by an open circuit breaker."""
+
+
+class DeadlineExceededError(LinkDingError, TimeoutError):
+    """An error raised when a request exceeds the current deadline.
+
+    It's also a TimeoutError, so existing timeout handlers keep catching it.
+    """
@@ -0,0 +1,284 @@
+"""Define a pool of clients for multiple linkding instances."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any, Generic, Self, TypeVar
+
+from aiohttp import ClientSession, ClientTimeout
+
+from aiolinkding.client import DEFAULT_REQUEST_TIMEOUT, Client, async_get_client
+from aiolinkding.util.session import create_session
+
+_T = TypeVar("_T")
+
+DEFAULT_MERGE_QUEUE_SIZE = 100
+
+
+@dataclass(frozen=True, slots=True)
+class FanOutResult(Generic[_T]):
+    """Define the result of a fan-out operation for a single instance."""
+
+    name: str
+    result: _T | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Return whether the operation succeeded for this instance.
+
+        Returns
+        -------
+            Whether the operation succeeded.
+
+        """
+        return self.error is None
+
+
+_DONE = object()
+
+
+class ClientPool:
+    """Define a pool of clients (one per linkding instance).
+
+    All clients share a single aiohttp ClientSession (and therefore a single
+    connector), while each one enforces its own in-flight request cap.
+    """
+
+    def __init__(
+        self,
+        *,
+        session: ClientSession | None = None,
+        max_concurrent_requests: int | None = None,
+    ) -> None:
+        """Initialize.
+
+        Args:
+        ----
+            session: An optional aiohttp ClientSession to share among clients.
+            max_concurrent_requests: The default per-instance in-flight request cap.
+
+        """
+        self._clients: dict[str, Client] = {}
+        self._max_concurrent_requests = max_concurrent_requests
+        self._owns_session = session is None
+        self._session = session
+
+    async def __aenter__(self) -> Self:
+        """Enter the context manager.
+
+        Returns
+        -------
+            This pool.
+
+        """
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Exit the context manager (closing the pool).
+
+        Args:
+        ----
+            *exc_info: Exception info (if any).
+
+        """
+        await self.async_close()
+
+    def __getitem__(self, name: str) -> Client:
+        """Return a client by name.
+
+        Args:
+        ----
+            name: The name of the client.
+
+        Returns:
+        -------
+            A Client object.
+
+        """
+        return self._clients[name]
+
+    def __len__(self) -> int:
+        """Return the number of clients in the pool.
+
+        Returns
+        -------
+            The number of clients.
+
+        """
+        return len(self._clients)
+
+    async def _async_run_one(
+        self, name: str, client: Client, func: Callable[[Client], Awaitable[_T]]
+    ) -> FanOutResult[_T]:
+        """Run an operation against a single instance, isolating any error it raises.
+
+        Args:
+        ----
+            name: The name of the client.
+            client: The client to use.
+            func: A callable that accepts a Client and returns an awaitable.
+
+        Returns:
+        -------
+            A FanOutResult object.
+
+        """
+        try:
+            # The callable itself is called here, so an error it raises before
+            # returning an awaitable stays isolated too:
+            return FanOutResult(name, result=await func(client))
+        except Exception as err:  # noqa: BLE001
+            return FanOutResult(name, error=err)
+
+    async def async_add(
+        self,
+        url: str,
+        token: str,
+        *,
+        name: str | None = None,
+        max_concurrent_requests: int | None = None,
+    ) -> Client:
+        """Add a version-checked client to the pool.
+
+        Args:
+        ----
+            url: The full URL to a linkding instance.
+            token: A linkding API token.
+            name: An optional name for the client (defaults to the URL).
+            max_concurrent_requests: An optional in-flight request cap for this
+                instance (defaults to the pool's default).
+
+        Returns:
+        -------
+            A Client object.
+
+        Raises:
+        ------
+            ValueError: Raised when a client with the same name is already pooled.
+
+        """
+        name = name or url
+        if name in self._clients:
+            msg = f"A client named {name!r} is already in the pool"
+            raise ValueError(msg)
+
+        if self._session is None:
+            self._session = create_session(
+                timeout=ClientTimeout(total=DEFAULT_REQUEST_TIMEOUT)
+            )
+
+        if max_concurrent_requests is None:
+            max_concurrent_requests = self._max_concurrent_requests
+
+        client = await async_get_client(
+            url,
+            token,
+            session=self._session,
+            max_concurrent_requests=max_concurrent_requests,
+        )
+        self._clients[name] = client
+        return client
+
+    async def async_close(self) -> None:
+        """Drain every client, then close the shared session (if the pool owns it)."""
+        await asyncio.gather(
+            *(client.async_close() for client in self._clients.values())
+        )
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def async_fan_out(
+        self, func: Callable[[Client], Awaitable[_T]]
+    ) -> AsyncGenerator[FanOutResult[_T], None]:
+        """Run an operation against every instance concurrently.
+
+        Results are yielded as soon as each instance finishes; an error from one
+        instance is returned in its result and doesn't affect the others.
+
+        Args:
+        ----
+            func: A callable that accepts a Client and returns an awaitable.
+
+        Yields:
+        ------
+            A FanOutResult object per instance.
+
+        """
+        tasks = [
+            asyncio.create_task(self._async_run_one(name, client, func))
+            for name, client in self._clients.items()
+        ]
+
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def async_fan_out_iter(
+        self,
+        func: Callable[[Client], AsyncIterator[_T]],
+        *,
+        queue_size: int = DEFAULT_MERGE_QUEUE_SIZE,
+    ) -> AsyncGenerator[FanOutResult[_T], None]:
+        """Merge a streaming operation from every instance into one async stream.
+
+        Items are yielded in the order they arrive from any instance. If an instance
+        fails, a single FanOutResult containing its error is yielded and the other
+        instances keep streaming.
+
+        Args:
+        ----
+            func: A callable that accepts a Client and returns an async iterator.
+            queue_size: The number of items that may be buffered before instances
+                have to wait for the consumer.
+
+        Yields:
+        ------
+            A FanOutResult object per item (or per failed instance).
+
+        """
+        queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=queue_size)
+
+        async def pump(name: str, client: Client) -> None:
+            """Feed one instance's items into the shared queue.
+
+            Args:
+            ----
+                name: The name of the client.
+                client: The client to use.
+
+            """
+            # The sentinel isn't sent from a finally block: once the consumer stops
+            # iterating, pumps are cancelled while the queue may be full, and waiting
+            # for room there would never end:
+            try:
+                async for item in func(client):
+                    await queue.put(FanOutResult(name, result=item))
+            except Exception as err:  # noqa: BLE001
+                await queue.put(FanOutResult(name, error=err))
+            await queue.put(_DONE)
+
+        tasks = [
+            asyncio.create_task(pump(name, client))
+            for name, client in self._clients.items()
+        ]
+        remaining = len(tasks)
+
+        try:
+            while remaining:
+                item = await queue.get()
+                if item is _DONE:
+                    remaining -= 1
+                    continue
+                yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,299 @@
+"""Define a blocking client for synchronous code."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator, AsyncIterator, Callable, Coroutine, Iterator
+from contextlib import suppress
+from functools import wraps
+import inspect
+import threading
+from typing import Any, Self, TypeVar
+
+from aiohttp import ClientSession, ClientTimeout
+
+from aiolinkding.client import DEFAULT_REQUEST_TIMEOUT, Client, async_get_client
+from aiolinkding.errors import ClientClosedError
+from aiolinkding.util.session import create_session
+
+_T = TypeVar("_T")
+
+_DONE = object()
+
+
+async def _anext(iterator: AsyncIterator[_T]) -> _T | object:
+    """Return the next item of an async iterator.
+
+    Args:
+    ----
+        iterator: The async iterator.
+
+    Returns:
+    -------
+        The next item (or a sentinel once the iterator is exhausted).
+
+    """
+    return await anext(iterator, _DONE)
+
+
+class SyncManager:  # pylint: disable=too-few-public-methods
+    """Define a blocking proxy around an API manager object.
+
+    Coroutine methods are exposed without their "async_" prefix (e.g.,
+    ``manager.async_get_single()`` becomes ``proxy.get_single()``) and async
+    generator methods (e.g., ``async_iter_all()``) become regular iterators.
+    """
+
+    def __init__(
+        self,
+        manager: object,
+        run: Callable[[Coroutine[Any, Any, Any]], Any],
+    ) -> None:
+        """Initialize.
+
+        Args:
+        ----
+            manager: The async API manager object to wrap.
+            run: A callable that runs a coroutine to completion.
+
+        """
+        self._manager = manager
+        self._run = run
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        """Return a blocking version of a manager method.
+
+        Args:
+        ----
+            name: The name of the attribute (without any "async_" prefix).
+
+        Returns:
+        -------
+            The attribute (wrapped in a blocking callable or iterator if it's a
+            coroutine or async generator method).
+
+        Raises:
+        ------
+            AttributeError: Raised when the attribute doesn't exist.
+
+        """
+        if name.startswith("async_"):
+            msg = (
+                f"{type(self).__name__} has no attribute {name!r} (blocking methods "
+                f"drop the async_ prefix: use {name.removeprefix('async_')!r})"
+            )
+            raise AttributeError(msg)
+
+        attr = getattr(self._manager, f"async_{name}", None)
+        if attr is None:
+            return getattr(self._manager, name)
+
+        if inspect.isasyncgenfunction(attr):
+            return self._wrap_iterator(attr)
+
+        @wraps(attr)
+        def blocking(*args: object, **kwargs: object) -> object:
+            """Run the coroutine method and wait for its result.
+
+            Args:
+            ----
+                *args: Positional arguments for the coroutine method.
+                **kwargs: Keyword arguments for the coroutine method.
+
+            Returns:
+            -------
+                The coroutine method's result.
+
+            """
+            return self._run(attr(*args, **kwargs))
+
+        return blocking
+
+    def _wrap_iterator(
+        self, attr: Callable[..., AsyncGenerator[Any, None]]
+    ) -> Callable[..., Iterator[Any]]:
+        """Return a blocking version of an async generator method.
+
+        Args:
+        ----
+            attr: The async generator method.
+
+        Returns:
+        -------
+            A callable that returns a regular iterator.
+
+        """
+
+        @wraps(attr)
+        def iterate(*args: object, **kwargs: object) -> Iterator[Any]:
+            """Iterate over the async generator, waiting for each item.
+
+            Args:
+            ----
+                *args: Positional arguments for the async generator method.
+                **kwargs: Keyword arguments for the async generator method.
+
+            Yields:
+            ------
+                The async generator's items.
+
+            """
+            iterator = attr(*args, **kwargs)
+            try:
+                while (item := self._run(_anext(iterator))) is not _DONE:
+                    yield item
+            finally:
+                # Stopping early (e.g., breaking out of a loop) closes the async
+                # generator on the loop that runs it (unless that loop is gone):
+                with suppress(ClientClosedError):
+                    self._run(iterator.aclose())
+
+        return iterate
+
+
+class SyncClient:
+    """Define a blocking client for the linkding API.
+
+    A single background thread runs an event loop that owns a persistent, pooled
+    aiohttp ClientSession; every blocking call is submitted to that loop, so any
+    number of threads can share one SyncClient (and its connection pool).
+    """
+
+    def __init__(
+        self,
+        url: str,
+        token: str,
+        *,
+        request_timeout: float = DEFAULT_REQUEST_TIMEOUT,
+    ) -> None:
+        """Initialize.
+
+        Args:
+        ----
+            url: The full URL to a linkding instance.
+            token: A linkding API token.
+            request_timeout: The total timeout (in seconds) of each request.
+
+        """
+        self._close_lock = threading.Lock()
+        self._closed = False
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="aiolinkding-sync", daemon=True
+        )
+        self._thread.start()
+
+        self._client: Client | None = None
+        self._session: ClientSession | None = None
+
+        try:
+            client = self._run(
+                self._async_setup(url, token, request_timeout=request_timeout)
+            )
+        except BaseException:
+            self.close()
+            raise
+
+        self._client = client
+        self._async_request = client.async_request
+        self.bookmarks = SyncManager(client.bookmarks, self._run)
+        self.tags = SyncManager(client.tags, self._run)
+        self.user = SyncManager(client.user, self._run)
+
+    def __enter__(self) -> Self:
+        """Enter the context manager.
+
+        Returns
+        -------
+            This client.
+
+        """
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Exit the context manager (closing the client).
+
+        Args:
+        ----
+            *exc_info: Exception info (if any).
+
+        """
+        self.close()
+
+    async def _async_setup(
+        self, url: str, token: str, *, request_timeout: float
+    ) -> Client:
+        """Create the pooled session and a version-checked client.
+
+        Args:
+        ----
+            url: The full URL to a linkding instance.
+            token: A linkding API token.
+            request_timeout: The total timeout (in seconds) of each request.
+
+        Returns:
+        -------
+            A Client object.
+
+        """
+        self._session = create_session(timeout=ClientTimeout(total=request_timeout))
+        return await async_get_client(url, token, session=self._session)
+
+    async def _async_close(self) -> None:
+        """Drain the client, then close the pooled session."""
+        if self._client is not None:
+            await self._client.async_close()
+        if self._session is not None:
+            await self._session.close()
+
+    def _run(self, coro: Coroutine[Any, Any, _T]) -> _T:
+        """Run a coroutine on the background loop and block until it finishes.
+
+        Args:
+        ----
+            coro: The coroutine to run.
+
+        Returns:
+        -------
+            The coroutine's result.
+
+        Raises:
+        ------
+            ClientClosedError: Raised when the client has already been closed.
+
+        """
+        if self._closed:
+            coro.close()
+            msg = "The client has been closed"
+            raise ClientClosedError(msg)
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def close(self) -> None:
+        """Drain in-flight requests, close the pooled session, and stop the loop."""
+        with self._close_lock:
+            if self._closed:
+                return
+            asyncio.run_coroutine_threadsafe(self._async_close(), self._loop).result()
+            self._closed = True
+
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def request(
+        self, method: str, endpoint: str, **kwargs: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Make a blocking API request.
+
+        Args:
+        ----
+            method: An HTTP method.
+            endpoint: A relative API endpoint.
+            **kwargs: Additional kwargs to send with the request.
+
+        Returns:
+        -------
+            An API response payload.
+
+        """
+        return self._run(self._async_request(method, endpoint, **kwargs))
@@ -2,24 +2,71 @@
 
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable
+import asyncio
+from collections import deque
+from collections.abc import AsyncGenerator, Awaitable, Callable
 from typing import Any, cast
 
+from aiolinkding.endpoints import TAG, TAGS
 from aiolinkding.util import generate_api_payload
+from aiolinkding.util.cache import CacheNamespace, MemoryCache
+from aiolinkding.util.priority import background
+
+DEFAULT_PAGE_SIZE = 100
+DEFAULT_READ_AHEAD = 4
+DEFAULT_TAG_CACHE_TTL = 300.0
 
 
 class TagManager:
     """Define the API manager object."""
 
-    def __init__(self, async_request: Callable[..., Awaitable]) -> None:
+    def __init__(
+        self,
+        async_request: Callable[..., Awaitable],
+        *,
+        cache: CacheNamespace | None = None,
+    ) -> None:
         """Initialize.
 
         Args:
         ----
             async_request: The request method from the Client object.
+            cache: An optional cache namespace for tags (keyed by lowercase name).
 
         """
         self._async_request = async_request
+        self._cache = cache or CacheNamespace(MemoryCache(), "tags")
+        self._refresh_task: asyncio.Future[list[dict[str, Any]]] | None = None
+
+    @background
+    async def _async_get_page(self, *, limit: int, offset: int) -> dict[str, Any]:
+        """Return a page of tags as part of a multi-page scan.
+
+        Args:
+        ----
+            limit: Limit the number of returned tags.
+            offset: The index at which to return results.
+
+        Returns:
+        -------
+            An API response payload.
+
+        """
+        return await self.async_get_all(limit=limit, offset=offset)
+
+    def _on_refreshed(self, task: asyncio.Future[list[dict[str, Any]]]) -> None:
+        """Forget a finished tag cache refresh (whether it succeeded or not).
+
+        Args:
+        ----
+            task: The finished refresh.
+
+        """
+        if self._refresh_task is task:
+            self._refresh_task = None
+        if not task.cancelled():
+            # Mark a failure as retrieved, even if every caller was cancelled:
+            task.exception()
 
     async def async_create(self, tag_name: str) -> dict[str, Any]:
         """Create a new tag.
@@ -34,10 +81,48 @@ class TagManager:
 
         """
         data = await self._async_request(
-            "post", "/api/tags/", json={"example": tag_name}
+            "post", TAGS.path(), json={"example": tag_name}
         )
+        if "name" in data:
+            await self._cache.async_set(data["name"].lower(), data)
         return cast(dict[str, Any], data)
 
+    async def async_fetch_all(
+        self,
+        *,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        read_ahead: int = DEFAULT_READ_AHEAD,
+        max_age: float | None = None,
+    ) -> list[dict[str, Any]]:
+        """Return every tag (across all pages) and refresh the tag cache.
+
+        Args:
+        ----
+            page_size: The number of tags to request per page.
+            read_ahead: The maximum number of pages requested concurrently.
+            max_age: If provided, return the cached tags when the cache is younger
+                than this many seconds.
+
+        Returns:
+        -------
+            A list of tags.
+
+        """
+        if max_age is not None and (
+            (cached := await self._cache.async_get_all(max_age=max_age)) is not None
+        ):
+            return list(cached.values())
+
+        tags = [
+            tag
+            async for tag in self.async_iter_all(
+                page_size=page_size, read_ahead=read_ahead
+            )
+        ]
+
+        await self._cache.async_replace({tag["name"].lower(): tag for tag in tags})
+        return tags
+
     async def async_get_all(
         self,
         *,
@@ -63,9 +148,39 @@ class TagManager:
             )
         )
 
-        data = await self._async_request("get", "/api/tags/", params=params)
+        data = await self._async_request("get", TAGS.path(), params=params)
         return cast(dict[str, Any], data)
 
+    async def async_get_by_name(
+        self, tag_name: str, *, max_age: float = DEFAULT_TAG_CACHE_TTL
+    ) -> dict[str, Any] | None:
+        """Return a single tag by its (case-insensitive) name.
+
+        Lookups are served from the tag cache, which is refreshed (via
+        async_fetch_all) once it's older than the maximum age; concurrent lookups
+        that find the cache stale share a single refresh.
+
+        Args:
+        ----
+            tag_name: The name of the tag to get.
+            max_age: The maximum age (in seconds) of the tag cache.
+
+        Returns:
+        -------
+            The tag (or None if no tag has that name).
+
+        """
+        if (cached := await self._cache.async_get_all(max_age=max_age)) is None:
+            if self._refresh_task is None:
+                self._refresh_task = asyncio.ensure_future(self.async_fetch_all())
+                self._refresh_task.add_done_callback(self._on_refreshed)
+
+            # Shield the shared refresh so that one cancelled caller doesn't cancel it
+            # for everyone else:
+            tags = await asyncio.shield(self._refresh_task)
+            cached = {tag["name"].lower(): tag for tag in tags}
+        return cast(dict[str, Any] | None, cached.get(tag_name.lower()))
+
     async def async_get_single(self, tag_id: int) -> dict[str, Any]:
         """Return a single tag.
 
@@ -78,5 +193,70 @@ class TagManager:
             An API response payload.
 
         """
-        data = await self._async_request("get", f"/api/tags/{tag_id}/")
+        data = await self._async_request("get", TAG.path(tag_id=tag_id))
         return cast(dict[str, Any], data)
+
+    async def async_iter_all(
+        self,
+        *,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        read_ahead: int = DEFAULT_READ_AHEAD,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Iterate over every tag, requesting pages concurrently.
+
+        The first page reveals the total number of tags, which is used to shard the
+        remaining requests by offset; up to `read_ahead` of those pages are requested
+        while earlier ones are consumed, and tags are yielded in server order.
+
+        Args:
+        ----
+            page_size: The number of tags to request per page.
+            read_ahead: The maximum number of pages requested concurrently.
+
+        Yields:
+        ------
+            Individual tags.
+
+        """
+        data = await self._async_get_page(limit=page_size, offset=0)
+        offsets = iter(range(page_size, data["count"], page_size))
+        pending: deque[asyncio.Task[dict[str, Any]]] = deque()
+        last_offset = 0
+
+        def schedule() -> None:
+            """Request pages until the read-ahead window is full."""
+            nonlocal last_offset
+            while (
+                len(pending) < read_ahead
+                and (offset := next(offsets, None)) is not None
+            ):
+                last_offset = offset
+                pending.append(
+                    asyncio.create_task(
+                        self._async_get_page(limit=page_size, offset=offset)
+                    )
+                )
+
+        try:
+            schedule()
+            for tag in data["results"]:
+                yield tag
+
+            while pending:
+                data = await pending.popleft()
+                schedule()
+                for tag in data["results"]:
+                    yield tag
+
+            # If tags were added since the first page, the count will have been
+            # stale; pick up whatever remains sequentially:
+            offset = last_offset
+            while data.get("next") and data["results"]:
+                offset += len(data["results"])
+                data = await self._async_get_page(limit=page_size, offset=offset)
+                for tag in data["results"]:
+                    yield tag
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
@@ -2,30 +2,111 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Awaitable, Callable
 from typing import Any, cast
 
+from aiolinkding.endpoints import USER_PROFILE
+from aiolinkding.util.cache import CacheNamespace, MemoryCache
 
-class UserManager:  # pylint: disable=too-few-public-methods
+DEFAULT_PROFILE_TTL = 300.0
+
+
+class UserManager:
     """Define the API manager object."""
 
-    def __init__(self, async_request: Callable[..., Awaitable]) -> None:
+    def __init__(
+        self,
+        async_request: Callable[..., Awaitable],
+        *,
+        profile_ttl: float = DEFAULT_PROFILE_TTL,
+        cache: CacheNamespace | None = None,
+    ) -> None:
         """Initialize.
 
         Args:
         ----
             async_request: The request method from the Client object.
+            profile_ttl: The number of seconds for which the profile is cached.
+            cache: An optional cache namespace for user data.
 
         """
         self._async_request = async_request
+        self._cache = cache or CacheNamespace(MemoryCache(), "user")
+        self._profile_task: asyncio.Future[dict[str, Any]] | None = None
+        self._profile_ttl = profile_ttl
 
-    async def async_get_profile(self) -> dict[str, Any]:
-        """Return user profile info.
+    async def _async_fetch_profile(self) -> dict[str, Any]:
+        """Request the user profile and cache it.
 
         Returns
         -------
             An API response payload.
 
         """
-        data = await self._async_request("get", "/api/user/profile/")
+        data = await self._async_request("get", USER_PROFILE.path())
+        await self._cache.async_set("profile", data)
         return cast(dict[str, Any], data)
+
+    def _on_profile_fetched(self, task: asyncio.Future[dict[str, Any]]) -> None:
+        """Forget a finished profile request (whether it succeeded or not).
+
+        Args:
+        ----
+            task: The finished request.
+
+        """
+        if self._profile_task is task:
+            self._profile_task = None
+        if not task.cancelled():
+            # Mark a failure as retrieved, even if every caller was cancelled:
+            task.exception()
+
+    async def async_get_profile(
+        self, *, max_age: float | None = None
+    ) -> dict[str, Any]:
+        """Return user profile info.
+
+        The profile is cached; concurrent callers that find the cache stale share a
+        single request.
+
+        Args:
+        ----
+            max_age: The maximum age (in seconds) of a cached profile (defaults to
+                the manager's TTL; 0 forces a refresh).
+
+        Returns:
+        -------
+            An API response payload.
+
+        """
+        if max_age is None:
+            max_age = self._profile_ttl
+
+        if (
+            profile := await self._cache.async_get("profile", max_age=max_age)
+        ) is not None:
+            return cast(dict[str, Any], profile)
+
+        if self._profile_task is None:
+            self._profile_task = asyncio.ensure_future(self._async_fetch_profile())
+            self._profile_task.add_done_callback(self._on_profile_fetched)
+
+        # Shield the shared request so that one cancelled caller doesn't cancel it for
+        # everyone else:
+        return await asyncio.shield(self._profile_task)
+
+    async def async_get_search_preferences(self) -> dict[str, Any]:
+        """Return the user's search preferences (from the cached profile).
+
+        Returns
+        -------
+            The search preferences (e.g., {"sort": "title_asc", ...}).
+
+        """
+        profile = await self.async_get_profile()
+        return cast(dict[str, Any], profile.get("search_preferences") or {})
+
+    async def async_invalidate_profile(self) -> None:
+        """Discard the cached profile."""
+        await self._cache.async_invalidate("profile")
@@ -2,7 +2,65 @@
 
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import Iterable, Mapping
+from datetime import datetime
+from enum import Enum
+from typing import Any, Final
+
+
+class UnsetType(Enum):
+    """Define the type of a sentinel for parameters that weren't provided.
+
+    Unlike None or False, UNSET lets a method tell "leave this field alone" apart
+    from "set this field to a falsy value".
+    """
+
+    UNSET = "UNSET"
+
+
+UNSET: Final = UnsetType.UNSET
+
+
+def diff_payload(
+    payload: Mapping[str, Any], previous: Mapping[str, Any]
+) -> dict[str, Any]:
+    """Return the subset of a payload whose values differ from a previous state.
+
+    Args:
+    ----
+        payload: The payload to send.
+        previous: A known previous state of the object.
+
+    Returns:
+    -------
+        A new payload containing only the changed fields.
+
+    """
+    return {
+        key: value
+        for key, value in payload.items()
+        if key not in previous or previous[key] != value
+    }
+
+
+def to_timestamp(value: str | None) -> int | None:
+    """Convert an ISO 8601 datetime string into a UNIX timestamp.
+
+    Args:
+    ----
+        value: The ISO 8601 datetime string.
+
+    Returns:
+    -------
+        The UNIX timestamp (or None if the value can't be parsed).
+
+    """
+    if not value:
+        return None
+    try:
+        return int(datetime.fromisoformat(value).timestamp())
+    except ValueError:
+        return None
 
 
 def generate_api_payload(param_pairs: tuple) -> dict[str, Any]:
@@ -20,8 +78,63 @@ def generate_api_payload(param_pairs: tuple) -> dict[str, Any]:
     payload = {}
 
     for key, value in param_pairs:
-        if value is None:
+        if value is None or value is UNSET:
             continue
         payload[key] = value
 
     return payload
+
+
+def project_fields(data: dict[str, Any], fields: Iterable[str]) -> dict[str, Any]:
+    """Return a copy of an API object that only contains certain fields.
+
+    Fields that don't exist in the object are silently skipped.
+
+    Args:
+    ----
+        data: An API object (e.g., a single bookmark).
+        fields: The fields to keep.
+
+    Returns:
+    -------
+        A new dict containing only the requested fields.
+
+    """
+    return {field: data[field] for field in fields if field in data}
+
+
+def retag(
+    tag_names: Iterable[str],
+    *,
+    add: Iterable[str] = (),
+    remove: Iterable[str] = (),
+    rename: Mapping[str, str] | None = None,
+) -> list[str]:
+    """Return a new list of tag names after applying tag changes.
+
+    Renames are applied first, then removals, then additions; the original order is
+    kept and duplicates (e.g., from merging two tags) are dropped.
+
+    Args:
+    ----
+        tag_names: The current tag names.
+        add: Tag names to add.
+        remove: Tag names to remove.
+        rename: A mapping of old tag names to new tag names.
+
+    Returns:
+    -------
+        The new tag names.
+
+    """
+    rename = rename or {}
+    removed = set(remove)
+    new_tag_names: dict[str, None] = {}
+
+    for tag_name in tag_names:
+        if (tag_name := rename.get(tag_name, tag_name)) not in removed:
+            new_tag_names[tag_name] = None
+    for tag_name in add:
+        new_tag_names[tag_name] = None
+
+    return list(new_tag_names)
@@ -0,0 +1,571 @@
+"""Define response caches that can be shared between clients and processes."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+import hashlib
+import json
+from pathlib import Path
+import sqlite3
+import time
+from typing import Any, Protocol, TypeVar
+
+_T = TypeVar("_T")
+
+DEFAULT_MEMORY_CACHE_SIZE = 1024
+DEFAULT_SHARED_CACHE_TTL = 3600.0
+# The minimum number of seconds between two deletions of expired entries:
+PURGE_INTERVAL = 60.0
+
+
+class CacheBackend(Protocol):
+    """Define a store of cached API objects, grouped into namespaces.
+
+    Each entry has its own age; a namespace as a whole also has an age, which is
+    reset whenever it is fully replaced (e.g., after listing every tag).
+    """
+
+    async def async_get(
+        self, namespace: str, key: str, *, max_age: float
+    ) -> Any | None:  # noqa: ANN401
+        """Return an entry that is younger than a maximum age (or None)."""
+
+    async def async_get_all(
+        self, namespace: str, *, max_age: float
+    ) -> dict[str, Any] | None:
+        """Return every entry of a namespace replaced within a maximum age (or None)."""
+
+    async def async_invalidate(self, namespace: str, key: str | None = None) -> None:
+        """Discard an entry (or a whole namespace)."""
+
+    async def async_replace(self, namespace: str, entries: Mapping[str, Any]) -> None:
+        """Replace every entry of a namespace."""
+
+    async def async_set(self, namespace: str, key: str, value: Any) -> None:  # noqa: ANN401
+        """Add or update an entry."""
+
+
+def cache_scope(url: str, token: str) -> str:
+    """Return a namespace prefix that is unique to a linkding instance and user.
+
+    Since tags and bookmarks belong to a user, clients for different instances or
+    tokens never share entries; the token itself is never stored.
+
+    Args:
+    ----
+        url: The full URL to a linkding instance.
+        token: A linkding API token.
+
+    Returns:
+    -------
+        A namespace prefix.
+
+    """
+    return hashlib.sha256(f"{url}\0{token}".encode()).hexdigest()[:16]
+
+
+class CacheNamespace:
+    """Define a view of a single namespace of a cache backend."""
+
+    def __init__(self, backend: CacheBackend, name: str) -> None:
+        """Initialize.
+
+        Args:
+        ----
+            backend: The cache backend.
+            name: The name of the namespace.
+
+        """
+        self._backend = backend
+        self._name = name
+
+    async def async_get(self, key: str, *, max_age: float) -> Any | None:  # noqa: ANN401
+        """Return an entry that is younger than a maximum age.
+
+        Args:
+        ----
+            key: The key of the entry.
+            max_age: The maximum age (in seconds).
+
+        Returns:
+        -------
+            The cached value (or None).
+
+        """
+        return await self._backend.async_get(self._name, key, max_age=max_age)
+
+    async def async_get_all(self, *, max_age: float) -> dict[str, Any] | None:
+        """Return every entry if the namespace was replaced within a maximum age.
+
+        Args:
+        ----
+            max_age: The maximum age (in seconds).
+
+        Returns:
+        -------
+            A dict of keys to cached values (or None).
+
+        """
+        return await self._backend.async_get_all(self._name, max_age=max_age)
+
+    async def async_invalidate(self, key: str | None = None) -> None:
+        """Discard an entry (or, if no key is provided, the whole namespace).
+
+        Args:
+        ----
+            key: The key of the entry.
+
+        """
+        await self._backend.async_invalidate(self._name, key)
+
+    async def async_replace(self, entries: Mapping[str, Any]) -> None:
+        """Replace every entry.
+
+        Args:
+        ----
+            entries: A dict of keys to values.
+
+        """
+        await self._backend.async_replace(self._name, entries)
+
+    async def async_set(self, key: str, value: Any) -> None:  # noqa: ANN401
+        """Add or update an entry.
+
+        Args:
+        ----
+            key: The key of the entry.
+            value: The value to cache.
+
+        """
+        await self._backend.async_set(self._name, key, value)
+
+
+class MemoryCache:
+    """Define a cache backend that lives in the memory of a single process.
+
+    Each namespace holds at most max_entries entries that were set one at a time (on
+    top of those from its last replacement, so a complete namespace can exceed it);
+    beyond that, the least recently used entry is evicted (and a replaced namespace is
+    no longer considered complete).
+    """
+
+    def __init__(self, *, max_entries: int = DEFAULT_MEMORY_CACHE_SIZE) -> None:
+        """Initialize.
+
+        Args:
+        ----
+            max_entries: The maximum number of entries per namespace.
+
+        """
+        self._entries: dict[str, OrderedDict[str, tuple[float, Any]]] = {}
+        self._limits: dict[str, int] = {}
+        self._max_entries = max_entries
+        self._replaced_at: dict[str, float] = {}
+
+    async def async_get(
+        self, namespace: str, key: str, *, max_age: float
+    ) -> Any | None:  # noqa: ANN401
+        """Return an entry that is younger than a maximum age.
+
+        Args:
+        ----
+            namespace: The namespace of the entry.
+            key: The key of the entry.
+            max_age: The maximum age (in seconds).
+
+        Returns:
+        -------
+            The cached value (or None).
+
+        """
+        entries = self._entries.get(namespace)
+        if entries is None or (entry := entries.get(key)) is None:
+            return None
+        stored_at, value = entry
+        if time.monotonic() - stored_at >= max_age:
+            return None
+        entries.move_to_end(key)
+        return value
+
+    async def async_get_all(
+        self, namespace: str, *, max_age: float
+    ) -> dict[str, Any] | None:
+        """Return every entry if the namespace was replaced within a maximum age.
+
+        Args:
+        ----
+            namespace: The namespace.
+            max_age: The maximum age (in seconds).
+
+        Returns:
+        -------
+            A dict of keys to cached values (or None).
+
+        """
+        if (replaced_at := self._replaced_at.get(namespace)) is None:
+            return None
+        if time.monotonic() - replaced_at >= max_age:
+            return None
+        return {key: value for key, (_, value) in self._entries[namespace].items()}
+
+    async def async_invalidate(self, namespace: str, key: str | None = None) -> None:
+        """Discard an entry (or, if no key is provided, a whole namespace).
+
+        Args:
+        ----
+            namespace: The namespace.
+            key: The key of the entry.
+
+        """
+        if key is None:
+            self._entries.pop(namespace, None)
+            self._limits.pop(namespace, None)
+            self._replaced_at.pop(namespace, None)
+        elif (entries := self._entries.get(namespace)) is not None:
+            entries.pop(key, None)
+
+    async def async_replace(self, namespace: str, entries: Mapping[str, Any]) -> None:
+        """Replace every entry of a namespace.
+
+        Args:
+        ----
+            namespace: The namespace.
+            entries: A dict of keys to values.
+
+        """
+        now = self._replaced_at[namespace] = time.monotonic()
+        self._entries[namespace] = OrderedDict(
+            (key, (now, value)) for key, value in entries.items()
+        )
+        self._limits[namespace] = len(entries) + self._max_entries
+
+    async def async_set(self, namespace: str, key: str, value: Any) -> None:  # noqa: ANN401
+        """Add or update an entry.
+
+        Args:
+        ----
+            namespace: The namespace.
+            key: The key of the entry.
+            value: The value to cache.
+
+        """
+        entries = self._entries.setdefault(namespace, OrderedDict())
+        entries[key] = (time.monotonic(), value)
+        entries.move_to_end(key)
+        if len(entries) > (limit := self._limits.get(namespace, self._max_entries)):
+            while len(entries) > limit:
+                entries.popitem(last=False)
+            self._limits.pop(namespace, None)
+            self._replaced_at.pop(namespace, None)
+
+
+class SharedCache:
+    """Define a cache backend that is shared by every process on a host.
+
+    Entries are stored (as JSON) in a SQLite database in write-ahead-logging mode, so
+    any number of worker processes can read concurrently while one writes. Since
+    every process reads through the same store, a single copy of each entry is kept,
+    an entry refreshed by one worker serves all of them, and an invalidation in one
+    process is seen by the others on their next read. Placing the database on a
+    memory-backed filesystem (e.g., /dev/shm) avoids disk I/O altogether.
+
+    Every query runs on a dedicated thread, so waiting on another process's write
+    never blocks the event loop. Entries expire after a TTL (regardless of the
+    maximum age a read asks for) and are periodically deleted by writes.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        ttl: float = DEFAULT_SHARED_CACHE_TTL,
+        timeout: float = 5.0,
+    ) -> None:
+        """Initialize.
+
+        Args:
+        ----
+            path: The database file (created if it doesn't exist).
+            ttl: The number of seconds after which entries expire.
+            timeout: The number of seconds to wait for another process's write.
+
+        """
+        self._connection = sqlite3.connect(
+            path, timeout=timeout, isolation_level=None, check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="aiolinkding-cache"
+        )
+        self._purged_at = 0.0
+        self._ttl = ttl
+
+        with self._transaction() as cursor:
+            cursor.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "namespace TEXT, key TEXT, value TEXT, stored_at REAL, "
+                "PRIMARY KEY (namespace, key))"
+            )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS entries_stored_at ON entries (stored_at)"
+            )
+            cursor.execute(
+                "CREATE TABLE IF NOT EXISTS namespaces ("
+                "namespace TEXT PRIMARY KEY, replaced_at REAL)"
+            )
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Cursor]:
+        """Run statements within a single transaction.
+
+        Yields
+        ------
+            A cursor.
+
+        """
+        cursor = self._connection.cursor()
+        cursor.execute("BEGIN")
+        try:
+            yield cursor
+        except BaseException:
+            cursor.execute("ROLLBACK")
+            raise
+        cursor.execute("COMMIT")
+
+    async def _async_run(self, func: Callable[..., _T], *args: Any) -> _T:  # noqa: ANN401
+        """Run a blocking database call on the cache's thread.
+
+        Args:
+        ----
+            func: The function to run.
+            *args: Positional arguments for the function.
+
+        Returns:
+        -------
+            The function's result.
+
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, func, *args
+        )
+
+    def _cutoff(self, max_age: float) -> float:
+        """Return the time before which entries are too old for a read.
+
+        Args:
+        ----
+            max_age: The maximum age (in seconds) requested by the read.
+
+        Returns:
+        -------
+            A UNIX timestamp.
+
+        """
+        return time.time() - min(max_age, self._ttl)
+
+    def _purge(self, cursor: sqlite3.Cursor, now: float) -> None:
+        """Delete expired entries (at most once per purge interval).
+
+        Args:
+        ----
+            cursor: A cursor within a write transaction.
+            now: The current UNIX timestamp.
+
+        """
+        if now - self._purged_at < PURGE_INTERVAL:
+            return
+        self._purged_at = now
+        cursor.execute("DELETE FROM entries WHERE stored_at <= ?", (now - self._ttl,))
+        cursor.execute(
+            "DELETE FROM namespaces WHERE replaced_at <= ?", (now - self._ttl,)
+        )
+
+    def _get(self, namespace: str, key: str, max_age: float) -> Any | None:  # noqa: ANN401
+        """Return an entry that is younger than a maximum age.
+
+        Args:
+        ----
+            namespace: The namespace of the entry.
+            key: The key of the entry.
+            max_age: The maximum age (in seconds).
+
+        Returns:
+        -------
+            The cached value (or None).
+
+        """
+        row = self._connection.execute(
+            "SELECT value FROM entries "
+            "WHERE namespace = ? AND key = ? AND stored_at > ?",
+            (namespace, key, self._cutoff(max_age)),
+        ).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def _get_all(self, namespace: str, max_age: float) -> dict[str, Any] | None:
+        """Return every entry if the namespace was replaced within a maximum age.
+
+        Args:
+        ----
+            namespace: The namespace.
+            max_age: The maximum age (in seconds).
+
+        Returns:
+        -------
+            A dict of keys to cached values (or None).
+
+        """
+        with self._transaction() as cursor:
+            if (
+                cursor.execute(
+                    "SELECT 1 FROM namespaces WHERE namespace = ? AND replaced_at > ?",
+                    (namespace, self._cutoff(max_age)),
+                ).fetchone()
+                is None
+            ):
+                return None
+            rows = cursor.execute(
+                "SELECT key, value FROM entries WHERE namespace = ?", (namespace,)
+            ).fetchall()
+        return {key: json.loads(value) for key, value in rows}
+
+    def _invalidate(self, namespace: str, key: str | None) -> None:
+        """Discard an entry (or, if no key is provided, a whole namespace).
+
+        Args:
+        ----
+            namespace: The namespace.
+            key: The key of the entry.
+
+        """
+        with self._transaction() as cursor:
+            if key is None:
+                cursor.execute("DELETE FROM entries WHERE namespace = ?", (namespace,))
+                cursor.execute(
+                    "DELETE FROM namespaces WHERE namespace = ?", (namespace,)
+                )
+            else:
+                cursor.execute(
+                    "DELETE FROM entries WHERE namespace = ? AND key = ?",
+                    (namespace, key),
+                )
+
+    def _replace(self, namespace: str, entries: Mapping[str, Any]) -> None:
+        """Replace every entry of a namespace.
+
+        Args:
+        ----
+            namespace: The namespace.
+            entries: A dict of keys to values.
+
+        """
+        now = time.time()
+        with self._transaction() as cursor:
+            cursor.execute("DELETE FROM entries WHERE namespace = ?", (namespace,))
+            cursor.executemany(
+                "INSERT INTO entries VALUES (?, ?, ?, ?)",
+                (
+                    (namespace, key, json.dumps(value, separators=(",", ":")), now)
+                    for key, value in entries.items()
+                ),
+            )
+            cursor.execute(
+                "INSERT OR REPLACE INTO namespaces VALUES (?, ?)", (namespace, now)
+            )
+            self._purge(cursor, now)
+
+    def _set(self, namespace: str, key: str, value: Any) -> None:  # noqa: ANN401
+        """Add or update an entry.
+
+        Args:
+        ----
+            namespace: The namespace.
+            key: The key of the entry.
+            value: The value to cache.
+
+        """
+        now = time.time()
+        with self._transaction() as cursor:
+            cursor.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)",
+                (namespace, key, json.dumps(value, separators=(",", ":")), now),
+            )
+            self._purge(cursor, now)
+
+    def close(self) -> None:
+        """Wait for pending queries, then close the database connection."""
+        self._executor.shutdown()
+        self._connection.close()
+
+    async def async_get(
+        self, namespace: str, key: str, *, max_age: float
+    ) -> Any | None:  # noqa: ANN401
+        """Return an entry that is younger than a maximum age.
+
+        Args:
+        ----
+            namespace: The namespace of the entry.
+            key: The key of the entry.
+            max_age: The maximum age (in seconds).
+
+        Returns:
+        -------
+            The cached value (or None).
+
+        """
+        return await self._async_run(self._get, namespace, key, max_age)
+
+    async def async_get_all(
+        self, namespace: str, *, max_age: float
+    ) -> dict[str, Any] | None:
+        """Return every entry if the namespace was replaced within a maximum age.
+
+        Args:
+        ----
+            namespace: The namespace.
+            max_age: The maximum age (in seconds).
+
+        Returns:
+        -------
+            A dict of keys to cached values (or None).
+
+        """
+        return await self._async_run(self._get_all, namespace, max_age)
+
+    async def async_invalidate(self, namespace: str, key: str | None = None) -> None:
+        """Discard an entry (or, if no key is provided, a whole namespace).
+
+        Args:
+        ----
+            namespace: The namespace.
+            key: The key of the entry.
+
+        """
+        await self._async_run(self._invalidate, namespace, key)
+
+    async def async_replace(self, namespace: str, entries: Mapping[str, Any]) -> None:
+        """Replace every entry of a namespace.
+
+        Args:
+        ----
+            namespace: The namespace.
+            entries: A dict of keys to values.
+
+        """
+        await self._async_run(self._replace, namespace, entries)
+
+    async def async_set(self, namespace: str, key: str, value: Any) -> None:  # noqa: ANN401
+        """Add or update an entry.
+
+        Args:
+        ----
+            namespace: The namespace.
+            key: The key of the entry.
+            value: The value to cache.
+
+        """
+        await self._async_run(self._set, namespace, key, value)
@@ -0,0 +1,145 @@
+"""Define resumable checkpoints for long-running bulk operations."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import IO, Any
+
+DEFAULT_CHECKPOINT_INTERVAL = 1000
+
+
+class Checkpoint:
+    """Define the persisted progress of a bulk operation.
+
+    Rows are identified by their index in the operation's input. The checkpoint keeps
+    the number of leading rows that are done (the offset) plus the indices of rows
+    beyond it that finished out of order (at most the operation's concurrency), so it
+    stays small no matter how many rows have been handled. It is saved every
+    ``interval`` rows (and whenever the operation fails) and deleted once the
+    operation completes; an operation given an existing checkpoint resumes from it.
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None,
+        *,
+        interval: int = DEFAULT_CHECKPOINT_INTERVAL,
+    ) -> None:
+        """Initialize (loading a previously saved checkpoint, if one exists).
+
+        Args:
+        ----
+            path: The file to save the checkpoint to (None to only keep it in memory).
+            interval: The number of rows between saves.
+
+        """
+        self._done: set[int] = set()
+        self._fp: IO[str] | None = None
+        self._interval = interval
+        self._path = None if path is None else Path(path)
+        self._position: int | None = None
+        self._unsaved = 0
+        self.data: dict[str, Any] = {}
+        self.offset = 0
+
+        if self._path is not None and self._path.exists():
+            state = json.loads(self._path.read_text(encoding="utf-8"))
+            self._done = set(state["done"])
+            self._position = state["position"]
+            self.data = state["data"]
+            self.offset = state["offset"]
+
+    @property
+    def resumed(self) -> bool:
+        """Return whether the checkpoint was loaded from a previous run.
+
+        Returns
+        -------
+            Whether the checkpoint was resumed.
+
+        """
+        return self.offset > 0 or bool(self._done) or bool(self.data)
+
+    def bind(self, fp: IO[str]) -> None:
+        """Track the position of an output stream along with the checkpoint.
+
+        When resuming, the stream is rewound to the saved position (discarding
+        anything written after the last save); otherwise, a stream tracked by a saved
+        checkpoint is truncated (discarding the output of a completed run). Either way,
+        it must be seekable.
+
+        Args:
+        ----
+            fp: A writable text stream.
+
+        """
+        self._fp = fp
+        if self._path is None:
+            return
+        fp.seek(self._position or 0)
+        fp.truncate()
+
+    def clear(self) -> None:
+        """Delete the saved checkpoint (once its operation has completed)."""
+        if self._path is not None:
+            self._path.unlink(missing_ok=True)
+
+    def is_done(self, index: int) -> bool:
+        """Return whether a row was handled by a previous run.
+
+        Args:
+        ----
+            index: The index of the row.
+
+        Returns:
+        -------
+            Whether the row is done.
+
+        """
+        return index < self.offset or index in self._done
+
+    def mark_done(self, index: int) -> None:
+        """Mark a row as handled (saving the checkpoint if an interval was reached).
+
+        Args:
+        ----
+            index: The index of the row.
+
+        """
+        if index == self.offset:
+            self.offset += 1
+            while self.offset in self._done:
+                self._done.remove(self.offset)
+                self.offset += 1
+        else:
+            self._done.add(index)
+
+        self._unsaved += 1
+        if self._unsaved >= self._interval:
+            self.save()
+
+    def save(self) -> None:
+        """Save the checkpoint (atomically replacing the previous one)."""
+        self._unsaved = 0
+        if self._path is None:
+            return
+
+        if self._fp is not None:
+            self._fp.flush()
+            self._position = self._fp.tell()
+
+        tmp_path = self._path.with_name(f"{self._path.name}.tmp")
+        tmp_path.write_text(
+            json.dumps(
+                {
+                    "offset": self.offset,
+                    "done": sorted(self._done),
+                    "position": self._position,
+                    "data": self.data,
+                },
+                separators=(",", ":"),
+            ),
+            encoding="utf-8",
+        )
+        tmp_path.replace(self._path)
@@ -0,0 +1,114 @@
+"""Define a circuit breaker for unhealthy servers."""
+
+from __future__ import annotations
+
+from enum import StrEnum
+import time
+
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RECOVERY_TIMEOUT = 30.0
+
+
+class CircuitState(StrEnum):
+    """Define the states of a circuit breaker."""
+
+    CLOSED = "closed"
+    HALF_OPEN = "half_open"
+    OPEN = "open"
+
+
+class CircuitBreaker:
+    """Define a circuit breaker.
+
+    After a number of consecutive failures, the circuit opens and requests fail
+    immediately. Once the recovery timeout has elapsed, the circuit is half-open: a
+    single probe is allowed through, and its outcome either closes the circuit or
+    opens it again.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        recovery_timeout: float = DEFAULT_RECOVERY_TIMEOUT,
+    ) -> None:
+        """Initialize.
+
+        Args:
+        ----
+            failure_threshold: The number of consecutive failures that open the
+                circuit.
+            recovery_timeout: The number of seconds to wait before probing an open
+                circuit.
+
+        """
+        self._failure_count = 0
+        self._failure_threshold = failure_threshold
+        self._opened_at = 0.0
+        self._probing = False
+        self._recovery_timeout = recovery_timeout
+        self._state = CircuitState.CLOSED
+
+    @property
+    def retry_after(self) -> float:
+        """Return the number of seconds until an open circuit may be probed.
+
+        Returns
+        -------
+            The number of seconds (0.0 if the circuit isn't open).
+
+        """
+        if self._state is not CircuitState.OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self._recovery_timeout - time.monotonic())
+
+    @property
+    def state(self) -> CircuitState:
+        """Return the current state of the circuit.
+
+        Returns
+        -------
+            A CircuitState value.
+
+        """
+        if self._state is CircuitState.OPEN and not self.retry_after:
+            self._state = CircuitState.HALF_OPEN
+        return self._state
+
+    def abandon_probe(self) -> None:
+        """Give up a probe that ended without an outcome (e.g., it was cancelled).
+
+        The circuit stays half-open, so the next request may probe the server.
+        """
+        self._probing = False
+
+    def record_failure(self) -> None:
+        """Record a failed request (or probe)."""
+        self._failure_count += 1
+        self._probing = False
+
+        if (
+            self._state is CircuitState.HALF_OPEN
+            or self._failure_count >= self._failure_threshold
+        ):
+            self._opened_at = time.monotonic()
+            self._state = CircuitState.OPEN
+
+    def record_success(self) -> None:
+        """Record a successful request (or probe)."""
+        self._failure_count = 0
+        self._probing = False
+        self._state = CircuitState.CLOSED
+
+    def try_begin_probe(self) -> bool:
+        """Attempt to become the single probe of a half-open circuit.
+
+        Returns
+        -------
+            Whether the caller should probe the server.
+
+        """
+        if self.state is not CircuitState.HALF_OPEN or self._probing:
+            return False
+        self._probing = True
+        return True
@@ -0,0 +1,196 @@
+"""Define a compact, columnar snapshot of bookmarks for analytics."""
+
+from __future__ import annotations
+
+from array import array
+from collections import Counter
+from typing import Any
+from urllib.parse import urlsplit
+
+from aiolinkding.util import to_timestamp
+
+SECONDS_PER_DAY = 86400
+
+# The value stored for missing or unparseable timestamps (the typed arrays can't hold
+# None); it is the lowest int64, so it can't collide with a real date:
+MISSING_TIMESTAMP = -(2**63)
+
+# The bookmark fields needed to build a snapshot:
+SNAPSHOT_FIELDS = (
+    "id",
+    "url",
+    "tag_names",
+    "date_added",
+    "date_modified",
+    "is_archived",
+    "unread",
+)
+
+TIMESTAMP_FIELDS = ("date_added", "date_modified")
+
+
+class BookmarkSnapshot:
+    """Define a columnar, dictionary-encoded snapshot of bookmarks.
+
+    Each bookmark occupies one row across a set of typed arrays: timestamps are
+    stored as int64 seconds (MISSING_TIMESTAMP if unknown), domains as indexes into a
+    table of distinct domains, and tags as a flat array of indexes into a table of
+    distinct tags (with an offsets array marking where each bookmark's tags begin).
+    Aggregations run over those arrays without materializing per-bookmark objects.
+    """
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._domain_codes: dict[str, int] = {}
+        self._tag_codes: dict[str, int] = {}
+
+        self.date_added = array("q")
+        self.date_modified = array("q")
+        self.domain_ids = array("i")
+        self.domains: list[str] = []
+        self.ids = array("q")
+        self.is_archived = array("b")
+        self.tag_ids = array("i")
+        self.tag_offsets = array("q", [0])
+        self.tags: list[str] = []
+        self.unread = array("b")
+
+    def __len__(self) -> int:
+        """Return the number of bookmarks in the snapshot.
+
+        Returns
+        -------
+            The number of bookmarks.
+
+        """
+        return len(self.ids)
+
+    @property
+    def nbytes(self) -> int:
+        """Return the approximate size (in bytes) of the snapshot's columns.
+
+        Returns
+        -------
+            The number of bytes used by the typed arrays.
+
+        """
+        return sum(
+            column.itemsize * len(column)
+            for column in (
+                self.date_added,
+                self.date_modified,
+                self.domain_ids,
+                self.ids,
+                self.is_archived,
+                self.tag_ids,
+                self.tag_offsets,
+                self.unread,
+            )
+        )
+
+    def append(self, bookmark: dict[str, Any]) -> None:
+        """Append a bookmark to the snapshot.
+
+        Args:
+        ----
+            bookmark: The bookmark (containing at least the snapshot fields).
+
+        """
+        domain = (urlsplit(bookmark.get("url", "")).hostname or "").lower()
+        if (domain_id := self._domain_codes.get(domain)) is None:
+            domain_id = self._domain_codes[domain] = len(self.domains)
+            self.domains.append(domain)
+
+        for tag_name in bookmark.get("tag_names", ()):
+            if (tag_id := self._tag_codes.get(tag_name)) is None:
+                tag_id = self._tag_codes[tag_name] = len(self.tags)
+                self.tags.append(tag_name)
+            self.tag_ids.append(tag_id)
+
+        for field in TIMESTAMP_FIELDS:
+            timestamp = to_timestamp(bookmark.get(field))
+            getattr(self, field).append(
+                MISSING_TIMESTAMP if timestamp is None else timestamp
+            )
+        self.domain_ids.append(domain_id)
+        self.ids.append(bookmark["id"])
+        self.is_archived.append(bool(bookmark.get("is_archived", False)))
+        self.tag_offsets.append(len(self.tag_ids))
+        self.unread.append(bool(bookmark.get("unread", False)))
+
+    def date_histogram(
+        self, *, interval: int = SECONDS_PER_DAY, field: str = "date_added"
+    ) -> dict[int, int]:
+        """Return the number of bookmarks per fixed-size time bucket.
+
+        Bookmarks with a missing or unparseable timestamp are left out.
+
+        Args:
+        ----
+            interval: The size of each bucket (in seconds).
+            field: The timestamp column to bucket ("date_added" or "date_modified").
+
+        Returns:
+        -------
+            A dict of bucket start (as a UNIX timestamp) to count, in time order.
+
+        Raises:
+        ------
+            ValueError: Raised upon an unknown timestamp field.
+
+        """
+        if field not in TIMESTAMP_FIELDS:
+            msg = f"Unknown timestamp field: {field}"
+            raise ValueError(msg)
+
+        counts = Counter(
+            timestamp // interval
+            for timestamp in getattr(self, field)
+            if timestamp != MISSING_TIMESTAMP
+        )
+        return {bucket * interval: counts[bucket] for bucket in sorted(counts)}
+
+    def domain_counts(self) -> dict[str, int]:
+        """Return the number of bookmarks per domain.
+
+        Returns
+        -------
+            A dict of domain to count, from most to least common.
+
+        """
+        return {
+            self.domains[domain_id]: count
+            for domain_id, count in Counter(self.domain_ids).most_common()
+        }
+
+    def tag_names(self, index: int) -> list[str]:
+        """Return the tag names of the bookmark at a row index.
+
+        Args:
+        ----
+            index: The row index of the bookmark.
+
+        Returns:
+        -------
+            The bookmark's tag names.
+
+        """
+        start, end = self.tag_offsets[index], self.tag_offsets[index + 1]
+        return [self.tags[tag_id] for tag_id in self.tag_ids[start:end]]
+
+    def top_tags(self, count: int = 10) -> list[tuple[str, int]]:
+        """Return the most frequently used tags.
+
+        Args:
+        ----
+            count: The number of tags to return.
+
+        Returns:
+        -------
+            A list of (tag name, number of bookmarks) tuples.
+
+        """
+        return [
+            (self.tags[tag_id], uses)
+            for tag_id, uses in Counter(self.tag_ids).most_common(count)
+        ]
@@ -0,0 +1,121 @@
+"""Define concurrency helpers for bulk operations."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable
+from typing import Any, TypeVar
+
+_T = TypeVar("_T")
+
+DEFAULT_BULK_CONCURRENCY = 8
+
+
+async def aiter_any(items: Iterable[_T] | AsyncIterable[_T]) -> AsyncIterator[_T]:
+    """Iterate over a sync or async iterable asynchronously.
+
+    Args:
+    ----
+        items: The iterable.
+
+    Yields:
+    ------
+        Each item.
+
+    """
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+async def aenumerate(
+    items: Iterable[_T] | AsyncIterable[_T],
+) -> AsyncIterator[tuple[int, _T]]:
+    """Enumerate a sync or async iterable asynchronously.
+
+    Args:
+    ----
+        items: The iterable.
+
+    Yields:
+    ------
+        (index, item) tuples.
+
+    """
+    index = 0
+    async for item in aiter_any(items):
+        yield index, item
+        index += 1
+
+
+def _limit(concurrency: int | Callable[[], int]) -> int:
+    """Return the current maximum number of concurrent calls.
+
+    Args:
+    ----
+        concurrency: The maximum number of concurrent calls (or a callable that
+            returns it).
+
+    Returns:
+    -------
+        The maximum number of concurrent calls.
+
+    """
+    return concurrency() if callable(concurrency) else concurrency
+
+
+async def async_run_bounded(
+    items: Iterable[_T] | AsyncIterable[_T],
+    func: Callable[[_T], Awaitable[Any]],
+    *,
+    concurrency: int | Callable[[], int] = DEFAULT_BULK_CONCURRENCY,
+) -> None:
+    """Run a coroutine function on every item with bounded concurrency.
+
+    Items are pulled lazily, so no more than ``concurrency`` items are held at once;
+    the concurrency may be a callable that returns the current limit (e.g., that of
+    an adaptive limiter), which is checked before every new item.
+
+    If any call fails, no further items are pulled, the calls that are already
+    running are allowed to finish (so that no write is cut off mid-request), and the
+    first error is raised. If this coroutine is cancelled, the running calls are
+    cancelled too.
+
+    Args:
+    ----
+        items: The items to process.
+        func: The coroutine function to run on each item.
+        concurrency: The maximum number of concurrent calls (or a callable that
+            returns it).
+
+    """
+    error: BaseException | None = None
+    pending: set[asyncio.Future[Any]] = set()
+
+    async def wait_for_one() -> None:
+        """Wait for at least one running call to finish (retrieving its error)."""
+        nonlocal error, pending
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            if (exception := task.exception()) is not None and error is None:
+                error = exception
+
+    try:
+        async for item in aiter_any(items):
+            pending.add(asyncio.ensure_future(func(item)))
+            while error is None and len(pending) >= _limit(concurrency):
+                await wait_for_one()
+            if error is not None:
+                break
+        while pending:
+            await wait_for_one()
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    if error is not None:
+        raise error
@@ -0,0 +1,52 @@
+"""Define deadlines that are shared by every request made within them."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+import time
+
+_DEADLINE: ContextVar[float | None] = ContextVar("aiolinkding_deadline", default=None)
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[None]:
+    """Bound every request made within the context to a total amount of time.
+
+    Each request is given whatever time remains in the budget; since the deadline is
+    stored in a context variable, it also applies to tasks spawned within the context
+    (e.g., concurrent pagination or fan-out tasks). Nested deadlines can only shorten
+    the budget, never extend it.
+
+    Args:
+    ----
+        seconds: The total number of seconds allowed.
+
+    Yields:
+    ------
+        Nothing.
+
+    """
+    expires_at = time.monotonic() + seconds
+    if (current := _DEADLINE.get()) is not None:
+        expires_at = min(expires_at, current)
+
+    token = _DEADLINE.set(expires_at)
+    try:
+        yield
+    finally:
+        _DEADLINE.reset(token)
+
+
+def remaining_time() -> float | None:
+    """Return the number of seconds left in the current deadline.
+
+    Returns
+    -------
+        The remaining number of seconds (or None if there is no deadline).
+
+    """
+    if (expires_at := _DEADLINE.get()) is None:
+        return None
+    return expires_at - time.monotonic()
@@ -0,0 +1,285 @@
+"""Define near-duplicate detection for bookmarks."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from enum import StrEnum
+import hashlib
+import re
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+# The bookmark fields needed to detect duplicates:
+DEDUPE_FIELDS = ("id", "url", "title", "website_title", "tag_names")
+
+DEFAULT_TITLE_DISTANCE = 3
+# Titles with fewer words than this are too generic (e.g., "Home") to compare:
+MIN_TITLE_WORDS = 3
+
+SIMHASH_BITS = 64
+
+TRACKING_PARAMS = frozenset(
+    {
+        "fbclid",
+        "gclid",
+        "igshid",
+        "mc_cid",
+        "mc_eid",
+        "msclkid",
+        "ref",
+        "ref_src",
+        "yclid",
+    }
+)
+TRACKING_PARAM_PREFIXES = ("utm_",)
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+class DuplicateReason(StrEnum):
+    """Define why bookmarks are considered duplicates."""
+
+    TITLE = "title"
+    URL = "url"
+
+
+@dataclass(slots=True)
+class DuplicateGroup:
+    """Define a group of bookmarks that are (likely) duplicates of each other."""
+
+    bookmarks: list[dict[str, Any]] = field(default_factory=list)
+    reasons: set[DuplicateReason] = field(default_factory=set)
+
+    @property
+    def ids(self) -> list[int]:
+        """Return the IDs of the bookmarks in the group.
+
+        Returns
+        -------
+            A list of bookmark IDs.
+
+        """
+        return [bookmark["id"] for bookmark in self.bookmarks]
+
+    def url_groups(self) -> list[DuplicateGroup]:
+        """Return the subgroups of bookmarks that share a canonical URL.
+
+        Returns
+        -------
+            DuplicateGroup objects (each with at least two bookmarks); bookmarks that
+            are only in the group because of their titles are left out.
+
+        """
+        by_url: dict[str, list[dict[str, Any]]] = {}
+        for bookmark in self.bookmarks:
+            by_url.setdefault(canonicalize_url(bookmark["url"]), []).append(bookmark)
+        return [
+            DuplicateGroup(bookmarks, {DuplicateReason.URL})
+            for bookmarks in by_url.values()
+            if len(bookmarks) > 1
+        ]
+
+
+def canonicalize_url(url: str) -> str:
+    """Return a canonical form of a URL for duplicate detection.
+
+    The scheme, "www."/"m."/"amp." host prefixes, default ports, fragments, tracking
+    query parameters, AMP path suffixes, and trailing slashes are dropped; the host
+    is lowercased and the remaining query parameters are sorted.
+
+    Args:
+    ----
+        url: The URL.
+
+    Returns:
+    -------
+        The canonical URL (which is a comparison key, not a fetchable URL).
+
+    """
+    parts = urlsplit(url.strip())
+    host = (parts.hostname or "").rstrip(".")
+    for prefix in ("www.", "m.", "amp."):
+        host = host.removeprefix(prefix)
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    if port is not None and port != DEFAULT_PORTS.get(parts.scheme.lower()):
+        host = f"{host}:{port}"
+
+    path = parts.path.rstrip("/")
+    for suffix in ("/amp", ".amp"):
+        path = path.removesuffix(suffix)
+    path = path.rstrip("/")
+
+    query = urlencode(
+        sorted(
+            (key, value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if key.lower() not in TRACKING_PARAMS
+            and not key.lower().startswith(TRACKING_PARAM_PREFIXES)
+            and key.lower() != "amp"
+        )
+    )
+
+    return f"{host}{path}?{query}" if query else f"{host}{path}"
+
+
+def simhash(text: str) -> int | None:
+    """Return the SimHash of a text's words.
+
+    Texts with similar words have SimHashes that differ in only a few bits.
+
+    Args:
+    ----
+        text: The text (e.g., a bookmark title).
+
+    Returns:
+    -------
+        A 64-bit fingerprint (or None if the text has too few words to compare).
+
+    """
+    words = _WORD_PATTERN.findall(text.lower())
+    if len(words) < MIN_TITLE_WORDS:
+        return None
+
+    weights = [0] * SIMHASH_BITS
+    for word in words:
+        digest = int.from_bytes(
+            hashlib.blake2b(word.encode(), digest_size=SIMHASH_BITS // 8).digest()
+        )
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += 1 if digest >> bit & 1 else -1
+
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+
+class DuplicateFinder:
+    """Define an object that groups (likely) duplicate bookmarks in a single pass.
+
+    Bookmarks with the same canonical URL are grouped through a hash table. Titles
+    are compared through SimHash bands: each bookmark is only compared with those
+    sharing at least one band of its fingerprint, so the work grows roughly linearly
+    with the collection (rather than comparing every pair). The fingerprint is split
+    into one more band than the title distance, so by the pigeonhole principle, two
+    titles within that distance always share a band; larger distances make for
+    narrower bands (and therefore more comparisons).
+    """
+
+    def __init__(self, *, title_distance: int | None = DEFAULT_TITLE_DISTANCE) -> None:
+        """Initialize.
+
+        Args:
+        ----
+            title_distance: The maximum number of differing SimHash bits for two
+                titles to be considered duplicates (None disables title matching).
+
+        Raises:
+        ------
+            ValueError: Raised upon a title distance outside of 0-63.
+
+        """
+        if title_distance is not None and not 0 <= title_distance < SIMHASH_BITS:
+            msg = f"The title distance must be between 0 and {SIMHASH_BITS - 1}"
+            raise ValueError(msg)
+
+        self._band_buckets: dict[tuple[int, int], list[int]] = {}
+        self._bookmarks: list[dict[str, Any]] = []
+        self._fingerprints: list[int | None] = []
+        self._parents: list[int] = []
+        self._reasons: list[tuple[int, DuplicateReason]] = []
+        self._title_distance = title_distance
+        self._urls: dict[str, int] = {}
+
+    def _find(self, index: int) -> int:
+        """Return the representative of a bookmark's group.
+
+        Args:
+        ----
+            index: The index of the bookmark.
+
+        Returns:
+        -------
+            The index of the group's representative.
+
+        """
+        while (parent := self._parents[index]) != index:
+            # Path halving keeps the trees shallow:
+            self._parents[index] = self._parents[parent]
+            index = parent
+        return index
+
+    def _union(self, index: int, other: int, reason: DuplicateReason) -> None:
+        """Merge the groups of two bookmarks.
+
+        Args:
+        ----
+            index: The index of a bookmark.
+            other: The index of another bookmark.
+            reason: Why the bookmarks are duplicates.
+
+        """
+        root, other_root = self._find(index), self._find(other)
+        if root != other_root:
+            self._parents[max(root, other_root)] = min(root, other_root)
+        self._reasons.append((index, reason))
+
+    def add(self, bookmark: dict[str, Any]) -> None:
+        """Add a bookmark.
+
+        Args:
+        ----
+            bookmark: The bookmark (containing at least its ID and URL).
+
+        """
+        index = len(self._bookmarks)
+        self._bookmarks.append(bookmark)
+        self._parents.append(index)
+
+        url = canonicalize_url(bookmark["url"])
+        if (other := self._urls.setdefault(url, index)) != index:
+            self._union(index, other, DuplicateReason.URL)
+
+        title = bookmark.get("title") or bookmark.get("website_title") or ""
+        fingerprint = None if self._title_distance is None else simhash(title)
+        self._fingerprints.append(fingerprint)
+        if fingerprint is None or self._title_distance is None:
+            return
+
+        bands = self._title_distance + 1
+        band_bits = SIMHASH_BITS // bands
+        candidates: dict[int, None] = {}
+        for band in range(bands):
+            key = (band, fingerprint >> (band * band_bits) & ((1 << band_bits) - 1))
+            bucket = self._band_buckets.setdefault(key, [])
+            candidates.update(dict.fromkeys(bucket))
+            bucket.append(index)
+
+        for other in candidates:
+            other_fingerprint = self._fingerprints[other]
+            if (
+                other_fingerprint is not None
+                and (fingerprint ^ other_fingerprint).bit_count()
+                <= self._title_distance
+            ):
+                self._union(index, other, DuplicateReason.TITLE)
+
+    def groups(self) -> list[DuplicateGroup]:
+        """Return the groups of duplicates found so far.
+
+        Returns
+        -------
+            DuplicateGroup objects (each with at least two bookmarks), in the order
+            their first bookmarks were added.
+
+        """
+        groups: dict[int, DuplicateGroup] = {}
+        for index, bookmark in enumerate(self._bookmarks):
+            groups.setdefault(self._find(index), DuplicateGroup()).bookmarks.append(
+                bookmark
+            )
+        for index, reason in self._reasons:
+            groups[self._find(index)].reasons.add(reason)
+        return [group for group in groups.values() if len(group.bookmarks) > 1]
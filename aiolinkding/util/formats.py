@@ -0,0 +1,258 @@
+"""Define streaming readers and writers for bookmark export formats."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+import csv
+from enum import StrEnum
+from html import escape
+from html.parser import HTMLParser
+import json
+from typing import IO, Any
+
+from aiolinkding.util import to_timestamp
+
+READ_CHUNK_SIZE = 64 * 1024
+
+CSV_FIELDS = (
+    "url",
+    "title",
+    "description",
+    "notes",
+    "tag_names",
+    "is_archived",
+    "unread",
+    "shared",
+    "date_added",
+)
+
+NETSCAPE_HEADER = """<!DOCTYPE NETSCAPE-Bookmark-file-1>
+<META HTTP-EQUIV="Content-Type" CONTENT="text/html; charset=UTF-8">
+<TITLE>Bookmarks</TITLE>
+<H1>Bookmarks</H1>
+<DL><p>
+"""
+NETSCAPE_FOOTER = "</DL><p>\n"
+
+
+class ExportFormat(StrEnum):
+    """Define the supported export/import formats."""
+
+    CSV = "csv"
+    HTML = "html"
+    NDJSON = "ndjson"
+
+
+def _parse_bool(value: object) -> bool:
+    """Parse a boolean from a CSV/HTML attribute value.
+
+    Args:
+    ----
+        value: The raw value.
+
+    Returns:
+    -------
+        The parsed boolean.
+
+    """
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in ("1", "true", "yes")
+
+
+class BookmarkWriter:
+    """Define an object that writes bookmarks to a text stream, one at a time."""
+
+    def __init__(
+        self, fp: IO[str], export_format: ExportFormat, *, resume: bool = False
+    ) -> None:
+        """Initialize.
+
+        Args:
+        ----
+            fp: A writable text stream.
+            export_format: The format to write.
+            resume: Continue a stream whose header has already been written.
+
+        """
+        self._format = export_format
+        self._fp = fp
+        self._csv_writer: Any = None
+
+        if export_format is ExportFormat.CSV:
+            self._csv_writer = csv.DictWriter(
+                fp, fieldnames=CSV_FIELDS, extrasaction="ignore"
+            )
+            if not resume:
+                self._csv_writer.writeheader()
+        elif export_format is ExportFormat.HTML and not resume:
+            fp.write(NETSCAPE_HEADER)
+
+    def close(self) -> None:
+        """Write any trailing content required by the format."""
+        if self._format is ExportFormat.HTML:
+            self._fp.write(NETSCAPE_FOOTER)
+
+    def write(self, bookmark: dict[str, Any]) -> None:
+        """Write a single bookmark.
+
+        Args:
+        ----
+            bookmark: The bookmark to write.
+
+        """
+        if self._format is ExportFormat.NDJSON:
+            self._fp.write(json.dumps(bookmark, separators=(",", ":")))
+            self._fp.write("\n")
+        elif self._format is ExportFormat.CSV:
+            self._csv_writer.writerow(
+                {**bookmark, "tag_names": " ".join(bookmark.get("tag_names", []))}
+            )
+        else:
+            self._write_html(bookmark)
+
+    def _write_html(self, bookmark: dict[str, Any]) -> None:
+        """Write a single bookmark as a Netscape bookmark entry.
+
+        Args:
+        ----
+            bookmark: The bookmark to write.
+
+        """
+        attrs = [f'HREF="{escape(bookmark["url"])}"']
+        if (added := to_timestamp(bookmark.get("date_added"))) is not None:
+            attrs.append(f'ADD_DATE="{added}"')
+        attrs.append(f'PRIVATE="{0 if bookmark.get("shared", False) else 1}"')
+        if bookmark.get("unread", False):
+            attrs.append('TOREAD="1"')
+        if bookmark.get("is_archived", False):
+            attrs.append('ARCHIVED="1"')
+        if tag_names := bookmark.get("tag_names"):
+            attrs.append(f'TAGS="{escape(",".join(tag_names))}"')
+
+        title = bookmark.get("title") or bookmark.get("website_title") or ""
+        self._fp.write(f"<DT><A {' '.join(attrs)}>{escape(title)}</A>\n")
+        if description := bookmark.get("description"):
+            self._fp.write(f"<DD>{escape(description)}\n")
+
+
+class _NetscapeParser(HTMLParser):
+    """Define an incremental parser for Netscape bookmark files."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        super().__init__(convert_charrefs=True)
+        self._current: dict[str, Any] | None = None
+        self._text: list[str] | None = None
+        self._text_field: str | None = None
+        self.completed: list[dict[str, Any]] = []
+
+    def _finish_text(self) -> None:
+        """Store any text being collected in the current bookmark."""
+        if self._current is not None and self._text_field is not None:
+            self._current[self._text_field] = "".join(self._text or []).strip()
+        self._text = None
+        self._text_field = None
+
+    def _finish_bookmark(self) -> None:
+        """Complete the current bookmark."""
+        self._finish_text()
+        if self._current is not None:
+            self.completed.append(self._current)
+        self._current = None
+
+    def close(self) -> None:
+        """Flush any remaining data."""
+        super().close()
+        self._finish_bookmark()
+
+    def handle_data(self, data: str) -> None:
+        """Handle text content.
+
+        Args:
+        ----
+            data: The text.
+
+        """
+        if self._text is not None:
+            self._text.append(data)
+
+    def handle_endtag(self, tag: str) -> None:
+        """Handle a closing tag.
+
+        Args:
+        ----
+            tag: The tag name.
+
+        """
+        if tag == "a":
+            self._finish_text()
+        elif tag == "dl":
+            self._finish_bookmark()
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        """Handle an opening tag.
+
+        Args:
+        ----
+            tag: The tag name.
+            attrs: The tag's attributes.
+
+        """
+        if tag in ("dt", "dl", "h3"):
+            self._finish_bookmark()
+        elif tag == "a":
+            self._finish_bookmark()
+            attributes = {key.lower(): value or "" for key, value in attrs}
+            tags = attributes.get("tags", "")
+            self._current = {
+                "url": attributes.get("href", ""),
+                "tag_names": [name for name in tags.split(",") if name],
+                "shared": attributes.get("private", "1") == "0",
+                "unread": _parse_bool(attributes.get("toread", "0")),
+                "is_archived": _parse_bool(attributes.get("archived", "0")),
+            }
+            self._text = []
+            self._text_field = "title"
+        elif tag == "dd" and self._current is not None:
+            self._finish_text()
+            self._text = []
+            self._text_field = "description"
+
+
+def iter_bookmarks(
+    fp: IO[str], export_format: ExportFormat
+) -> Iterator[dict[str, Any]]:
+    """Incrementally parse bookmarks from a text stream.
+
+    Args:
+    ----
+        fp: A readable text stream.
+        export_format: The format to read.
+
+    Yields:
+    ------
+        Bookmark dicts (suitable for creating new bookmarks).
+
+    """
+    if export_format is ExportFormat.NDJSON:
+        for line in fp:
+            if line.strip():
+                yield json.loads(line)
+    elif export_format is ExportFormat.CSV:
+        for row in csv.DictReader(fp):
+            yield {
+                **row,
+                "tag_names": (row.get("tag_names") or "").split(),
+                "is_archived": _parse_bool(row.get("is_archived", False)),
+                "unread": _parse_bool(row.get("unread", False)),
+                "shared": _parse_bool(row.get("shared", False)),
+            }
+    else:
+        parser = _NetscapeParser()
+        while chunk := fp.read(READ_CHUNK_SIZE):
+            parser.feed(chunk)
+            yield from parser.completed
+            parser.completed.clear()
+        parser.close()
+        yield from parser.completed
@@ -0,0 +1,219 @@
+"""Define an adaptive concurrency limiter."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+import math
+import time
+
+DEFAULT_INITIAL_LIMIT = 4
+DEFAULT_MIN_LIMIT = 1
+DEFAULT_MAX_LIMIT = 64
+DEFAULT_WINDOW_SIZE = 20
+
+DEFAULT_BACKOFF_RATIO = 0.5
+DEFAULT_LATENCY_TOLERANCE = 1.5
+
+# How quickly the latency baseline drifts toward higher observed latencies (so the
+# limiter eventually accepts a server that has become permanently slower):
+BASELINE_DRIFT = 0.05
+
+
+class AdaptiveLimiter:
+    """Define an AIMD concurrency limiter driven by observed latency and errors.
+
+    The limit grows by one after every window of requests whose p95 latency stays
+    within a tolerance of the best p95 seen so far, as long as the limit was actually
+    reached during that window; it's cut multiplicatively when the p95 rises above
+    that tolerance or when the server signals overload (e.g., an HTTP 429, an HTTP
+    5xx, or a timeout).
+
+    Like TCP congestion control, the limit is cut at most once per round trip: each
+    cut starts a new epoch, and requests that were already in flight when it happened
+    (and so were sent under the old limit) neither cut it again nor contribute
+    latency samples.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial_limit: int = DEFAULT_INITIAL_LIMIT,
+        min_limit: int = DEFAULT_MIN_LIMIT,
+        max_limit: int = DEFAULT_MAX_LIMIT,
+        window_size: int = DEFAULT_WINDOW_SIZE,
+        latency_tolerance: float = DEFAULT_LATENCY_TOLERANCE,
+        backoff_ratio: float = DEFAULT_BACKOFF_RATIO,
+    ) -> None:
+        """Initialize.
+
+        Args:
+        ----
+            initial_limit: The initial number of concurrent requests.
+            min_limit: The lowest the limit may go.
+            max_limit: The highest the limit may go.
+            window_size: The number of latency samples evaluated at once.
+            latency_tolerance: The ratio over the baseline p95 latency that is
+                considered a latency increase.
+            backoff_ratio: The ratio applied to the limit upon backing off.
+
+        """
+        self._backoff_ratio = backoff_ratio
+        self._baseline: float | None = None
+        self._epoch = 0
+        self._in_flight = 0
+        self._last_p95: float | None = None
+        self._latency_tolerance = latency_tolerance
+        self._limit = max(min_limit, min(initial_limit, max_limit))
+        self._max_limit = max_limit
+        self._min_limit = min_limit
+        self._samples: deque[float] = deque(maxlen=window_size)
+        self._saturated = False
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    @property
+    def in_flight(self) -> int:
+        """Return the number of requests currently in flight.
+
+        Returns
+        -------
+            The number of in-flight requests.
+
+        """
+        return self._in_flight
+
+    @property
+    def limit(self) -> int:
+        """Return the current concurrency limit.
+
+        Returns
+        -------
+            The current limit.
+
+        """
+        return self._limit
+
+    @property
+    def p95_latency(self) -> float | None:
+        """Return the p95 latency (in seconds) of the last evaluated window.
+
+        Returns
+        -------
+            The p95 latency (or None if no window has been evaluated yet).
+
+        """
+        return self._last_p95
+
+    def _back_off(self) -> None:
+        """Multiplicatively decrease the limit (starting a new epoch)."""
+        self._limit = max(
+            self._min_limit, math.floor(self._limit * self._backoff_ratio)
+        )
+        self._epoch += 1
+        self._samples.clear()
+        self._saturated = False
+
+    def _evaluate_window(self) -> None:
+        """Adjust the limit based on the latest full window of samples."""
+        ordered = sorted(self._samples)
+        p95 = ordered[min(len(ordered) - 1, math.ceil(len(ordered) * 0.95) - 1)]
+        self._last_p95 = p95
+        self._samples.clear()
+        saturated, self._saturated = self._saturated, False
+
+        if self._baseline is None or p95 < self._baseline:
+            self._baseline = p95
+        else:
+            self._baseline += (p95 - self._baseline) * BASELINE_DRIFT
+
+        if p95 > self._baseline * self._latency_tolerance:
+            self._back_off()
+        elif saturated:
+            # Only a limit that was actually reached has proven to be too low:
+            self._limit = min(self._max_limit, self._limit + 1)
+
+    async def _async_acquire(self) -> None:
+        """Wait for a free slot under the current limit."""
+        while self._in_flight >= self._limit:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                elif not waiter.cancelled():
+                    # We were woken up but cancelled before taking the slot, so pass
+                    # the wakeup along:
+                    self._wake_waiters()
+                raise
+        self._in_flight += 1
+        if self._in_flight >= self._limit:
+            self._saturated = True
+
+    def _release(self, request_slot: LimiterSlot, latency: float) -> None:
+        """Release a slot and record the outcome of the request that used it.
+
+        Args:
+        ----
+            request_slot: The released slot.
+            latency: The request's latency (in seconds).
+
+        """
+        self._in_flight -= 1
+
+        if request_slot.epoch != self._epoch:
+            # The limit was already cut while this request was in flight:
+            pass
+        elif request_slot.overloaded:
+            self._back_off()
+        else:
+            self._samples.append(latency)
+            if len(self._samples) == self._samples.maxlen:
+                self._evaluate_window()
+
+        self._wake_waiters()
+
+    def _wake_waiters(self) -> None:
+        """Wake up as many waiters as there are free slots."""
+        available = self._limit - self._in_flight
+        while available > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                available -= 1
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[LimiterSlot]:
+        """Hold a concurrency slot for the duration of a request.
+
+        Yields
+        ------
+            A LimiterSlot object that can be used to flag overload.
+
+        """
+        await self._async_acquire()
+        request_slot = LimiterSlot(self._epoch)
+        start = time.monotonic()
+
+        try:
+            yield request_slot
+        finally:
+            self._release(request_slot, time.monotonic() - start)
+
+
+class LimiterSlot:  # pylint: disable=too-few-public-methods
+    """Define a single held slot of an AdaptiveLimiter."""
+
+    def __init__(self, epoch: int) -> None:
+        """Initialize.
+
+        Args:
+        ----
+            epoch: The limiter's epoch when the slot was acquired.
+
+        """
+        self.epoch = epoch
+        self.overloaded = False
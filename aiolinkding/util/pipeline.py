@@ -0,0 +1,304 @@
+"""Define a bounded-memory pipeline for transform-and-write workloads."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterable, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+import time
+from typing import Any, Self
+
+from aiolinkding.util.concurrency import DEFAULT_BULK_CONCURRENCY, aiter_any
+
+DEFAULT_QUEUE_SIZE = 100
+
+_DONE = object()
+
+
+@dataclass(frozen=True, slots=True)
+class StageStats:
+    """Define a point-in-time view of a pipeline stage."""
+
+    name: str
+    concurrency: int
+    processed: int
+    dropped: int
+    active: int
+    queue_depth: int
+    max_queue_depth: int
+    elapsed: float
+
+    @property
+    def throughput(self) -> float:
+        """Return the number of items the stage processes per second.
+
+        Returns
+        -------
+            The throughput.
+
+        """
+        if self.elapsed <= 0:
+            return 0.0
+        return self.processed / self.elapsed
+
+
+class _Stage:  # pylint: disable=too-few-public-methods
+    """Define the mutable state of a pipeline stage."""
+
+    def __init__(
+        self,
+        name: str,
+        concurrency: int,
+        queue_size: int,
+    ) -> None:
+        """Initialize.
+
+        Args:
+        ----
+            name: The name of the stage.
+            concurrency: The number of workers.
+            queue_size: The size of the stage's input queue.
+
+        """
+        self.active = 0
+        self.concurrency = concurrency
+        self.dropped = 0
+        self.inbox: asyncio.Queue[Any] = asyncio.Queue(maxsize=queue_size)
+        self.max_queue_depth = 0
+        self.name = name
+        self.processed = 0
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
+
+    def snapshot(self) -> StageStats:
+        """Return a point-in-time view of the stage.
+
+        Returns
+        -------
+            A StageStats object.
+
+        """
+        return StageStats(
+            name=self.name,
+            concurrency=self.concurrency,
+            processed=self.processed,
+            dropped=self.dropped,
+            active=self.active,
+            queue_depth=self.inbox.qsize(),
+            max_queue_depth=self.max_queue_depth,
+            elapsed=self.elapsed,
+        )
+
+    @property
+    def elapsed(self) -> float:
+        """Return how long the stage has been (or was) running.
+
+        Returns
+        -------
+            The number of seconds.
+
+        """
+        if self.started_at is None:
+            return 0.0
+        if self.finished_at is None:
+            return time.monotonic() - self.started_at
+        return self.finished_at - self.started_at
+
+
+class Pipeline:
+    """Define a chain of concurrent stages connected by bounded queues.
+
+    Items flow from a source through any number of transform stages into a sink.
+    Each stage runs a coroutine function with its own concurrency, and the bounded
+    queue in front of each stage applies backpressure: when a stage falls behind, the
+    stages before it (and ultimately the source) wait, so memory stays bounded by the
+    queue sizes. A transform that returns None drops the item. Items may be
+    reordered by stages with a concurrency above 1.
+    """
+
+    def __init__(
+        self,
+        source: Iterable[Any] | AsyncIterable[Any],
+        *,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+    ) -> None:
+        """Initialize.
+
+        Args:
+        ----
+            source: The items to process (e.g., client.bookmarks.async_iter_all()).
+            queue_size: The number of items buffered in front of each stage.
+
+        """
+        self._queue_size = queue_size
+        self._source = source
+        self._source_stage = _Stage("source", 1, 0)
+        self._stages: list[tuple[_Stage, Callable[[Any], Awaitable[Any]]]] = []
+
+    @property
+    def stats(self) -> list[StageStats]:
+        """Return a point-in-time view of every stage (source first).
+
+        Returns
+        -------
+            A list of StageStats objects.
+
+        """
+        return [
+            self._source_stage.snapshot(),
+            *(stage.snapshot() for stage, _ in self._stages),
+        ]
+
+    def sink(
+        self,
+        func: Callable[[Any], Awaitable[Any]],
+        *,
+        name: str = "sink",
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> Self:
+        """Add the final stage (whose results are discarded).
+
+        Args:
+        ----
+            func: The coroutine function to run on each item (e.g., an update).
+            name: The name of the stage.
+            concurrency: The number of items processed concurrently.
+
+        Returns:
+        -------
+            This pipeline.
+
+        """
+        return self.stage(func, name=name, concurrency=concurrency)
+
+    def stage(
+        self,
+        func: Callable[[Any], Awaitable[Any]],
+        *,
+        name: str | None = None,
+        concurrency: int = 1,
+    ) -> Self:
+        """Add a transform stage.
+
+        Args:
+        ----
+            func: The coroutine function to run on each item; its result is passed
+                to the next stage (or dropped if it's None).
+            name: An optional name for the stage (defaults to the function's name).
+            concurrency: The number of items processed concurrently.
+
+        Returns:
+        -------
+            This pipeline.
+
+        """
+        if name is None:
+            # Callables such as functools.partial objects have no name of their own:
+            name = str(getattr(func, "__name__", f"stage{len(self._stages) + 1}"))
+        self._stages.append((_Stage(name, concurrency, self._queue_size), func))
+        return self
+
+    async def _async_put(self, stage: _Stage | None, item: Any) -> None:  # noqa: ANN401
+        """Put an item into a stage's input queue (waiting if it's full).
+
+        Args:
+        ----
+            stage: The stage (or None if the item leaves the pipeline).
+            item: The item.
+
+        """
+        if stage is None:
+            return
+        await stage.inbox.put(item)
+        stage.max_queue_depth = max(stage.max_queue_depth, stage.inbox.qsize())
+
+    async def _async_pump(self, outbox: _Stage | None) -> None:
+        """Feed the source's items into the first stage.
+
+        Args:
+        ----
+            outbox: The first stage.
+
+        """
+        self._source_stage.started_at = time.monotonic()
+        try:
+            async for item in aiter_any(self._source):
+                self._source_stage.processed += 1
+                await self._async_put(outbox, item)
+        finally:
+            self._source_stage.finished_at = time.monotonic()
+        await self._async_put(outbox, _DONE)
+
+    async def _async_run_stage(
+        self,
+        stage: _Stage,
+        func: Callable[[Any], Awaitable[Any]],
+        outbox: _Stage | None,
+    ) -> None:
+        """Run a stage's workers until its input is exhausted.
+
+        Args:
+        ----
+            stage: The stage.
+            func: The coroutine function the stage runs.
+            outbox: The next stage (or None for the sink).
+
+        """
+
+        async def work() -> None:
+            """Process items until the end of the stream."""
+            while (item := await stage.inbox.get()) is not _DONE:
+                stage.active += 1
+                try:
+                    result = await func(item)
+                finally:
+                    stage.active -= 1
+
+                if outbox is not None and result is None:
+                    stage.dropped += 1
+                    continue
+                stage.processed += 1
+                await self._async_put(outbox, result)
+
+            # Let sibling workers see the end of the stream, too:
+            stage.inbox.put_nowait(_DONE)
+
+        stage.started_at = time.monotonic()
+        try:
+            await asyncio.gather(*(work() for _ in range(stage.concurrency)))
+        finally:
+            stage.finished_at = time.monotonic()
+        stage.inbox.get_nowait()
+        await self._async_put(outbox, _DONE)
+
+    async def async_run(self) -> list[StageStats]:
+        """Run the pipeline to completion.
+
+        If any stage fails, every other stage is cancelled and the error is raised.
+
+        Returns
+        -------
+            The final stats of every stage (source first).
+
+        """
+        outboxes: list[_Stage | None] = [*(stage for stage, _ in self._stages), None]
+        tasks = [
+            asyncio.ensure_future(self._async_pump(outboxes[0])),
+            *(
+                asyncio.ensure_future(
+                    self._async_run_stage(stage, func, outboxes[index + 1])
+                )
+                for index, (stage, func) in enumerate(self._stages)
+            ),
+        ]
+
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in done:
+                task.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        return self.stats
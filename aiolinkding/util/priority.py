@@ -0,0 +1,264 @@
+"""Define priority classes and a weighted fair scheduler for requests."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Coroutine, Iterator, Mapping
+from contextlib import AbstractContextManager, asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from enum import StrEnum
+from functools import wraps
+from typing import Any, ParamSpec, TypeVar
+
+_P = ParamSpec("_P")
+_T = TypeVar("_T")
+
+DEFAULT_MAX_IN_FLIGHT = 8
+
+
+class Priority(StrEnum):
+    """Define the priority classes of requests."""
+
+    BULK = "bulk"
+    INTERACTIVE = "interactive"
+    NORMAL = "normal"
+
+
+DEFAULT_WEIGHTS: Mapping[Priority, float] = {
+    Priority.BULK: 1.0,
+    Priority.INTERACTIVE: 8.0,
+    Priority.NORMAL: 4.0,
+}
+
+_PRIORITY: ContextVar[Priority | None] = ContextVar(
+    "aiolinkding_priority", default=None
+)
+
+
+def current_priority() -> Priority:
+    """Return the priority class of requests made in the current context.
+
+    Returns
+    -------
+        The current priority class (NORMAL if none has been set).
+
+    """
+    return _PRIORITY.get() or Priority.NORMAL
+
+
+@contextmanager
+def priority(level: Priority | str, *, override: bool = True) -> Iterator[None]:
+    """Assign a priority class to every request made within the context.
+
+    Like deadlines, the priority is stored in a context variable, so it also applies
+    to tasks spawned within the context.
+
+    Args:
+    ----
+        level: The priority class.
+        override: Replace a priority class that is already set by an outer context
+            (if False, the level only applies when no priority has been set).
+
+    Yields:
+    ------
+        Nothing.
+
+    """
+    if not override and _PRIORITY.get() is not None:
+        yield
+        return
+
+    token = _PRIORITY.set(Priority(level))
+    try:
+        yield
+    finally:
+        _PRIORITY.reset(token)
+
+
+def background_priority() -> AbstractContextManager[None]:
+    """Return a context that marks requests as bulk unless a priority is already set.
+
+    Returns
+    -------
+        A context manager.
+
+    """
+    return priority(Priority.BULK, override=False)
+
+
+def background(
+    func: Callable[_P, Coroutine[Any, Any, _T]],
+) -> Callable[_P, Coroutine[Any, Any, _T]]:
+    """Decorate a coroutine function so that its requests default to bulk priority.
+
+    Args:
+    ----
+        func: The coroutine function to decorate.
+
+    Returns:
+    -------
+        The decorated coroutine function.
+
+    """
+
+    @wraps(func)
+    async def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _T:
+        """Run the coroutine function within a background priority context.
+
+        Args:
+        ----
+            *args: Positional arguments for the coroutine function.
+            **kwargs: Keyword arguments for the coroutine function.
+
+        Returns:
+        -------
+            The coroutine function's result.
+
+        """
+        with background_priority():
+            return await func(*args, **kwargs)
+
+    return wrapper
+
+
+class PriorityScheduler:
+    """Define a weighted fair queuing scheduler with its own in-flight cap.
+
+    Requests run immediately while the cap isn't reached; beyond that, they queue per
+    priority class. Each request is stamped with a virtual finish time when it arrives
+    (its class's previous finish time, or the current virtual time if the class was
+    idle, plus the inverse of the class's weight), and freed slots go to the queued
+    request with the smallest one. Busy classes therefore share slots in proportion to
+    their weights, and no class is starved.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        weights: Mapping[Priority | str, float] | None = None,
+    ) -> None:
+        """Initialize.
+
+        Args:
+        ----
+            max_in_flight: The maximum number of requests in flight at once.
+            weights: Optional weights per priority class (merged with the defaults).
+
+        """
+        self._finish_times = dict.fromkeys(Priority, 0.0)
+        self._in_flight = 0
+        self._max_in_flight = max_in_flight
+        self._queues: dict[
+            Priority, deque[tuple[float, float, asyncio.Future[None]]]
+        ] = {level: deque() for level in Priority}
+        self._virtual_time = 0.0
+        self._weights = {
+            **DEFAULT_WEIGHTS,
+            **{Priority(level): weight for level, weight in (weights or {}).items()},
+        }
+
+    @property
+    def in_flight(self) -> int:
+        """Return the number of requests currently in flight.
+
+        Returns
+        -------
+            The number of in-flight requests.
+
+        """
+        return self._in_flight
+
+    @property
+    def queued(self) -> dict[Priority, int]:
+        """Return the number of queued requests per priority class.
+
+        Returns
+        -------
+            A dict of priority class to queue length.
+
+        """
+        return {level: len(queue) for level, queue in self._queues.items()}
+
+    def _stamp(self, level: Priority) -> tuple[float, float]:
+        """Return the virtual start and finish times of a newly arrived request.
+
+        Args:
+        ----
+            level: The priority class of the request.
+
+        Returns:
+        -------
+            A (start, finish) tuple.
+
+        """
+        # A class that has been idle doesn't get to bank credit from that time:
+        start = max(self._finish_times[level], self._virtual_time)
+        finish = self._finish_times[level] = start + 1 / self._weights[level]
+        return start, finish
+
+    def _dispatch(self) -> None:
+        """Grant free slots to queued requests in weighted fair order."""
+        while self._in_flight < self._max_in_flight:
+            heads = [queue for queue in self._queues.values() if queue]
+            if not heads:
+                return
+
+            start, _, waiter = min(heads, key=lambda queue: queue[0][1]).popleft()
+            if not waiter.done():
+                self._virtual_time = start
+                self._in_flight += 1
+                waiter.set_result(None)
+
+    def _release(self) -> None:
+        """Release a slot."""
+        self._in_flight -= 1
+        self._dispatch()
+
+    async def _async_acquire(self, level: Priority) -> None:
+        """Wait for a slot.
+
+        Args:
+        ----
+            level: The priority class of the request.
+
+        """
+        start, finish = self._stamp(level)
+
+        if self._in_flight < self._max_in_flight and not any(self._queues.values()):
+            self._virtual_time = start
+            self._in_flight += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        entry = (start, finish, waiter)
+        self._queues[level].append(entry)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if entry in self._queues[level]:
+                self._queues[level].remove(entry)
+            elif not waiter.cancelled():
+                # We were granted a slot but cancelled before using it, so hand it on:
+                self._release()
+            raise
+
+    @asynccontextmanager
+    async def slot(self, level: Priority | None = None) -> AsyncIterator[None]:
+        """Hold a slot for the duration of a request.
+
+        Args:
+        ----
+            level: The priority class (defaults to the current context's).
+
+        Yields:
+        ------
+            Nothing.
+
+        """
+        await self._async_acquire(level or current_priority())
+        try:
+            yield
+        finally:
+            self._release()
@@ -0,0 +1,98 @@
+"""Define progress tracking for bulk operations."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+import time
+
+DEFAULT_PROGRESS_INTERVAL = 1000
+
+
+@dataclass(slots=True)
+class Progress:
+    """Define the progress of a bulk operation."""
+
+    processed: int = 0
+    skipped: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def elapsed(self) -> float:
+        """Return the number of seconds since the operation started.
+
+        Returns
+        -------
+            The elapsed number of seconds.
+
+        """
+        return time.monotonic() - self.started_at
+
+    @property
+    def rate(self) -> float:
+        """Return the number of processed rows per second.
+
+        Returns
+        -------
+            The processing rate.
+
+        """
+        if (elapsed := self.elapsed) <= 0:
+            return 0.0
+        return self.processed / elapsed
+
+
+ProgressCallback = Callable[[Progress], None]
+
+
+class ProgressReporter:  # pylint: disable=too-few-public-methods
+    """Define an object that reports progress at a fixed row interval."""
+
+    def __init__(
+        self,
+        callback: ProgressCallback | None,
+        *,
+        interval: int = DEFAULT_PROGRESS_INTERVAL,
+    ) -> None:
+        """Initialize.
+
+        Args:
+        ----
+            callback: An optional callable that receives progress updates.
+            interval: The number of rows between progress updates.
+
+        """
+        self._callback = callback
+        self._interval = interval
+        self.progress = Progress()
+
+    def advance(self, *, skipped: bool = False) -> None:
+        """Record one more row (reporting progress if an interval was reached).
+
+        Args:
+        ----
+            skipped: Whether the row was skipped rather than processed.
+
+        """
+        if skipped:
+            self.progress.skipped += 1
+        else:
+            self.progress.processed += 1
+
+        if (
+            self._callback is not None
+            and (self.progress.processed + self.progress.skipped) % self._interval == 0
+        ):
+            self._callback(self.progress)
+
+    def finish(self) -> Progress:
+        """Report the final progress.
+
+        Returns
+        -------
+            The final progress.
+
+        """
+        if self._callback is not None:
+            self._callback(self.progress)
+        return self.progress
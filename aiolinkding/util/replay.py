@@ -0,0 +1,338 @@
+"""Define transports that record and replay API traffic."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict, deque
+from collections.abc import AsyncIterator, Mapping
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+import gzip
+import json
+from pathlib import Path
+import time
+from typing import IO, Any, Protocol, Self
+
+from aiohttp import ClientSession, ClientTimeout, ContentTypeError, RequestInfo
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+from aiolinkding.errors import RequestError
+
+REDACTED = "**REDACTED**"
+
+_ExchangeKey = tuple[str, str, str, str]
+
+
+class TransportResponse(Protocol):
+    """Define the parts of an aiohttp ClientResponse used by the client."""
+
+    @property
+    def headers(self) -> Mapping[str, str]:
+        """Return the response headers."""
+
+    @property
+    def status(self) -> int:
+        """Return the HTTP status."""
+
+    async def json(self) -> Any:  # noqa: ANN401
+        """Return the decoded JSON body."""
+
+
+class Transport(Protocol):
+    """Define the parts of an aiohttp ClientSession used by the client."""
+
+    def request(
+        self,
+        method: str,
+        url: str | URL,
+        *,
+        headers: Mapping[str, str] | None = None,
+        json: Any = None,  # noqa: ANN401
+        params: Mapping[str, Any] | None = None,
+        timeout: ClientTimeout | None = None,
+    ) -> AbstractAsyncContextManager[TransportResponse]:
+        """Return an async context manager that yields a response."""
+
+
+def _exchange_key(
+    method: str, url: str | URL, kwargs: Mapping[str, Any]
+) -> _ExchangeKey:
+    """Return the key that identifies a request (regardless of host).
+
+    Args:
+    ----
+        method: An HTTP method.
+        url: The request URL.
+        kwargs: The request kwargs.
+
+    Returns:
+    -------
+        A (method, path, query, body) tuple.
+
+    """
+    url = URL(url)
+    # A query string embedded in the endpoint and one passed via params are sent the
+    # same way, so both count towards the key:
+    query = [*url.query.items(), *(kwargs.get("params") or {}).items()]
+    return (
+        method.upper(),
+        url.path,
+        json.dumps(
+            sorted((str(key), str(value)) for key, value in query),
+            separators=(",", ":"),
+        ),
+        json.dumps(kwargs.get("json"), sort_keys=True, separators=(",", ":")),
+    )
+
+
+class _RecordingResponse:
+    """Define a response proxy that captures the decoded body."""
+
+    def __init__(self, response: Any) -> None:  # noqa: ANN401
+        """Initialize.
+
+        Args:
+        ----
+            response: The underlying aiohttp response.
+
+        """
+        self._response = response
+        self.body: Any = None
+        self.headers = response.headers
+        self.is_json = True
+        self.status: int = response.status
+
+    async def json(self) -> Any:  # noqa: ANN401
+        """Decode (and capture) the JSON body.
+
+        Returns
+        -------
+            The decoded body.
+
+        """
+        try:
+            self.body = await self._response.json()
+        except ContentTypeError:
+            self.is_json = False
+            raise
+        return self.body
+
+
+class RecordingTransport:
+    """Define a transport that records every exchange made over a real session.
+
+    Exchanges are appended to a gzip-compressed NDJSON file; authorization headers
+    are never written, and the API token is scrubbed from anything that is.
+    """
+
+    def __init__(self, session: ClientSession, path: str | Path) -> None:
+        """Initialize.
+
+        Args:
+        ----
+            session: The aiohttp ClientSession to send requests over.
+            path: The file to record exchanges to.
+
+        """
+        self._fp: IO[str] = gzip.open(path, "at", encoding="utf-8")  # noqa: SIM115
+        self._secrets: set[str] = set()
+        self._session = session
+
+    def __enter__(self) -> Self:
+        """Enter the context manager.
+
+        Returns
+        -------
+            This transport.
+
+        """
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Exit the context manager (closing the recording).
+
+        Args:
+        ----
+            *exc_info: Exception info (if any).
+
+        """
+        self.close()
+
+    def _write(self, exchange: dict[str, Any]) -> None:
+        """Write a single exchange (with secrets redacted).
+
+        Args:
+        ----
+            exchange: The exchange to write.
+
+        """
+        line = json.dumps(exchange, separators=(",", ":"))
+        for secret in self._secrets:
+            line = line.replace(secret, REDACTED)
+        self._fp.write(line)
+        self._fp.write("\n")
+
+    def close(self) -> None:
+        """Flush and close the recording (the session itself is left open)."""
+        self._fp.close()
+
+    @asynccontextmanager
+    async def request(
+        self,
+        method: str,
+        url: str | URL,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> AsyncIterator[_RecordingResponse]:
+        """Send a request and record the exchange.
+
+        Args:
+        ----
+            method: An HTTP method.
+            url: The request URL.
+            **kwargs: Additional kwargs to send with the request.
+
+        Yields:
+        ------
+            A response.
+
+        """
+        if authorization := (kwargs.get("headers") or {}).get("Authorization"):
+            self._secrets.add(authorization.partition(" ")[2] or authorization)
+
+        start = time.monotonic()
+        async with self._session.request(method, url, **kwargs) as resp:
+            response = _RecordingResponse(resp)
+            try:
+                yield response
+            finally:
+                method_, path, params, body = _exchange_key(method, url, kwargs)
+                self._write(
+                    {
+                        "method": method_,
+                        "path": path,
+                        "params": json.loads(params),
+                        "json": json.loads(body),
+                        "status": response.status,
+                        "headers": list(response.headers.items()),
+                        "is_json": response.is_json,
+                        "body": response.body,
+                        "latency": time.monotonic() - start,
+                    }
+                )
+
+
+class _ReplayResponse:
+    """Define a response served from a recording."""
+
+    def __init__(self, method: str, url: URL, exchange: Mapping[str, Any]) -> None:
+        """Initialize.
+
+        Args:
+        ----
+            method: An HTTP method.
+            url: The request URL.
+            exchange: The recorded exchange.
+
+        """
+        self._exchange = exchange
+        self._request_info = RequestInfo(url, method, CIMultiDictProxy(CIMultiDict()))
+        self.headers: CIMultiDictProxy[str] = CIMultiDictProxy(
+            CIMultiDict(exchange["headers"])
+        )
+        self.status: int = exchange["status"]
+
+    async def json(self) -> Any:  # noqa: ANN401
+        """Return the recorded JSON body.
+
+        Returns
+        -------
+            The recorded body.
+
+        Raises
+        ------
+            ContentTypeError: Raised when the recorded response had no JSON body.
+
+        """
+        if not self._exchange["is_json"]:
+            raise ContentTypeError(self._request_info, (), status=self.status)
+        return self._exchange["body"]
+
+
+class ReplayTransport:
+    """Define a transport that serves recorded exchanges without a network.
+
+    Requests are matched by method, path, query parameters, and JSON body (but not
+    host, so a recording can be replayed against any URL). Repeated requests are
+    served the recorded responses in order, cycling once they run out.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        simulate_latency: bool = False,
+        latency_scale: float = 1.0,
+    ) -> None:
+        """Initialize.
+
+        Args:
+        ----
+            path: The recording to replay.
+            simulate_latency: Delay each response by its recorded latency.
+            latency_scale: A factor applied to recorded latencies.
+
+        """
+        self._exchanges: defaultdict[_ExchangeKey, deque[dict[str, Any]]] = defaultdict(
+            deque
+        )
+        self._latency_scale = latency_scale
+        self._simulate_latency = simulate_latency
+
+        with gzip.open(path, "rt", encoding="utf-8") as fp:
+            for line in fp:
+                if not line.strip():
+                    continue
+                exchange = json.loads(line)
+                key = _exchange_key(
+                    exchange["method"],
+                    exchange["path"],
+                    {"params": dict(exchange["params"]), "json": exchange["json"]},
+                )
+                self._exchanges[key].append(exchange)
+
+    @asynccontextmanager
+    async def request(
+        self,
+        method: str,
+        url: str | URL,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> AsyncIterator[_ReplayResponse]:
+        """Serve a recorded response.
+
+        Args:
+        ----
+            method: An HTTP method.
+            url: The request URL.
+            **kwargs: Additional kwargs sent with the request.
+
+        Yields:
+        ------
+            A response.
+
+        Raises:
+        ------
+            RequestError: Raised when the request was never recorded.
+
+        """
+        key = _exchange_key(method, url, kwargs)
+        if not (exchanges := self._exchanges.get(key)):
+            msg = f"No recorded response for {key[0]} {key[1]}"
+            raise RequestError(msg)
+
+        exchange = exchanges[0]
+        exchanges.rotate(-1)
+
+        if self._simulate_latency:
+            await asyncio.sleep(exchange["latency"] * self._latency_scale)
+
+        yield _ReplayResponse(method, URL(url), exchange)
@@ -0,0 +1,129 @@
+"""Define helpers for creating pooled aiohttp sessions."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import socket
+import time
+
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+from aiohttp.abc import AbstractResolver, ResolveResult
+from aiohttp.resolver import DefaultResolver
+
+DEFAULT_CONNECTION_LIMIT = 100
+DEFAULT_DNS_CACHE_SIZE = 256
+DEFAULT_DNS_TTL = 300.0
+DEFAULT_KEEPALIVE_TIMEOUT = 60.0
+
+DNSCache = OrderedDict[tuple[str, int, int], tuple[float, list[ResolveResult]]]
+
+# A process-wide DNS cache, shared by every CachingResolver that doesn't bring its
+# own (and therefore by every session created by create_session):
+_SHARED_DNS_CACHE: DNSCache = OrderedDict()
+
+
+class CachingResolver(AbstractResolver):
+    """Define a DNS resolver that caches results (with a TTL) across sessions.
+
+    The cache holds at most max_size hosts; the least recently used entry is evicted
+    to make room for a new one.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = DEFAULT_DNS_TTL,
+        max_size: int = DEFAULT_DNS_CACHE_SIZE,
+        resolver: AbstractResolver | None = None,
+        cache: DNSCache | None = None,
+    ) -> None:
+        """Initialize.
+
+        Args:
+        ----
+            ttl: The number of seconds for which a result is cached.
+            max_size: The maximum number of cached results.
+            resolver: The resolver to use upon a cache miss (defaults to aiohttp's).
+            cache: An optional cache (defaults to a process-wide cache).
+
+        """
+        self._cache = _SHARED_DNS_CACHE if cache is None else cache
+        self._max_size = max_size
+        self._resolver = resolver or DefaultResolver()
+        self._ttl = ttl
+
+    async def close(self) -> None:
+        """Close the underlying resolver."""
+        await self._resolver.close()
+
+    async def resolve(
+        self, host: str, port: int = 0, family: socket.AddressFamily = socket.AF_INET
+    ) -> list[ResolveResult]:
+        """Resolve a host (from the cache, if possible).
+
+        Args:
+        ----
+            host: The host to resolve.
+            port: The port to resolve.
+            family: The address family.
+
+        Returns:
+        -------
+            A list of resolved addresses.
+
+        """
+        key = (host, port, family)
+        now = time.monotonic()
+
+        if (entry := self._cache.get(key)) is not None and entry[0] > now:
+            self._cache.move_to_end(key)
+            return entry[1]
+
+        results = await self._resolver.resolve(host, port, family)
+        self._cache[key] = (now + self._ttl, results)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._max_size:
+            self._cache.popitem(last=False)
+        return results
+
+
+def clear_dns_cache() -> None:
+    """Clear the process-wide DNS cache."""
+    _SHARED_DNS_CACHE.clear()
+
+
+def create_session(
+    *,
+    timeout: ClientTimeout | None = None,
+    connection_limit: int = DEFAULT_CONNECTION_LIMIT,
+    dns_ttl: float = DEFAULT_DNS_TTL,
+    keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+) -> ClientSession:
+    """Create a ClientSession tuned for long-lived, pooled use.
+
+    DNS results are cached by a CachingResolver (rather than by the connector) so that
+    they are shared by every session created here.
+
+    Note that this must be called from within a running event loop.
+
+    Args:
+    ----
+        timeout: An optional default timeout for the session's requests.
+        connection_limit: The maximum number of pooled connections.
+        dns_ttl: The number of seconds for which DNS results are cached.
+        keepalive_timeout: The number of seconds idle connections are kept open.
+
+    Returns:
+    -------
+        A ClientSession.
+
+    """
+    connector = TCPConnector(
+        keepalive_timeout=keepalive_timeout,
+        limit=connection_limit,
+        resolver=CachingResolver(ttl=dns_ttl),
+        use_dns_cache=False,
+    )
+    if timeout is None:
+        return ClientSession(connector=connector)
+    return ClientSession(connector=connector, timeout=timeout)
@@ -0,0 +1,195 @@
+"""Define a polling watcher that emits bookmark change events."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any
+
+from aiolinkding.util.priority import background
+
+if TYPE_CHECKING:
+    from aiolinkding.bookmark import BookmarkManager
+
+DEFAULT_MIN_INTERVAL = 5.0
+DEFAULT_MAX_INTERVAL = 300.0
+DEFAULT_BACKOFF = 2.0
+
+# The smallest set of fields needed to detect changes:
+STATE_FIELDS = ("id", "date_modified", "is_archived")
+
+
+class BookmarkEventType(StrEnum):
+    """Define the types of bookmark change events."""
+
+    ADDED = "added"
+    ARCHIVED = "archived"
+    DELETED = "deleted"
+    UNARCHIVED = "unarchived"
+    UPDATED = "updated"
+
+
+@dataclass(frozen=True, slots=True)
+class BookmarkEvent:
+    """Define a bookmark change event."""
+
+    type: BookmarkEventType
+    bookmark_id: int
+    bookmark: dict[str, Any] | None = None
+
+
+class BookmarkWatcher:
+    """Define an object that detects bookmark changes as cheaply as possible.
+
+    The watcher keeps a compact map of bookmark ID to (date_modified, is_archived).
+    Each poll asks for bookmarks modified since the newest modification seen so far
+    (which the server filters for us) and compares the server's bookmark counts with
+    the expected counts; only when those disagree (i.e., a bookmark was deleted) does
+    it scan every bookmark ID.
+    """
+
+    def __init__(
+        self,
+        manager: BookmarkManager,
+        *,
+        min_interval: float = DEFAULT_MIN_INTERVAL,
+        max_interval: float = DEFAULT_MAX_INTERVAL,
+        backoff: float = DEFAULT_BACKOFF,
+        page_size: int,
+    ) -> None:
+        """Initialize.
+
+        Args:
+        ----
+            manager: The bookmark manager to use.
+            min_interval: The polling interval (in seconds) during activity.
+            max_interval: The longest polling interval (in seconds) when idle.
+            backoff: The factor by which the interval grows after an idle poll.
+            page_size: The number of bookmarks to request per page.
+
+        """
+        self._backoff = backoff
+        self._manager = manager
+        self._max_interval = max_interval
+        self._min_interval = min_interval
+        self._page_size = page_size
+        self._state: dict[int, tuple[str, bool]] = {}
+        self._watermark: str | None = None
+        self.interval = min_interval
+
+    async def _async_count(self, *, archived: bool) -> int:
+        """Return the server's number of (active or archived) bookmarks.
+
+        Args:
+        ----
+            archived: Count archived bookmarks instead.
+
+        Returns:
+        -------
+            The number of bookmarks.
+
+        """
+        if archived:
+            data = await self._manager.async_get_archived(limit=1, fields=())
+        else:
+            data = await self._manager.async_get_all(limit=1, fields=())
+        return int(data["count"])
+
+    async def _async_find_deleted(self) -> list[BookmarkEvent]:
+        """Scan every bookmark ID and return events for the missing ones.
+
+        Returns
+        -------
+            A list of deletion events.
+
+        """
+        seen: set[int] = set()
+        for archived in (False, True):
+            async for bookmark in self._manager.async_iter_all(
+                archived=archived, page_size=self._page_size, fields=("id",)
+            ):
+                seen.add(bookmark["id"])
+
+        deleted = [
+            bookmark_id for bookmark_id in self._state if bookmark_id not in seen
+        ]
+        for bookmark_id in deleted:
+            del self._state[bookmark_id]
+        return [
+            BookmarkEvent(BookmarkEventType.DELETED, bookmark_id)
+            for bookmark_id in deleted
+        ]
+
+    def _record(self, bookmark: dict[str, Any]) -> None:
+        """Record the state of a bookmark.
+
+        Args:
+        ----
+            bookmark: The bookmark (containing at least the state fields).
+
+        """
+        self._state[bookmark["id"]] = (
+            bookmark["date_modified"],
+            bookmark["is_archived"],
+        )
+        if self._watermark is None or bookmark["date_modified"] > self._watermark:
+            self._watermark = bookmark["date_modified"]
+
+    @background
+    async def async_poll(self) -> list[BookmarkEvent]:
+        """Poll the server once and return any changes since the previous poll.
+
+        Returns
+        -------
+            A list of change events.
+
+        """
+        events: list[BookmarkEvent] = []
+        # Both lists must be queried from the same watermark, since recording changes
+        # from the first list advances it:
+        modified_since = self._watermark
+
+        for archived in (False, True):
+            async for bookmark in self._manager.async_iter_all(
+                archived=archived,
+                page_size=self._page_size,
+                modified_since=modified_since,
+            ):
+                previous = self._state.get(bookmark["id"])
+                self._record(bookmark)
+
+                if previous is None:
+                    event_type = BookmarkEventType.ADDED
+                elif previous[1] != bookmark["is_archived"]:
+                    event_type = (
+                        BookmarkEventType.ARCHIVED
+                        if bookmark["is_archived"]
+                        else BookmarkEventType.UNARCHIVED
+                    )
+                elif previous[0] != bookmark["date_modified"]:
+                    event_type = BookmarkEventType.UPDATED
+                else:
+                    continue
+
+                events.append(BookmarkEvent(event_type, bookmark["id"], bookmark))
+
+        active_count = await self._async_count(archived=False)
+        archived_count = await self._async_count(archived=True)
+        if active_count + archived_count < len(self._state):
+            events.extend(await self._async_find_deleted())
+
+        if events:
+            self.interval = self._min_interval
+        else:
+            self.interval = min(self._max_interval, self.interval * self._backoff)
+
+        return events
+
+    @background
+    async def async_snapshot(self) -> None:
+        """Record the current state of every bookmark (without emitting events)."""
+        for archived in (False, True):
+            async for bookmark in self._manager.async_iter_all(
+                archived=archived, page_size=self._page_size, fields=STATE_FIELDS
+            ):
+                self._record(bookmark)
@@ -0,0 +1,214 @@
+"""Measure the per-call overhead of Client.async_request over a mocked transport.
+
+The working tree is compared against a baseline git ref (``HEAD`` by default, i.e. the
+uncommitted changes); each is measured in its own interpreter:
+
+    python examples/benchmark_request.py --baseline <ref>
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import io
+import json
+import logging
+import os
+from pathlib import Path
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+from types import TracebackType
+from typing import Any, Self
+
+from yarl import URL
+
+_LOGGER = logging.getLogger()
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+ENDPOINTS = ("/api/bookmarks/1/", "/api/tags/")
+
+CALLS = 20_000
+ROUNDS = 10
+PAYLOAD: dict[str, Any] = {"id": 1, "url": "https://example.com", "tag_names": []}
+
+
+class MockResponse:
+    """Define a response that returns a canned payload."""
+
+    status = 200
+
+    async def __aenter__(self) -> Self:
+        """Enter the context manager.
+
+        Returns
+        -------
+            This response.
+
+        """
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Exit the context manager.
+
+        Args:
+        ----
+            exc_type: The exception type (if any).
+            exc: The exception (if any).
+            traceback: The traceback (if any).
+
+        """
+
+    async def json(self) -> dict[str, Any]:
+        """Return the canned payload.
+
+        Returns
+        -------
+            The payload.
+
+        """
+        return PAYLOAD
+
+    def raise_for_status(self) -> None:
+        """Do nothing (the response is always successful; older clients call this)."""
+
+
+class MockSession:
+    """Define a session that never touches the network."""
+
+    closed = False
+
+    def request(
+        self,
+        method: str,  # noqa: ARG002
+        str_or_url: str | URL,
+        **kwargs: object,  # noqa: ARG002
+    ) -> MockResponse:
+        """Return a canned response.
+
+        Like aiohttp, the URL is parsed (a no-op for URL objects).
+
+        Args:
+        ----
+            method: An HTTP method.
+            str_or_url: The request URL.
+            **kwargs: Keyword request arguments.
+
+        Returns:
+        -------
+            A MockResponse object.
+
+        """
+        URL(str_or_url)
+        return MockResponse()
+
+
+async def async_measure() -> dict[str, float]:
+    """Measure the client importable from the current interpreter.
+
+    Returns
+    -------
+        The fastest per-call time (in µs) for each endpoint.
+
+    """
+    from aiolinkding import Client
+
+    client = Client(
+        "http://127.0.0.1:8000",
+        "token_abcde12345",
+        session=MockSession(),  # type: ignore[arg-type]
+    )
+
+    results = {}
+    for endpoint in ENDPOINTS:
+        timings = []
+        for _ in range(ROUNDS):
+            start = time.perf_counter()
+            for _ in range(CALLS):
+                await client.async_request("get", endpoint)
+            timings.append(time.perf_counter() - start)
+        # The fastest round is the least disturbed by the rest of the system:
+        results[endpoint] = min(timings) / CALLS * 1e6
+    return results
+
+
+def measure(source: Path) -> dict[str, float]:
+    """Measure the aiolinkding package found in a directory.
+
+    Args:
+    ----
+        source: The directory containing the aiolinkding package.
+
+    Returns:
+    -------
+        The fastest per-call time (in µs) for each endpoint.
+
+    """
+    output = subprocess.run(  # noqa: S603
+        [sys.executable, __file__, "--measure"],
+        capture_output=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": str(source)},
+        text=True,
+    ).stdout
+    results: dict[str, float] = json.loads(output)
+    return results
+
+
+def measure_ref(ref: str) -> dict[str, float]:
+    """Measure the aiolinkding package as of a git ref.
+
+    Args:
+    ----
+        ref: A git ref.
+
+    Returns:
+    -------
+        The fastest per-call time (in µs) for each endpoint.
+
+    """
+    archive = subprocess.run(  # noqa: S603
+        ["git", "archive", ref, "aiolinkding"],  # noqa: S607
+        capture_output=True,
+        check=True,
+        cwd=REPO_ROOT,
+    ).stdout
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+            tar.extractall(tmp_dir, filter="data")
+        return measure(Path(tmp_dir))
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--baseline", default="HEAD", help="the git ref to compare to")
+    parser.add_argument("--measure", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        print(json.dumps(asyncio.run(async_measure())))  # noqa: T201
+        return
+
+    logging.basicConfig(level=logging.INFO)
+    before = measure_ref(args.baseline)
+    after = measure(REPO_ROOT)
+    for endpoint in ENDPOINTS:
+        _LOGGER.info(
+            "%s: %.2f µs/call (%s) -> %.2f µs/call (working tree), %.2fx",
+            endpoint,
+            before[endpoint],
+            args.baseline,
+            after[endpoint],
+            before[endpoint] / after[endpoint],
+        )
+
+
+main()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 import aiohttp
@@ -9,6 +10,7 @@ from aresponses import ResponsesMockServer
 import pytest
 
 from aiolinkding import async_get_client
+from aiolinkding.bookmark import BookmarkManager
 
 from .common import TEST_TOKEN, TEST_URL
 
@@ -245,6 +247,84 @@ async def test_get_single(
     aresponses.assert_plan_strictly_followed()
 
 
+@pytest.mark.asyncio
+async def test_get_many(
+    aresponses: ResponsesMockServer,
+    authenticated_linkding_api_server: ResponsesMockServer,
+    bookmarks_async_get_single_response: dict[str, Any],
+) -> None:
+    """Test getting many bookmarks by ID (cache first, in input order).
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_linkding_api_server: A mock authenticated linkding API server.
+        bookmarks_async_get_single_response: An API response payload.
+
+    """
+    other_bookmark = {**bookmarks_async_get_single_response, "id": 3}
+
+    async with authenticated_linkding_api_server:
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/1/",
+            "get",
+            response=aiohttp.web_response.json_response(
+                bookmarks_async_get_single_response, status=200
+            ),
+        )
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/3/",
+            "get",
+            response=aiohttp.web_response.json_response(other_bookmark, status=200),
+        )
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/2/",
+            "get",
+            response=aresponses.Response(text="Not found", status=404),
+        )
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/1/archive/",
+            "post",
+            response=aresponses.Response(status=204),
+        )
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/1/",
+            "get",
+            response=aiohttp.web_response.json_response(
+                bookmarks_async_get_single_response, status=200
+            ),
+        )
+
+        async with aiohttp.ClientSession() as session:
+            client = await async_get_client(TEST_URL, TEST_TOKEN, session=session)
+            await client.bookmarks.async_get_single(1)
+
+            # Bookmark 1 is served from the cache and bookmark 3 is only fetched once:
+            batch = await client.bookmarks.async_get_many([3, 1, 2, 3])
+            assert batch.bookmarks == [
+                other_bookmark,
+                bookmarks_async_get_single_response,
+                other_bookmark,
+            ]
+            assert batch.missing == [2]
+
+            # Changing a bookmark invalidates its cached copy:
+            await client.bookmarks.async_archive(1)
+            batch = await client.bookmarks.async_get_many([1, 3])
+            assert batch.bookmarks == [
+                bookmarks_async_get_single_response,
+                other_bookmark,
+            ]
+            assert batch.missing == []
+
+    aresponses.assert_plan_strictly_followed()
+
+
 @pytest.mark.asyncio
 async def test_unarchive(
     aresponses: ResponsesMockServer,
@@ -313,3 +393,239 @@ async def test_update(
             assert updated_bookmark == bookmarks_async_get_single_response
 
     aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_get_all_with_fields(
+    aresponses: ResponsesMockServer,
+    authenticated_linkding_api_server: ResponsesMockServer,
+    bookmarks_async_get_all_response: dict[str, Any],
+) -> None:
+    """Test getting all bookmarks with a subset of fields.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_linkding_api_server: A mock authenticated linkding API server.
+        bookmarks_async_get_all_response: An API response payload.
+
+    """
+    async with authenticated_linkding_api_server:
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/",
+            "get",
+            response=aiohttp.web_response.json_response(
+                bookmarks_async_get_all_response, status=200
+            ),
+        )
+
+        async with aiohttp.ClientSession() as session:
+            client = await async_get_client(TEST_URL, TEST_TOKEN, session=session)
+            bookmarks = await client.bookmarks.async_get_all(
+                fields=("id", "url", "title", "tag_names", "nonexistent")
+            )
+            assert bookmarks["count"] == 123
+            assert bookmarks["results"] == [
+                {
+                    "id": 1,
+                    "url": "https://example.com",
+                    "title": "Example title",
+                    "tag_names": ["tag1", "tag2"],
+                }
+            ]
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_get_single_with_fields(
+    aresponses: ResponsesMockServer,
+    authenticated_linkding_api_server: ResponsesMockServer,
+    bookmarks_async_get_single_response: dict[str, Any],
+) -> None:
+    """Test getting a single bookmark with a subset of fields.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_linkding_api_server: A mock authenticated linkding API server.
+        bookmarks_async_get_single_response: An API response payload.
+
+    """
+    async with authenticated_linkding_api_server:
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/1/",
+            "get",
+            response=aiohttp.web_response.json_response(
+                bookmarks_async_get_single_response, status=200
+            ),
+        )
+
+        async with aiohttp.ClientSession() as session:
+            client = await async_get_client(TEST_URL, TEST_TOKEN, session=session)
+            single_bookmark = await client.bookmarks.async_get_single(
+                1, fields=["id", "url"]
+            )
+            assert single_bookmark == {"id": 1, "url": "https://example.com"}
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_iter_all(
+    aresponses: ResponsesMockServer,
+    authenticated_linkding_api_server: ResponsesMockServer,
+    bookmarks_async_get_all_response: dict[str, Any],
+) -> None:
+    """Test iterating over all bookmarks across multiple pages.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_linkding_api_server: A mock authenticated linkding API server.
+        bookmarks_async_get_all_response: An API response payload.
+
+    """
+    async with authenticated_linkding_api_server:
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/archived/?limit=1&offset=0&sort=added_asc",
+            "get",
+            response=aiohttp.web_response.json_response(
+                bookmarks_async_get_all_response, status=200
+            ),
+            match_querystring=True,
+        )
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/archived/?limit=1&offset=1&sort=added_asc",
+            "get",
+            response=aiohttp.web_response.json_response(
+                {
+                    **bookmarks_async_get_all_response,
+                    "next": None,
+                    "results": [
+                        {**bookmarks_async_get_all_response["results"][0], "id": 2}
+                    ],
+                },
+                status=200,
+            ),
+            match_querystring=True,
+        )
+
+        async with aiohttp.ClientSession() as session:
+            client = await async_get_client(TEST_URL, TEST_TOKEN, session=session)
+            bookmarks = [
+                bookmark
+                async for bookmark in client.bookmarks.async_iter_all(
+                    archived=True, page_size=1, fields=iter(["id"]), prefetch=True
+                )
+            ]
+            assert bookmarks == [{"id": 1}, {"id": 2}]
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_iter_all_prefetch_early_exit() -> None:
+    """Test that leaving a prefetching iteration early cancels the prefetched page."""
+    offsets: list[int] = []
+    release = asyncio.Event()
+
+    async def async_request(
+        method: str,
+        endpoint: str,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> dict[str, Any]:
+        """Return a page with a single bookmark (waiting for later pages).
+
+        Args:
+        ----
+            method: An HTTP method.
+            endpoint: A relative API endpoint.
+            **kwargs: Additional kwargs to send with the request.
+
+        Returns:
+        -------
+            An API response payload.
+
+        """
+        offset = kwargs["params"]["offset"]
+        offsets.append(offset)
+        if offset:
+            await release.wait()
+        return {"next": "next", "results": [{"id": offset + 1}]}
+
+    iterator = BookmarkManager(async_request).async_iter_all(prefetch=True)
+    assert await anext(iterator) == {"id": 1}
+    await asyncio.sleep(0)
+    await iterator.aclose()
+    assert offsets == [0, 1]
+
+
+@pytest.mark.asyncio
+async def test_update_minimal_patch(
+    aresponses: ResponsesMockServer,
+    authenticated_linkding_api_server: ResponsesMockServer,
+    bookmarks_async_get_single_response: dict[str, Any],
+) -> None:
+    """Test that updates only send provided (and changed) fields.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_linkding_api_server: A mock authenticated linkding API server.
+        bookmarks_async_get_single_response: An API response payload.
+
+    """
+    payloads: list[dict[str, Any]] = []
+
+    async def patch(request: aiohttp.web.Request) -> aiohttp.web.Response:
+        """Record a patch payload.
+
+        Args:
+        ----
+            request: The incoming request.
+
+        Returns:
+        -------
+            A response.
+
+        """
+        payloads.append(await request.json())
+        return aiohttp.web_response.json_response(
+            bookmarks_async_get_single_response, status=200
+        )
+
+    async with authenticated_linkding_api_server:
+        for _ in range(2):
+            authenticated_linkding_api_server.add(
+                "127.0.0.1:8000", "/api/bookmarks/1/", "patch", response=patch
+            )
+
+        async with aiohttp.ClientSession() as session:
+            client = await async_get_client(TEST_URL, TEST_TOKEN, session=session)
+
+            # Explicitly setting False is distinct from not setting a value:
+            await client.bookmarks.async_update(1, title="New title", shared=False)
+
+            # Fields that match the previous state aren't sent:
+            await client.bookmarks.async_update(
+                1,
+                title="Example title",
+                unread=True,
+                shared=False,
+                previous=bookmarks_async_get_single_response,
+            )
+
+            # If nothing would change, no request is made:
+            unchanged = await client.bookmarks.async_update(
+                1, title="Example title", previous=bookmarks_async_get_single_response
+            )
+            assert unchanged == bookmarks_async_get_single_response
+
+    assert payloads == [{"title": "New title", "shared": False}, {"unread": True}]
+
+    aresponses.assert_plan_strictly_followed()
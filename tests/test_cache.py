@@ -0,0 +1,226 @@
+"""Define tests for response caches."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import closing
+from pathlib import Path
+import sqlite3
+from typing import Any
+
+import aiohttp
+from aresponses import ResponsesMockServer
+import pytest
+
+from aiolinkding import Client, async_get_client
+from aiolinkding.util.cache import CacheBackend, MemoryCache, SharedCache
+
+from .common import TEST_TOKEN, TEST_URL
+
+
+@pytest.fixture(name="cache_backend", params=["memory", "shared"])
+def cache_backend_fixture(
+    request: pytest.FixtureRequest, tmp_path: Path
+) -> CacheBackend:
+    """Return each kind of cache backend.
+
+    Args:
+    ----
+        request: A pytest request object.
+        tmp_path: A temporary directory.
+
+    Returns:
+    -------
+        A cache backend.
+
+    """
+    if request.param == "memory":
+        return MemoryCache()
+    return SharedCache(tmp_path / "cache.db")
+
+
+@pytest.mark.asyncio
+async def test_cache_backend(cache_backend: CacheBackend) -> None:
+    """Test the semantics shared by every cache backend.
+
+    Args:
+    ----
+        cache_backend: A cache backend.
+
+    """
+    assert await cache_backend.async_get("tags", "a", max_age=60) is None
+    assert await cache_backend.async_get_all("tags", max_age=60) is None
+
+    await cache_backend.async_set("tags", "a", {"id": 1})
+    assert await cache_backend.async_get("tags", "a", max_age=60) == {"id": 1}
+    assert await cache_backend.async_get("tags", "a", max_age=0) is None
+    # Single entries don't make a namespace complete:
+    assert await cache_backend.async_get_all("tags", max_age=60) is None
+
+    await cache_backend.async_replace("tags", {"b": {"id": 2}, "c": {"id": 3}})
+    assert await cache_backend.async_get_all("tags", max_age=60) == {
+        "b": {"id": 2},
+        "c": {"id": 3},
+    }
+    assert await cache_backend.async_get_all("tags", max_age=0) is None
+    assert await cache_backend.async_get("tags", "a", max_age=60) is None
+    assert await cache_backend.async_get_all("user", max_age=60) is None
+
+    await cache_backend.async_invalidate("tags", "b")
+    assert await cache_backend.async_get_all("tags", max_age=60) == {"c": {"id": 3}}
+
+    await cache_backend.async_invalidate("tags")
+    assert await cache_backend.async_get_all("tags", max_age=60) is None
+    assert await cache_backend.async_get("tags", "c", max_age=60) is None
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_max_entries() -> None:
+    """Test that the least recently used entries are evicted from a full namespace."""
+    cache = MemoryCache(max_entries=2)
+
+    await cache.async_set("bookmarks", "1", {"id": 1})
+    await cache.async_set("bookmarks", "2", {"id": 2})
+    assert await cache.async_get("bookmarks", "1", max_age=60) == {"id": 1}
+    await cache.async_set("bookmarks", "3", {"id": 3})
+    assert await cache.async_get("bookmarks", "2", max_age=60) is None
+    assert await cache.async_get("bookmarks", "1", max_age=60) == {"id": 1}
+    assert await cache.async_get("bookmarks", "3", max_age=60) == {"id": 3}
+
+    # A full replacement is kept whole (even beyond the limit), and only entries set
+    # one at a time after it count towards the limit:
+    await cache.async_replace("tags", {"a": {"id": 1}, "b": {"id": 2}, "c": {"id": 3}})
+    assert await cache.async_get_all("tags", max_age=60) is not None
+    await cache.async_set("tags", "d", {"id": 4})
+    await cache.async_set("tags", "e", {"id": 5})
+    assert await cache.async_get_all("tags", max_age=60) == {
+        "a": {"id": 1},
+        "b": {"id": 2},
+        "c": {"id": 3},
+        "d": {"id": 4},
+        "e": {"id": 5},
+    }
+
+    # Once an entry is evicted, the namespace is no longer complete:
+    await cache.async_set("tags", "f", {"id": 6})
+    assert await cache.async_get_all("tags", max_age=60) is None
+    assert await cache.async_get("tags", "a", max_age=60) is None
+    assert await cache.async_get("tags", "f", max_age=60) == {"id": 6}
+
+
+@pytest.mark.asyncio
+async def test_shared_cache_across_connections(tmp_path: Path) -> None:
+    """Test that writes and invalidations are seen by other processes.
+
+    Args:
+    ----
+        tmp_path: A temporary directory.
+
+    """
+    worker1 = SharedCache(tmp_path / "cache.db")
+    worker2 = SharedCache(tmp_path / "cache.db")
+
+    await worker1.async_replace("tags", {"a": {"id": 1}})
+    assert await worker2.async_get_all("tags", max_age=60) == {"a": {"id": 1}}
+
+    # A write that fails (e.g., on a value that isn't JSON) is rolled back:
+    with pytest.raises(TypeError):
+        await worker1.async_replace("tags", {"b": object()})
+    assert await worker2.async_get_all("tags", max_age=60) == {"a": {"id": 1}}
+
+    await worker2.async_invalidate("tags")
+    assert await worker1.async_get_all("tags", max_age=60) is None
+
+    worker1.close()
+    worker2.close()
+
+
+@pytest.mark.asyncio
+async def test_shared_cache_expiry(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that expired entries are never read and are deleted by later writes.
+
+    Args:
+    ----
+        tmp_path: A temporary directory.
+        monkeypatch: The pytest monkeypatch fixture.
+
+    """
+    monkeypatch.setattr("aiolinkding.util.cache.PURGE_INTERVAL", 0)
+    path = tmp_path / "cache.db"
+    cache = SharedCache(path, ttl=0.05)
+
+    await cache.async_replace("tags", {"a": {"id": 1}})
+    await cache.async_set("user", "profile", {"username": "user"})
+    await asyncio.sleep(0.1)
+    assert await cache.async_get("user", "profile", max_age=60) is None
+    assert await cache.async_get_all("tags", max_age=60) is None
+
+    await cache.async_set("user", "profile", {"username": "user"})
+    with closing(sqlite3.connect(path)) as connection:
+        assert connection.execute("SELECT key FROM entries").fetchall() == [
+            ("profile",)
+        ]
+        assert connection.execute("SELECT * FROM namespaces").fetchall() == []
+
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_clients_share_tags(
+    aresponses: ResponsesMockServer,
+    authenticated_linkding_api_server: ResponsesMockServer,
+    tags_async_get_all_response: dict[str, Any],
+    tmp_path: Path,
+) -> None:
+    """Test that clients sharing a cache only fetch tags once.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_linkding_api_server: A mock authenticated linkding API server.
+        tags_async_get_all_response: An API response payload.
+        tmp_path: A temporary directory.
+
+    """
+    tag = tags_async_get_all_response["results"][0]
+
+    async with authenticated_linkding_api_server:
+        for _ in range(2):
+            authenticated_linkding_api_server.add(
+                "127.0.0.1:8000",
+                "/api/tags/",
+                "get",
+                response=aiohttp.web_response.json_response(
+                    {**tags_async_get_all_response, "count": 1, "next": None},
+                    status=200,
+                ),
+            )
+
+        async with aiohttp.ClientSession() as session:
+            client1 = await async_get_client(
+                TEST_URL,
+                TEST_TOKEN,
+                session=session,
+                cache=SharedCache(tmp_path / "cache.db"),
+            )
+            client2 = Client(
+                TEST_URL,
+                TEST_TOKEN,
+                session=session,
+                cache=SharedCache(tmp_path / "cache.db"),
+            )
+            # A different user's tags are never shared:
+            client3 = Client(
+                TEST_URL,
+                "other_token",
+                session=session,
+                cache=SharedCache(tmp_path / "cache.db"),
+            )
+
+            assert await client1.tags.async_get_by_name(tag["name"]) == tag
+            assert await client2.tags.async_get_by_name(tag["name"].upper()) == tag
+            assert await client3.tags.async_get_by_name(tag["name"]) == tag
+
+    aresponses.assert_plan_strictly_followed()
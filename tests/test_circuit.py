@@ -0,0 +1,258 @@
+"""Define tests for the circuit breaker."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import aiohttp
+from aresponses import ResponsesMockServer
+import pytest
+
+from aiolinkding import async_get_client
+from aiolinkding.errors import CircuitOpenError, DeadlineExceededError, RequestError
+from aiolinkding.util.circuit import CircuitBreaker, CircuitState
+from aiolinkding.util.deadline import deadline
+
+from .common import TEST_TOKEN, TEST_URL
+
+
+def state_of(breaker: CircuitBreaker) -> CircuitState:
+    """Return the current state of a circuit breaker.
+
+    The state is read through a call so that type checkers don't narrow it across
+    the transitions a test triggers.
+
+    Args:
+    ----
+        breaker: The circuit breaker.
+
+    Returns:
+    -------
+        A CircuitState value.
+
+    """
+    return breaker.state
+
+
+def test_breaker_state_machine(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the transitions of the circuit breaker itself.
+
+    Args:
+    ----
+        monkeypatch: The pytest monkeypatch fixture.
+
+    """
+    now = 100.0
+    monkeypatch.setattr("aiolinkding.util.circuit.time.monotonic", lambda: now)
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=10)
+
+    breaker.record_failure()
+    assert state_of(breaker) is CircuitState.CLOSED
+    assert breaker.retry_after == 0.0
+    assert not breaker.try_begin_probe()
+
+    breaker.record_failure()
+    assert state_of(breaker) is CircuitState.OPEN
+    assert breaker.retry_after == 10.0
+
+    now += 10
+    assert state_of(breaker) is CircuitState.HALF_OPEN
+    assert breaker.try_begin_probe()
+    # Only a single probe is allowed at a time:
+    assert not breaker.try_begin_probe()
+
+    # A failed probe re-opens the circuit right away:
+    breaker.record_failure()
+    assert state_of(breaker) is CircuitState.OPEN
+
+    now += 10
+    assert breaker.try_begin_probe()
+    breaker.record_success()
+    assert state_of(breaker) is CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_client_fails_fast(
+    aresponses: ResponsesMockServer,
+    authenticated_linkding_api_server: ResponsesMockServer,
+    bookmarks_async_get_single_response: dict[str, Any],
+    health_response: dict[str, Any],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that a client fails fast while the circuit is open.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_linkding_api_server: A mock authenticated linkding API server.
+        bookmarks_async_get_single_response: An API response payload.
+        health_response: An API response payload.
+        monkeypatch: The pytest monkeypatch fixture.
+
+    """
+    now = 100.0
+    monkeypatch.setattr("aiolinkding.util.circuit.time.monotonic", lambda: now)
+
+    async with authenticated_linkding_api_server:
+        for _ in range(2):
+            authenticated_linkding_api_server.add(
+                "127.0.0.1:8000",
+                "/api/bookmarks/1/",
+                "get",
+                response=aiohttp.web_response.json_response(
+                    {"detail": "Server error"}, status=500
+                ),
+            )
+        # The first probe fails...
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/health",
+            "get",
+            response=aiohttp.web_response.json_response(
+                {"detail": "Server error"}, status=503
+            ),
+        )
+        # ...but the second one succeeds:
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/health",
+            "get",
+            response=aiohttp.web_response.json_response(health_response, status=200),
+        )
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/1/",
+            "get",
+            response=aiohttp.web_response.json_response(
+                bookmarks_async_get_single_response, status=200
+            ),
+        )
+
+        async with aiohttp.ClientSession() as session:
+            breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=30)
+            client = await async_get_client(
+                TEST_URL, TEST_TOKEN, session=session, circuit_breaker=breaker
+            )
+
+            for _ in range(2):
+                with pytest.raises(RequestError):
+                    await client.bookmarks.async_get_single(1)
+            assert state_of(breaker) is CircuitState.OPEN
+
+            # No request reaches the server while the circuit is open:
+            with pytest.raises(CircuitOpenError):
+                await client.bookmarks.async_get_single(1)
+
+            now += 30
+            with pytest.raises(CircuitOpenError):
+                await client.bookmarks.async_get_single(1)
+            assert state_of(breaker) is CircuitState.OPEN
+
+            now += 30
+            bookmark = await client.bookmarks.async_get_single(1)
+            assert bookmark == bookmarks_async_get_single_response
+            assert state_of(breaker) is CircuitState.CLOSED
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_client_errors_do_not_trip(
+    aresponses: ResponsesMockServer,
+    authenticated_linkding_api_server: ResponsesMockServer,
+    missing_field_response: dict[str, Any],
+) -> None:
+    """Test that client errors (e.g., HTTP 400) don't open the circuit.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_linkding_api_server: A mock authenticated linkding API server.
+        missing_field_response: An API response payload.
+
+    """
+    async with authenticated_linkding_api_server:
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/",
+            "post",
+            response=aiohttp.web_response.json_response(
+                missing_field_response, status=400
+            ),
+        )
+
+        async with aiohttp.ClientSession() as session:
+            breaker = CircuitBreaker(failure_threshold=1)
+            client = await async_get_client(
+                TEST_URL, TEST_TOKEN, session=session, circuit_breaker=breaker
+            )
+            with pytest.raises(RequestError):
+                await client.bookmarks.async_create("https://example.com")
+            assert state_of(breaker) is CircuitState.CLOSED
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_probe(
+    aresponses: ResponsesMockServer,
+    authenticated_linkding_api_server: ResponsesMockServer,
+    health_response: dict[str, Any],
+) -> None:
+    """Test that a cancelled probe doesn't keep the circuit from recovering.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_linkding_api_server: A mock authenticated linkding API server.
+        health_response: An API response payload.
+
+    """
+
+    async def slow_health(_: aiohttp.web.Request) -> aiohttp.web.Response:
+        """Respond to a health check after a long while.
+
+        Returns
+        -------
+            A response.
+
+        """
+        await asyncio.sleep(1)
+        return aiohttp.web_response.json_response(health_response, status=200)
+
+    async with authenticated_linkding_api_server:
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000", "/health", "get", response=slow_health
+        )
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/health",
+            "get",
+            response=aiohttp.web_response.json_response(health_response, status=200),
+        )
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/tags/1/",
+            "get",
+            response=aiohttp.web_response.json_response({"id": 1}, status=200),
+        )
+
+        async with aiohttp.ClientSession() as session:
+            # Without a recovery timeout, an open circuit is immediately half-open:
+            breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0)
+            client = await async_get_client(
+                TEST_URL, TEST_TOKEN, session=session, circuit_breaker=breaker
+            )
+            breaker.record_failure()
+
+            # The probe is cancelled by an expiring deadline:
+            with pytest.raises(DeadlineExceededError), deadline(0.05):
+                await client.tags.async_get_single(1)
+            assert state_of(breaker) is CircuitState.HALF_OPEN
+
+            # ...so the next request probes the server again:
+            assert await client.tags.async_get_single(1) == {"id": 1}
+            assert state_of(breaker) is CircuitState.CLOSED
+
+    aresponses.assert_plan_strictly_followed()
@@ -2,22 +2,36 @@
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+import json
+import logging
+from pathlib import Path
+from typing import Any, NoReturn
 
 import aiohttp
 from aresponses import ResponsesMockServer
 import pytest
+from yarl import URL
 
-from aiolinkding import async_get_client
+from aiolinkding import Client, async_get_client
 from aiolinkding.client import (
     SERVER_VERSION_HEALTH_CHECK_INTRODUCED,
     SERVER_VERSION_MINIMUM_REQUIRED,
 )
+from aiolinkding.endpoints import BOOKMARK, BOOKMARK_ARCHIVE, TAGS, resolve_route
 from aiolinkding.errors import (
+    ClientClosedError,
+    ConnectionFailedError,
     InvalidServerVersionError,
     InvalidTokenError,
+    RateLimitedError,
     RequestError,
+    ServerError,
+    ValidationError,
 )
+from aiolinkding.util.checkpoint import Checkpoint
 
 from .common import TEST_TOKEN, TEST_URL
 
@@ -158,3 +172,702 @@ async def test_request_error(
             assert "This field is required" in str(err)
 
     aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_error_classification(
+    aresponses: ResponsesMockServer,
+    authenticated_linkding_api_server: ResponsesMockServer,
+) -> None:
+    """Test that unsuccessful responses raise structured errors.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_linkding_api_server: A mock authenticated linkding API server.
+
+    """
+    async with authenticated_linkding_api_server:
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/",
+            "post",
+            response=aiohttp.web_response.json_response(
+                {"url": ["This field is required."]}, status=400
+            ),
+        )
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/1/",
+            "get",
+            response=aiohttp.web_response.json_response(
+                {"detail": "Slow down"}, status=429, headers={"Retry-After": "7"}
+            ),
+        )
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/tags/",
+            "get",
+            response=aresponses.Response(
+                text="Oops", status=502, headers={"Content-Type": "text/html"}
+            ),
+        )
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/2/",
+            "patch",
+            response=aiohttp.web_response.json_response(
+                ["Bookmark is locked."], status=400
+            ),
+        )
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/2/",
+            "delete",
+            response=aiohttp.web_response.json_response(
+                {"detail": "Forbidden"}, status=403
+            ),
+        )
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/3/",
+            "get",
+            response=aresponses.Response(
+                text="<html></html>", status=200, headers={"Content-Type": "text/html"}
+            ),
+        )
+
+        async with aiohttp.ClientSession() as session:
+            client = await async_get_client(TEST_URL, TEST_TOKEN, session=session)
+
+            with pytest.raises(ValidationError) as validation_err:
+                await client.bookmarks.async_create("")
+            assert validation_err.value.status == 400
+            assert validation_err.value.route == "/api/bookmarks/"
+            assert validation_err.value.errors == {"url": ["This field is required."]}
+
+            with pytest.raises(RateLimitedError) as rate_limited_err:
+                await client.bookmarks.async_get_single(1)
+            assert rate_limited_err.value.retry_after == 7
+            assert rate_limited_err.value.route == "/api/bookmarks/{bookmark_id}/"
+
+            with pytest.raises(ServerError) as server_err:
+                await client.tags.async_get_all()
+            assert server_err.value.payload is None
+            assert str(server_err.value) == (
+                "Error while requesting /api/tags/: HTTP 502"
+            )
+
+            # Errors that aren't keyed by field are reported as such:
+            with pytest.raises(ValidationError) as validation_err:
+                await client.bookmarks.async_update(2, title="New title")
+            assert validation_err.value.errors == {}
+
+            with pytest.raises(RequestError) as request_err:
+                await client.bookmarks.async_delete(2)
+            assert type(request_err.value) is RequestError
+            assert request_err.value.status == 403
+
+            with pytest.raises(RequestError, match="Unexpected non-JSON response"):
+                await client.bookmarks.async_get_single(3)
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "retry_after",
+    [
+        None,
+        "soon",
+        "-5",
+        # An HTTP date in the past (in UTC and in an unknown timezone):
+        "Wed, 21 Oct 2015 07:28:00 GMT",
+        "Wed, 21 Oct 2015 07:28:00 -0000",
+    ],
+)
+async def test_retry_after(
+    aresponses: ResponsesMockServer,
+    authenticated_linkding_api_server: ResponsesMockServer,
+    retry_after: str | None,
+) -> None:
+    """Test Retry-After headers that don't ask clients to wait.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_linkding_api_server: A mock authenticated linkding API server.
+        retry_after: The Retry-After header (if any).
+
+    """
+    async with authenticated_linkding_api_server:
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/1/",
+            "get",
+            response=aiohttp.web_response.json_response(
+                {"detail": "Slow down"},
+                status=429,
+                headers={} if retry_after is None else {"Retry-After": retry_after},
+            ),
+        )
+
+        async with aiohttp.ClientSession() as session:
+            client = await async_get_client(TEST_URL, TEST_TOKEN, session=session)
+            with pytest.raises(RateLimitedError) as err:
+                await client.bookmarks.async_get_single(1)
+
+    expected = None if retry_after in (None, "soon") else 0.0
+    assert err.value.retry_after == expected
+
+    aresponses.assert_plan_strictly_followed()
+
+
+class FailingTransport:
+    """Define a transport whose requests fail before a response is received."""
+
+    def __init__(self, err: aiohttp.ClientError) -> None:
+        """Initialize.
+
+        Args:
+        ----
+            err: The error to raise.
+
+        """
+        self._err = err
+
+    def request(self, method: str, url: str | URL, **kwargs: Any) -> NoReturn:  # noqa: ANN401, ARG002
+        """Fail to send a request.
+
+        Args:
+        ----
+            method: An HTTP method.
+            url: The request URL.
+            **kwargs: Additional kwargs sent with the request.
+
+        Raises:
+        ------
+            aiohttp.ClientError: Always.
+
+        """
+        raise self._err
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("err", "error_type", "message"),
+    [
+        (
+            aiohttp.ClientConnectionError("Refused"),
+            ConnectionFailedError,
+            "Connection failed while requesting /api/bookmarks/1/: Refused",
+        ),
+        (
+            aiohttp.ClientPayloadError("Truncated"),
+            RequestError,
+            "Error while requesting /api/bookmarks/1/: Truncated",
+        ),
+    ],
+)
+async def test_transport_errors(
+    err: aiohttp.ClientError, error_type: type[RequestError], message: str
+) -> None:
+    """Test errors raised before a response is received.
+
+    Args:
+    ----
+        err: The aiohttp error.
+        error_type: The expected error type.
+        message: The expected error message.
+
+    """
+    client = Client(TEST_URL, TEST_TOKEN, transport=FailingTransport(err))
+    with pytest.raises(error_type) as request_err:
+        await client.bookmarks.async_get_single(1)
+    assert str(request_err.value) == message
+    assert request_err.value.route == "/api/bookmarks/{bookmark_id}/"
+
+
+def test_routes() -> None:
+    """Test building and resolving API routes."""
+    assert BOOKMARK.path(bookmark_id=12) == "/api/bookmarks/12/"
+    assert resolve_route("/api/bookmarks/12/") is BOOKMARK
+    assert resolve_route("/api/bookmarks/12/archive/") is BOOKMARK_ARCHIVE
+    assert resolve_route("/api/tags/?limit=100&offset=0") is TAGS
+    assert resolve_route("/api/bookmarks/abc/") is None
+    assert resolve_route("/api/whatever/") is None
+
+
+@pytest.mark.asyncio
+async def test_endpoint_query_string(
+    aresponses: ResponsesMockServer,
+    authenticated_linkding_api_server: ResponsesMockServer,
+    bookmarks_async_get_all_response: dict[str, Any],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that an endpoint's query string is sent as a query string.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_linkding_api_server: A mock authenticated linkding API server.
+        bookmarks_async_get_all_response: An API response payload.
+        monkeypatch: The pytest monkeypatch fixture.
+
+    """
+    monkeypatch.setattr("aiolinkding.client.ENDPOINT_URL_CACHE_SIZE", 1)
+
+    async with authenticated_linkding_api_server:
+        for _ in range(2):
+            authenticated_linkding_api_server.add(
+                "127.0.0.1:8000",
+                "/api/bookmarks/?limit=1&q=python",
+                "get",
+                response=aiohttp.web_response.json_response(
+                    bookmarks_async_get_all_response, status=200
+                ),
+                match_querystring=True,
+            )
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/archived/?limit=1",
+            "get",
+            response=aiohttp.web_response.json_response(
+                bookmarks_async_get_all_response, status=200
+            ),
+            match_querystring=True,
+        )
+
+        async with aiohttp.ClientSession() as session:
+            client = await async_get_client(TEST_URL, TEST_TOKEN, session=session)
+            # The second request for an endpoint reuses its URL, and a full cache is
+            # cleared to make room for another:
+            for endpoint in (
+                "/api/bookmarks/?limit=1&q=python",
+                "/api/bookmarks/?limit=1&q=python",
+                "/api/bookmarks/archived/?limit=1",
+            ):
+                assert (
+                    await client.async_request("get", endpoint)
+                    == bookmarks_async_get_all_response
+                )
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_drain(
+    aresponses: ResponsesMockServer,
+    authenticated_linkding_api_server: ResponsesMockServer,
+    bookmarks_async_get_single_response: dict[str, Any],
+) -> None:
+    """Test that closing a client waits for in-flight requests and refuses new ones.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_linkding_api_server: A mock authenticated linkding API server.
+        bookmarks_async_get_single_response: An API response payload.
+
+    """
+    received = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow_response(_: aiohttp.web.Request) -> aiohttp.web.Response:
+        """Respond once the test releases the request.
+
+        Returns
+        -------
+            A response.
+
+        """
+        received.set()
+        await release.wait()
+        return aiohttp.web_response.json_response(
+            bookmarks_async_get_single_response, status=200
+        )
+
+    async with authenticated_linkding_api_server:
+        for _ in range(2):
+            authenticated_linkding_api_server.add(
+                "127.0.0.1:8000", "/api/bookmarks/1/", "patch", response=slow_response
+            )
+
+        async with aiohttp.ClientSession() as session:
+            client = await async_get_client(TEST_URL, TEST_TOKEN, session=session)
+
+            update = asyncio.create_task(
+                client.bookmarks.async_update(1, title="New title")
+            )
+            await received.wait()
+
+            # A drain that times out leaves the request running:
+            closed_before_drain = client.closed
+            assert await client.async_drain(timeout=0.01) is False
+            assert not closed_before_drain
+            assert client.closed
+            with pytest.raises(ClientClosedError):
+                await client.bookmarks.async_get_single(1)
+
+            release.set()
+            assert await client.async_close() is True
+            assert update.done()
+            assert await update == bookmarks_async_get_single_response
+
+            # Leaving the context manager drains (and closes) the client:
+            received.clear()
+            release.clear()
+            async with Client(TEST_URL, TEST_TOKEN, session=session) as client:
+                update = asyncio.create_task(
+                    client.bookmarks.async_update(1, title="New title")
+                )
+                await received.wait()
+                release.set()
+            assert update.done()
+            assert client.closed
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_drain_bulk_create(
+    aresponses: ResponsesMockServer,
+    authenticated_linkding_api_server: ResponsesMockServer,
+    bookmarks_async_get_single_response: dict[str, Any],
+    tmp_path: Path,
+) -> None:
+    """Test that draining lets running bulk creates finish and saves the checkpoint.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_linkding_api_server: A mock authenticated linkding API server.
+        bookmarks_async_get_single_response: An API response payload.
+        tmp_path: A temporary directory.
+
+    """
+    received: list[str] = []
+    release = asyncio.Event()
+
+    async def slow_response(request: aiohttp.web.Request) -> aiohttp.web.Response:
+        """Respond once the test releases the request.
+
+        Args:
+        ----
+            request: The incoming request.
+
+        Returns:
+        -------
+            A response.
+
+        """
+        received.append((await request.json())["url"])
+        await release.wait()
+        return aiohttp.web_response.json_response(
+            bookmarks_async_get_single_response, status=201
+        )
+
+    path = tmp_path / "create.checkpoint"
+
+    async with authenticated_linkding_api_server:
+        for _ in range(2):
+            authenticated_linkding_api_server.add(
+                "127.0.0.1:8000", "/api/bookmarks/", "post", response=slow_response
+            )
+
+        async with aiohttp.ClientSession() as session:
+            client = await async_get_client(TEST_URL, TEST_TOKEN, session=session)
+            create = asyncio.create_task(
+                client.bookmarks.async_create_many(
+                    [{"url": f"https://example.com/{index}"} for index in range(3)],
+                    concurrency=2,
+                    checkpoint=Checkpoint(path),
+                )
+            )
+            while len(received) < 2:  # noqa: ASYNC110
+                await asyncio.sleep(0)
+
+            # The drain waits for the bulk create to stop, which doesn't cut off the
+            # running creates:
+            drain = asyncio.create_task(client.async_drain())
+            await asyncio.sleep(0)
+            assert not drain.done()
+            release.set()
+            assert await drain is True
+            assert create.done()
+            with pytest.raises(ClientClosedError):
+                await create
+
+    assert received == ["https://example.com/0", "https://example.com/1"]
+    assert Checkpoint(path).offset == 2
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_close_owned_sessions(
+    aresponses: ResponsesMockServer,
+    health_response: dict[str, Any],
+) -> None:
+    """Test that closing a client closes the sessions it opened itself.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        health_response: An API response payload.
+
+    """
+    received = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow_response(_: aiohttp.web.Request) -> aiohttp.web.Response:
+        """Respond once the test releases the request.
+
+        Returns
+        -------
+            A response.
+
+        """
+        received.set()
+        await release.wait()
+        return aiohttp.web_response.json_response(health_response, status=200)
+
+    aresponses.add("127.0.0.1:8000", "/health", "get", response=slow_response)
+
+    client = Client(TEST_URL, TEST_TOKEN)
+    request = asyncio.create_task(client.async_request("get", "/health"))
+    await received.wait()
+
+    # A request that outlives the drain is aborted along with its session:
+    assert await client.async_close(timeout=0.01) is False
+    with pytest.raises(RequestError):
+        await request
+    release.set()
+
+
+@pytest.mark.asyncio
+async def test_warmup(
+    aresponses: ResponsesMockServer,
+    health_response: dict[str, Any],
+) -> None:
+    """Test pre-opening connections with health checks.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        health_response: An API response payload.
+
+    """
+    for _ in range(2):
+        aresponses.add(
+            "127.0.0.1:8000",
+            "/health",
+            "get",
+            response=aiohttp.web_response.json_response(health_response, status=200),
+        )
+    release = asyncio.Event()
+
+    async def slow_response(_: aiohttp.web.Request) -> aiohttp.web.Response:
+        """Fail once the test releases the request.
+
+        Returns
+        -------
+            A response.
+
+        """
+        await release.wait()
+        return aiohttp.web_response.json_response(
+            {"detail": "Server error"}, status=500
+        )
+
+    aresponses.add("127.0.0.1:8000", "/health", "get", response=slow_response)
+
+    async with aiohttp.ClientSession() as session:
+        client = Client(TEST_URL, TEST_TOKEN, session=session)
+        warmup = asyncio.create_task(client.async_warmup(connections=3))
+        await asyncio.sleep(0)
+
+        # Warm-up requests are in flight, so a drain waits for them:
+        assert await client.async_drain(timeout=0.01) is False
+        release.set()
+        assert await warmup == 2
+        assert await client.async_drain() is True
+        with pytest.raises(ClientClosedError):
+            await client.async_warmup()
+
+    # Without a persistent session, there are no connections to keep:
+    client = Client(TEST_URL, TEST_TOKEN)
+    assert await client.async_warmup() == 0
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_payload_logging_opt_out(
+    aresponses: ResponsesMockServer,
+    caplog: pytest.LogCaptureFixture,
+    health_response: dict[str, Any],
+) -> None:
+    """Test that response payloads can be left out of debug logs.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        caplog: A mock logging utility.
+        health_response: An API response payload.
+
+    """
+    for _ in range(2):
+        aresponses.add(
+            "127.0.0.1:8000",
+            "/health",
+            "get",
+            response=aiohttp.web_response.json_response(health_response, status=200),
+        )
+
+    caplog.set_level(logging.DEBUG, logger="aiolinkding")
+    headers = {"X-Custom": "value"}
+
+    async with aiohttp.ClientSession() as session:
+        client = Client(TEST_URL, TEST_TOKEN, session=session, log_payloads=False)
+        await client.async_request("get", "/health", headers=headers)
+        assert "Data received for /health" in caplog.text
+        assert "healthy" not in caplog.text
+
+        # The caller's headers aren't modified:
+        assert headers == {"X-Custom": "value"}
+
+        client = Client(TEST_URL, TEST_TOKEN, session=session)
+        await client.async_request("get", "/health")
+        assert "healthy" in caplog.text
+
+    aresponses.assert_plan_strictly_followed()
+
+
+class RecordingExecutor(ThreadPoolExecutor):
+    """Define a thread pool that records the functions submitted to it."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        super().__init__(max_workers=1)
+        self.calls: list[Callable[..., Any]] = []
+
+    def submit(
+        self,
+        fn: Callable[..., Any],
+        /,
+        *args: Any,  # noqa: ANN401
+        **kwargs: Any,  # noqa: ANN401
+    ) -> Future[Any]:
+        """Record a submitted function and run it.
+
+        Args:
+        ----
+            fn: The function.
+            *args: Positional arguments for the function.
+            **kwargs: Keyword arguments for the function.
+
+        Returns:
+        -------
+            A future.
+
+        """
+        self.calls.append(fn)
+        return super().submit(fn, *args, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_decode_offload(
+    aresponses: ResponsesMockServer,
+    authenticated_linkding_api_server: ResponsesMockServer,
+    bookmarks_async_get_all_response: dict[str, Any],
+) -> None:
+    """Test that only large response bodies are decoded in an executor.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_linkding_api_server: A mock authenticated linkding API server.
+        bookmarks_async_get_all_response: An API response payload.
+
+    """
+    large_response = {
+        **bookmarks_async_get_all_response,
+        "results": bookmarks_async_get_all_response["results"] * 100,
+    }
+
+    async def chunked_response(
+        request: aiohttp.web.Request,
+    ) -> aiohttp.web.StreamResponse:
+        """Return a small JSON body without a Content-Length.
+
+        Args:
+        ----
+            request: The incoming request.
+
+        Returns:
+        -------
+            A streamed response.
+
+        """
+        response = aiohttp.web.StreamResponse()
+        response.content_type = "application/json"
+        response.enable_chunked_encoding()
+        await response.prepare(request)
+        await response.write(b'{"id": 1}')
+        await response.write_eof()
+        return response
+
+    async with authenticated_linkding_api_server:
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/",
+            "get",
+            response=aiohttp.web_response.json_response(large_response, status=200),
+        )
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/archive/",
+            "get",
+            response=aiohttp.web_response.json_response(
+                bookmarks_async_get_all_response, status=200
+            ),
+        )
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/1/archive/",
+            "post",
+            response=aresponses.Response(status=204),
+        )
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/1/",
+            "get",
+            response=chunked_response,
+        )
+
+        executor = RecordingExecutor()
+        async with aiohttp.ClientSession() as session:
+            client = await async_get_client(
+                TEST_URL,
+                TEST_TOKEN,
+                session=session,
+                decode_offload_threshold=16 * 1024,
+                decode_executor=executor,
+            )
+            assert executor.calls == []
+
+            assert await client.bookmarks.async_get_all() == large_response
+            assert executor.calls == [json.loads]
+
+            assert (
+                await client.async_request("get", "/api/bookmarks/archive/")
+                == bookmarks_async_get_all_response
+            )
+            await client.bookmarks.async_archive(1)
+            # A small body of unknown length is only found to be small once read:
+            assert await client.bookmarks.async_get_single(1) == {"id": 1}
+            assert executor.calls == [json.loads]
+
+        executor.shutdown()
+
+    aresponses.assert_plan_strictly_followed()
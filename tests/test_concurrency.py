@@ -0,0 +1,74 @@
+"""Define tests for concurrency helpers."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from aiolinkding.util.concurrency import async_run_bounded
+
+
+@pytest.mark.asyncio
+async def test_run_bounded_error() -> None:
+    """Test that a failed call stops new items but lets running calls finish."""
+    finished: list[int] = []
+    release = asyncio.Event()
+
+    async def work(item: int) -> None:
+        """Fail on item 1 right away (and on item 3 once released).
+
+        Args:
+        ----
+            item: A number.
+
+        Raises:
+        ------
+            ValueError: Raised on items 1 and 3.
+
+        """
+        if item != 1:
+            await release.wait()
+        if item in (1, 3):
+            msg = f"Item {item} failed"
+            raise ValueError(msg)
+        finished.append(item)
+
+    task = asyncio.create_task(async_run_bounded(range(10), work, concurrency=4))
+    await asyncio.sleep(0.01)
+    assert not task.done()
+
+    # Only the first error is raised (but every call's error is retrieved):
+    release.set()
+    with pytest.raises(ValueError, match="Item 1 failed"):
+        await task
+    assert finished == [0, 2]
+
+
+@pytest.mark.asyncio
+async def test_run_bounded_cancelled() -> None:
+    """Test that cancelling the run cancels the running calls."""
+    started: list[int] = []
+    cancelled: list[int] = []
+
+    async def work(item: int) -> None:
+        """Wait until cancelled.
+
+        Args:
+        ----
+            item: A number.
+
+        """
+        started.append(item)
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.append(item)
+            raise
+
+    task = asyncio.create_task(async_run_bounded(range(10), work, concurrency=2))
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert started == sorted(cancelled) == [0, 1]
@@ -0,0 +1,171 @@
+"""Define tests for timeouts and deadlines."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import aiohttp
+from aiohttp import ClientTimeout
+from aresponses import ResponsesMockServer
+import pytest
+
+from aiolinkding import async_get_client
+from aiolinkding.errors import DeadlineExceededError, RequestTimeoutError
+from aiolinkding.util.deadline import deadline, remaining_time
+
+from .common import TEST_TOKEN, TEST_URL
+
+
+def test_nested_deadlines() -> None:
+    """Test that nested deadlines can only shorten the budget."""
+    assert remaining_time() is None
+
+    with deadline(10):
+        outer = remaining_time()
+        assert outer is not None
+        assert 9 < outer <= 10
+
+        with deadline(100):
+            inner = remaining_time()
+            assert inner is not None
+            assert inner <= 10
+
+        with deadline(1):
+            inner = remaining_time()
+            assert inner is not None
+            assert inner <= 1
+
+    assert remaining_time() is None
+
+
+@pytest.mark.asyncio
+async def test_deadline_already_expired(
+    aresponses: ResponsesMockServer,
+    authenticated_linkding_api_server: ResponsesMockServer,
+) -> None:
+    """Test that no request is sent once the deadline has expired.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_linkding_api_server: A mock authenticated linkding API server.
+
+    """
+    async with authenticated_linkding_api_server, aiohttp.ClientSession() as session:
+        client = await async_get_client(TEST_URL, TEST_TOKEN, session=session)
+        with deadline(0), pytest.raises(DeadlineExceededError):
+            await client.bookmarks.async_get_single(1)
+
+        # Existing timeout handlers catch deadline errors, too:
+        with deadline(0), pytest.raises(asyncio.TimeoutError):
+            await client.bookmarks.async_get_single(1)
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_deadline_shared_across_pages(
+    aresponses: ResponsesMockServer,
+    authenticated_linkding_api_server: ResponsesMockServer,
+    bookmarks_async_get_all_response: dict[str, Any],
+) -> None:
+    """Test that a deadline bounds an entire paginated operation.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_linkding_api_server: A mock authenticated linkding API server.
+        bookmarks_async_get_all_response: An API response payload.
+
+    """
+
+    async def slow_page(request: aiohttp.web.Request) -> aiohttp.web.Response:
+        """Return a page of bookmarks slowly.
+
+        Args:
+        ----
+            request: The incoming request.
+
+        Returns:
+        -------
+            A response.
+
+        """
+        await asyncio.sleep(0.1)
+        return aiohttp.web_response.json_response(
+            bookmarks_async_get_all_response, status=200
+        )
+
+    async with authenticated_linkding_api_server:
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/",
+            "get",
+            response=slow_page,
+            repeat=aresponses.INFINITY,
+        )
+
+        async with aiohttp.ClientSession() as session:
+            client = await async_get_client(TEST_URL, TEST_TOKEN, session=session)
+            bookmarks = []
+            with deadline(0.15), pytest.raises(DeadlineExceededError):
+                async for bookmark in client.bookmarks.async_iter_all(page_size=1):
+                    bookmarks.append(bookmark)  # noqa: PERF401
+            assert len(bookmarks) == 1
+
+
+@pytest.mark.asyncio
+async def test_method_timeout(
+    aresponses: ResponsesMockServer,
+    authenticated_linkding_api_server: ResponsesMockServer,
+) -> None:
+    """Test a timeout configured for a particular HTTP method.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_linkding_api_server: A mock authenticated linkding API server.
+
+    """
+
+    async def slow_response(request: aiohttp.web.Request) -> aiohttp.web.Response:
+        """Return a response slowly.
+
+        Args:
+        ----
+            request: The incoming request.
+
+        Returns:
+        -------
+            A response.
+
+        """
+        await asyncio.sleep(0.2)
+        return aiohttp.web_response.json_response({}, status=200)
+
+    async with authenticated_linkding_api_server:
+        for _ in range(2):
+            authenticated_linkding_api_server.add(
+                "127.0.0.1:8000",
+                "/api/bookmarks/1/",
+                "delete",
+                response=slow_response,
+            )
+
+        async with aiohttp.ClientSession() as session:
+            client = await async_get_client(
+                TEST_URL,
+                TEST_TOKEN,
+                session=session,
+                request_timeout=ClientTimeout(total=10),
+                method_timeouts={"DELETE": ClientTimeout(total=0.05)},
+            )
+            with pytest.raises(TimeoutError):
+                await client.bookmarks.async_delete(1)
+
+            # A request that times out within a longer deadline isn't reported as
+            # the deadline expiring:
+            with deadline(10), pytest.raises(RequestTimeoutError) as err:
+                await client.bookmarks.async_delete(1)
+            assert not isinstance(err.value, DeadlineExceededError)
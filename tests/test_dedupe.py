@@ -0,0 +1,235 @@
+"""Define tests for duplicate detection."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import aiohttp
+from aresponses import ResponsesMockServer
+import pytest
+
+from aiolinkding import async_get_client
+from aiolinkding.util.dedupe import DuplicateFinder, DuplicateReason, canonicalize_url
+
+from .common import TEST_TOKEN, TEST_URL
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://example.com/post",
+        "http://example.com/post/",
+        "https://www.Example.com/post?utm_source=feed&utm_medium=rss",
+        "https://example.com:443/post#comments",
+        "https://amp.example.com/post/amp/",
+        "https://m.example.com/post?fbclid=abc",
+    ],
+)
+def test_canonicalize_url(url: str) -> None:
+    """Test that URL variants share a canonical form.
+
+    Args:
+    ----
+        url: A variant of the URL.
+
+    """
+    assert canonicalize_url(url) == "example.com/post"
+
+
+def test_canonicalize_url_keeps_meaningful_parts() -> None:
+    """Test that URLs that differ meaningfully keep different canonical forms."""
+    assert canonicalize_url("https://example.com/?b=2&a=1") == canonicalize_url(
+        "https://example.com/?a=1&b=2"
+    )
+    assert canonicalize_url("https://example.com/?a=1") != canonicalize_url(
+        "https://example.com/?a=2"
+    )
+    assert canonicalize_url("https://example.com:8443/") != canonicalize_url(
+        "https://example.com/"
+    )
+    assert canonicalize_url("https://example.com/a") != canonicalize_url(
+        "https://example.com/b"
+    )
+    # Invalid ports are ignored:
+    assert canonicalize_url("https://example.com:99999/a") == "example.com/a"
+
+
+def test_duplicate_finder() -> None:
+    """Test grouping duplicates by URL and by title."""
+    finder = DuplicateFinder()
+    for bookmark in (
+        {"id": 1, "url": "https://a.com/x", "title": "Writing fast Python code"},
+        {"id": 2, "url": "https://b.com/", "title": "Home"},
+        {"id": 3, "url": "http://www.a.com/x/", "title": ""},
+        {"id": 4, "url": "https://c.com/", "title": "Home"},
+        {"id": 5, "url": "https://d.com/y", "title": "Writing Fast Python Code!"},
+        {"id": 6, "url": "https://e.com/", "title": "An unrelated article title"},
+        {"id": 7, "url": "https://f.com/", "website_title": "Writing fast python code"},
+    ):
+        finder.add(bookmark)
+
+    groups = finder.groups()
+    assert [group.ids for group in groups] == [[1, 3, 5, 7]]
+    assert groups[0].reasons == {DuplicateReason.TITLE, DuplicateReason.URL}
+
+    # Title matching can be turned off entirely:
+    finder = DuplicateFinder(title_distance=None)
+    finder.add({"id": 1, "url": "https://a.com/x", "title": "Writing fast code"})
+    finder.add({"id": 2, "url": "https://b.com/x", "title": "Writing fast code"})
+    assert finder.groups() == []
+
+    # Only the bookmarks that share a URL can be split out of a group:
+    assert [group.ids for group in groups[0].url_groups()] == [[1, 3]]
+
+
+def test_duplicate_finder_title_distance(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that titles within any valid title distance are matched.
+
+    Args:
+    ----
+        monkeypatch: The pytest monkeypatch fixture.
+
+    """
+    # Two fingerprints that differ by a single bit in each 16-bit quarter:
+    fingerprints = {"a": 0, "b": 1 | 1 << 16 | 1 << 32 | 1 << 48}
+    monkeypatch.setattr("aiolinkding.util.dedupe.simhash", fingerprints.get)
+
+    finder = DuplicateFinder(title_distance=4)
+    finder.add({"id": 1, "url": "https://a.com/", "title": "a"})
+    finder.add({"id": 2, "url": "https://b.com/", "title": "b"})
+    assert [group.ids for group in finder.groups()] == [[1, 2]]
+
+    for title_distance in (-1, 64):
+        with pytest.raises(ValueError, match="between 0 and 63"):
+            DuplicateFinder(title_distance=title_distance)
+
+
+@pytest.mark.asyncio
+async def test_find_and_merge_duplicates(
+    aresponses: ResponsesMockServer,
+    authenticated_linkding_api_server: ResponsesMockServer,
+    bookmarks_async_get_all_response: dict[str, Any],
+    bookmarks_async_get_single_response: dict[str, Any],
+) -> None:
+    """Test finding duplicates across the collection and merging them.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_linkding_api_server: A mock authenticated linkding API server.
+        bookmarks_async_get_all_response: An API response payload.
+        bookmarks_async_get_single_response: An API response payload.
+
+    """
+    requests: list[tuple[str, str, Any]] = []
+
+    async def record(request: aiohttp.web.Request) -> aiohttp.web.Response:
+        """Record a mutation.
+
+        Args:
+        ----
+            request: The incoming request.
+
+        Returns:
+        -------
+            A response.
+
+        """
+        payload = await request.json() if request.can_read_body else None
+        requests.append((request.method, request.path, payload))
+        if request.method == "DELETE":
+            return aiohttp.web_response.Response(status=204)
+        return aiohttp.web_response.json_response(
+            bookmarks_async_get_single_response, status=200
+        )
+
+    bookmark = bookmarks_async_get_all_response["results"][0]
+
+    async with authenticated_linkding_api_server:
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/",
+            "get",
+            response=aiohttp.web_response.json_response(
+                {
+                    **bookmarks_async_get_all_response,
+                    "next": None,
+                    "results": [
+                        bookmark,
+                        {
+                            **bookmark,
+                            "id": 2,
+                            "url": "https://example.com/?utm_source=feed",
+                            "tag_names": ["tag3"],
+                        },
+                        {
+                            **bookmark,
+                            "id": 3,
+                            "url": "https://other.com",
+                            "title": "Something else entirely",
+                        },
+                        {
+                            **bookmark,
+                            "id": 5,
+                            "url": "https://mirror.example.org/post",
+                            "title": "Something else, entirely!",
+                        },
+                    ],
+                },
+                status=200,
+            ),
+        )
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/archived/",
+            "get",
+            response=aiohttp.web_response.json_response(
+                {
+                    **bookmarks_async_get_all_response,
+                    "next": None,
+                    "results": [
+                        {
+                            **bookmark,
+                            "id": 4,
+                            "url": "http://www.example.com/",
+                            "tag_names": ["tag1"],
+                        }
+                    ],
+                },
+                status=200,
+            ),
+        )
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000", "/api/bookmarks/1/", "patch", response=record
+        )
+        for path in ("/api/bookmarks/2/", "/api/bookmarks/4/", "/api/bookmarks/3/"):
+            authenticated_linkding_api_server.add(
+                "127.0.0.1:8000", path, "delete", response=record
+            )
+
+        async with aiohttp.ClientSession() as session:
+            client = await async_get_client(TEST_URL, TEST_TOKEN, session=session)
+
+            groups = await client.bookmarks.async_find_duplicates()
+            assert [group.ids for group in groups] == [[1, 2, 4], [3, 5]]
+            assert groups[0].reasons == {DuplicateReason.URL}
+            assert groups[1].reasons == {DuplicateReason.TITLE}
+
+            # Title matches are left alone by default:
+            progress = await client.bookmarks.async_merge_duplicates(groups)
+            assert progress.processed == 1
+            assert requests == [
+                ("PATCH", "/api/bookmarks/1/", {"tag_names": ["tag1", "tag2", "tag3"]}),
+                ("DELETE", "/api/bookmarks/2/", None),
+                ("DELETE", "/api/bookmarks/4/", None),
+            ]
+
+            progress = await client.bookmarks.async_merge_duplicates(
+                groups[1:],
+                keep=lambda bookmarks: bookmarks[-1],
+                include_title_matches=True,
+            )
+            assert progress.processed == 1
+            assert requests[3:] == [("DELETE", "/api/bookmarks/3/", None)]
+
+    aresponses.assert_plan_strictly_followed()
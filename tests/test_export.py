@@ -0,0 +1,661 @@
+"""Define tests for streaming export/import."""
+
+from __future__ import annotations
+
+import io
+import json
+from pathlib import Path
+from typing import Any
+
+import aiohttp
+from aresponses import ResponsesMockServer
+import pytest
+
+from aiolinkding import async_get_client
+from aiolinkding.errors import RequestError
+from aiolinkding.util.checkpoint import Checkpoint
+from aiolinkding.util.formats import BookmarkWriter, ExportFormat, iter_bookmarks
+from aiolinkding.util.progress import Progress, ProgressReporter
+
+from .common import TEST_TOKEN, TEST_URL
+
+NEW_BOOKMARK = {
+    "url": "https://new.example.com",
+    "title": "New & improved",
+    "description": "A new description",
+    "tag_names": ["tag3"],
+    "is_archived": False,
+    "unread": True,
+    "shared": True,
+}
+
+
+def _add_bookmark_pages(
+    server: ResponsesMockServer,
+    bookmarks_async_get_all_response: dict[str, Any],
+    *,
+    archived_results: list[dict[str, Any]],
+) -> None:
+    """Add an active page and an archived page of bookmarks to a mock server.
+
+    Args:
+    ----
+        server: The mock server.
+        bookmarks_async_get_all_response: An API response payload.
+        archived_results: The archived bookmarks to return.
+
+    """
+    server.add(
+        "127.0.0.1:8000",
+        "/api/bookmarks/",
+        "get",
+        response=aiohttp.web_response.json_response(
+            {**bookmarks_async_get_all_response, "next": None}, status=200
+        ),
+    )
+    server.add(
+        "127.0.0.1:8000",
+        "/api/bookmarks/archived/",
+        "get",
+        response=aiohttp.web_response.json_response(
+            {
+                **bookmarks_async_get_all_response,
+                "next": None,
+                "results": archived_results,
+            },
+            status=200,
+        ),
+    )
+
+
+@pytest.mark.parametrize("export_format", list(ExportFormat))
+def test_round_trip(export_format: ExportFormat) -> None:
+    """Test that written bookmarks can be read back.
+
+    Args:
+    ----
+        export_format: The format to test.
+
+    """
+    fp = io.StringIO()
+    writer = BookmarkWriter(fp, export_format)
+    writer.write({**NEW_BOOKMARK, "date_added": "2020-09-26T09:46:23.006313Z"})
+    writer.write({"url": "https://example.com", "is_archived": True})
+    writer.close()
+
+    fp.seek(0)
+    bookmarks = list(iter_bookmarks(fp, export_format))
+    assert len(bookmarks) == 2
+
+    for key, value in NEW_BOOKMARK.items():
+        assert bookmarks[0][key] == value
+    assert bookmarks[1]["url"] == "https://example.com"
+    assert bookmarks[1]["is_archived"] is True
+    assert not bookmarks[1].get("shared")
+
+
+def test_missing_and_invalid_fields() -> None:
+    """Test reading and writing bookmarks with missing or unparseable fields."""
+    fp = io.StringIO("url,title\nhttps://example.com,Example\n")
+    assert list(iter_bookmarks(fp, ExportFormat.CSV)) == [
+        {
+            "url": "https://example.com",
+            "title": "Example",
+            "tag_names": [],
+            "is_archived": False,
+            "unread": False,
+            "shared": False,
+        }
+    ]
+
+    fp = io.StringIO()
+    writer = BookmarkWriter(fp, ExportFormat.HTML)
+    writer.write({"url": "https://example.com", "date_added": "yesterday"})
+    writer.close()
+    assert "ADD_DATE" not in fp.getvalue()
+
+
+def test_progress_reporter() -> None:
+    """Test that progress is reported at every interval."""
+    updates: list[tuple[int, int]] = []
+    reporter = ProgressReporter(
+        lambda progress: updates.append((progress.processed, progress.skipped)),
+        interval=2,
+    )
+    for skipped in (False, True, False, False, True):
+        reporter.advance(skipped=skipped)
+    assert updates == [(1, 1), (3, 1)]
+
+    progress = reporter.finish()
+    assert updates[-1] == (3, 2)
+
+    # A progress that hasn't started yet has no rate:
+    progress.started_at += 60
+    assert progress.rate == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("export_format", list(ExportFormat))
+async def test_export(
+    aresponses: ResponsesMockServer,
+    authenticated_linkding_api_server: ResponsesMockServer,
+    bookmarks_async_get_all_response: dict[str, Any],
+    export_format: ExportFormat,
+) -> None:
+    """Test exporting bookmarks (including archived ones).
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_linkding_api_server: A mock authenticated linkding API server.
+        bookmarks_async_get_all_response: An API response payload.
+        export_format: The format to test.
+
+    """
+    archived_bookmark = {
+        **bookmarks_async_get_all_response["results"][0],
+        "id": 2,
+        "url": "https://archived.example.com",
+        "is_archived": True,
+    }
+    updates: list[Progress] = []
+
+    async with authenticated_linkding_api_server:
+        _add_bookmark_pages(
+            authenticated_linkding_api_server,
+            bookmarks_async_get_all_response,
+            archived_results=[archived_bookmark],
+        )
+
+        async with aiohttp.ClientSession() as session:
+            client = await async_get_client(TEST_URL, TEST_TOKEN, session=session)
+            fp = io.StringIO()
+            progress = await client.bookmarks.async_export(
+                fp, format=export_format, progress=updates.append
+            )
+
+    assert progress.processed == 2
+    assert progress.rate >= 0
+    assert updates == [progress]
+
+    fp.seek(0)
+    exported = list(iter_bookmarks(fp, export_format))
+    assert [bookmark["url"] for bookmark in exported] == [
+        "https://example.com",
+        "https://archived.example.com",
+    ]
+    assert [bookmark["is_archived"] for bookmark in exported] == [False, True]
+
+    if export_format is ExportFormat.NDJSON:
+        fp.seek(0)
+        assert (
+            json.loads(fp.readline())
+            == (bookmarks_async_get_all_response["results"][0])
+        )
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("export_format", list(ExportFormat))
+async def test_import(
+    aresponses: ResponsesMockServer,
+    authenticated_linkding_api_server: ResponsesMockServer,
+    bookmarks_async_get_all_response: dict[str, Any],
+    bookmarks_async_get_single_response: dict[str, Any],
+    export_format: ExportFormat,
+) -> None:
+    """Test importing bookmarks with deduplication by URL.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_linkding_api_server: A mock authenticated linkding API server.
+        bookmarks_async_get_all_response: An API response payload.
+        bookmarks_async_get_single_response: An API response payload.
+        export_format: The format to test.
+
+    """
+    fp = io.StringIO()
+    writer = BookmarkWriter(fp, export_format)
+    # This one already exists on the server:
+    writer.write({"url": "https://example.com"})
+    # This one appears twice in the file:
+    writer.write(NEW_BOOKMARK)
+    writer.write(NEW_BOOKMARK)
+    writer.close()
+    fp.seek(0)
+
+    created: list[dict[str, Any]] = []
+
+    async def create(request: aiohttp.web.Request) -> aiohttp.web.Response:
+        """Record a created bookmark.
+
+        Args:
+        ----
+            request: The incoming request.
+
+        Returns:
+        -------
+            A response.
+
+        """
+        created.append(await request.json())
+        return aiohttp.web_response.json_response(
+            bookmarks_async_get_single_response, status=201
+        )
+
+    async with authenticated_linkding_api_server:
+        _add_bookmark_pages(
+            authenticated_linkding_api_server,
+            bookmarks_async_get_all_response,
+            archived_results=[],
+        )
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000", "/api/bookmarks/", "post", response=create
+        )
+
+        async with aiohttp.ClientSession() as session:
+            client = await async_get_client(TEST_URL, TEST_TOKEN, session=session)
+            progress = await client.bookmarks.async_import(fp, format=export_format)
+
+    assert progress.processed == 1
+    assert progress.skipped == 2
+    assert len(created) == 1
+    for key, value in NEW_BOOKMARK.items():
+        assert created[0][key] == value
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_create_many_error(
+    aresponses: ResponsesMockServer,
+    authenticated_linkding_api_server: ResponsesMockServer,
+    missing_field_response: dict[str, Any],
+) -> None:
+    """Test that an error while creating many bookmarks is raised.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_linkding_api_server: A mock authenticated linkding API server.
+        missing_field_response: An API response payload.
+
+    """
+    async with authenticated_linkding_api_server:
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/",
+            "post",
+            response=aiohttp.web_response.json_response(
+                missing_field_response, status=400
+            ),
+        )
+
+        async with aiohttp.ClientSession() as session:
+            client = await async_get_client(TEST_URL, TEST_TOKEN, session=session)
+            with pytest.raises(RequestError, match="This field is required"):
+                await client.bookmarks.async_create_many(
+                    [{"url": "https://example.com"}], concurrency=1
+                )
+
+
+@pytest.mark.asyncio
+async def test_create_many_resume(
+    aresponses: ResponsesMockServer,
+    authenticated_linkding_api_server: ResponsesMockServer,
+    bookmarks_async_get_single_response: dict[str, Any],
+    tmp_path: Path,
+) -> None:
+    """Test that creating many bookmarks skips those a previous run created.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_linkding_api_server: A mock authenticated linkding API server.
+        bookmarks_async_get_single_response: An API response payload.
+        tmp_path: A temporary directory.
+
+    """
+    path = tmp_path / "create.checkpoint"
+    checkpoint = Checkpoint(path)
+    checkpoint.mark_done(0)
+    checkpoint.save()
+
+    async with authenticated_linkding_api_server:
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/",
+            "post",
+            response=aiohttp.web_response.json_response(
+                bookmarks_async_get_single_response, status=201
+            ),
+        )
+
+        async with aiohttp.ClientSession() as session:
+            client = await async_get_client(TEST_URL, TEST_TOKEN, session=session)
+            progress = await client.bookmarks.async_create_many(
+                [{"url": "https://example.com/0"}, {"url": "https://example.com/1"}],
+                checkpoint=Checkpoint(path),
+            )
+
+    assert progress.processed == 1
+    assert progress.skipped == 1
+    assert not path.exists()
+    aresponses.assert_plan_strictly_followed()
+
+
+def test_checkpoint(tmp_path: Path) -> None:
+    """Test that a checkpoint compacts rows that finish out of order.
+
+    Args:
+    ----
+        tmp_path: A temporary directory.
+
+    """
+    path = tmp_path / "import.checkpoint"
+    checkpoint = Checkpoint(path, interval=2)
+    assert not checkpoint.resumed
+
+    checkpoint.mark_done(1)
+    checkpoint.mark_done(3)
+    assert checkpoint.offset == 0
+    assert path.exists()
+
+    checkpoint.mark_done(0)
+    assert checkpoint.offset == 2
+
+    resumed = Checkpoint(path)
+    assert resumed.resumed
+    assert resumed.offset == 0
+    assert [resumed.is_done(index) for index in range(4)] == [
+        False,
+        True,
+        False,
+        True,
+    ]
+
+    checkpoint.clear()
+    assert not path.exists()
+
+    # A stream bound to a checkpoint that isn't resumed starts over:
+    fp = io.StringIO("The output of a completed export")
+    Checkpoint(path).bind(fp)
+    assert not fp.getvalue()
+
+
+@pytest.mark.asyncio
+async def test_import_resume(
+    aresponses: ResponsesMockServer,
+    authenticated_linkding_api_server: ResponsesMockServer,
+    bookmarks_async_get_single_response: dict[str, Any],
+    missing_field_response: dict[str, Any],
+    tmp_path: Path,
+) -> None:
+    """Test that an interrupted import resumes without creating duplicates.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_linkding_api_server: A mock authenticated linkding API server.
+        bookmarks_async_get_single_response: An API response payload.
+        missing_field_response: An API response payload.
+        tmp_path: A temporary directory.
+
+    """
+    path = tmp_path / "import.checkpoint"
+    fp = io.StringIO()
+    writer = BookmarkWriter(fp, ExportFormat.NDJSON)
+    for index in range(3):
+        writer.write({"url": f"https://example.com/{index}"})
+
+    created: list[str] = []
+
+    async def create(request: aiohttp.web.Request) -> aiohttp.web.Response:
+        """Record a created bookmark.
+
+        Args:
+        ----
+            request: The incoming request.
+
+        Returns:
+        -------
+            A response.
+
+        """
+        created.append((await request.json())["url"])
+        return aiohttp.web_response.json_response(
+            bookmarks_async_get_single_response, status=201
+        )
+
+    async with authenticated_linkding_api_server:
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000", "/api/bookmarks/", "post", response=create
+        )
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/",
+            "post",
+            response=aiohttp.web_response.json_response(
+                missing_field_response, status=400
+            ),
+        )
+        for _ in range(2):
+            authenticated_linkding_api_server.add(
+                "127.0.0.1:8000", "/api/bookmarks/", "post", response=create
+            )
+
+        async with aiohttp.ClientSession() as session:
+            client = await async_get_client(TEST_URL, TEST_TOKEN, session=session)
+
+            fp.seek(0)
+            with pytest.raises(RequestError):
+                await client.bookmarks.async_import(
+                    fp,
+                    skip_existing=False,
+                    concurrency=1,
+                    checkpoint=Checkpoint(path),
+                )
+            assert path.exists()
+
+            fp.seek(0)
+            progress = await client.bookmarks.async_import(
+                fp, skip_existing=False, concurrency=1, checkpoint=Checkpoint(path)
+            )
+
+    assert created == [f"https://example.com/{index}" for index in range(3)]
+    assert progress.processed == 2
+    assert progress.skipped == 1
+    assert not path.exists()
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("export_format", list(ExportFormat))
+async def test_export_resume(
+    aresponses: ResponsesMockServer,
+    authenticated_linkding_api_server: ResponsesMockServer,
+    bookmarks_async_get_all_response: dict[str, Any],
+    export_format: ExportFormat,
+    tmp_path: Path,
+) -> None:
+    """Test that an interrupted export resumes where it left off.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_linkding_api_server: A mock authenticated linkding API server.
+        bookmarks_async_get_all_response: An API response payload.
+        export_format: The format to test.
+        tmp_path: A temporary directory.
+
+    """
+    path = tmp_path / "export.checkpoint"
+    archived_bookmark = {
+        **bookmarks_async_get_all_response["results"][0],
+        "id": 2,
+        "url": "https://archived.example.com",
+        "is_archived": True,
+    }
+
+    async with authenticated_linkding_api_server:
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/",
+            "get",
+            response=aiohttp.web_response.json_response(
+                {**bookmarks_async_get_all_response, "next": None}, status=200
+            ),
+        )
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/archived/",
+            "get",
+            response=aresponses.Response(text="Server error", status=500),
+        )
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/archived/",
+            "get",
+            response=aiohttp.web_response.json_response(
+                {
+                    **bookmarks_async_get_all_response,
+                    "next": None,
+                    "results": [archived_bookmark],
+                },
+                status=200,
+            ),
+        )
+
+        async with aiohttp.ClientSession() as session:
+            client = await async_get_client(TEST_URL, TEST_TOKEN, session=session)
+
+            fp = io.StringIO()
+            with pytest.raises(RequestError):
+                await client.bookmarks.async_export(
+                    fp, format=export_format, checkpoint=Checkpoint(path)
+                )
+            # Simulate a partially written row that was never checkpointed:
+            fp.write("garbage")
+
+            progress = await client.bookmarks.async_export(
+                fp, format=export_format, checkpoint=Checkpoint(path)
+            )
+
+    assert progress.processed == 1
+    assert not path.exists()
+
+    fp.seek(0)
+    exported = list(iter_bookmarks(fp, export_format))
+    assert [bookmark["url"] for bookmark in exported] == [
+        bookmarks_async_get_all_response["results"][0]["url"],
+        "https://archived.example.com",
+    ]
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_export_resume_after_deletion(
+    aresponses: ResponsesMockServer,
+    authenticated_linkding_api_server: ResponsesMockServer,
+    bookmarks_async_get_all_response: dict[str, Any],
+    tmp_path: Path,
+) -> None:
+    """Test that a resumed export continues after the last exported bookmark.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_linkding_api_server: A mock authenticated linkding API server.
+        bookmarks_async_get_all_response: An API response payload.
+        tmp_path: A temporary directory.
+
+    """
+    path = tmp_path / "export.checkpoint"
+    bookmarks = [
+        {
+            **bookmarks_async_get_all_response["results"][0],
+            "id": bookmark_id,
+            "url": f"https://example.com/{bookmark_id}",
+        }
+        for bookmark_id in range(1, 5)
+    ]
+
+    def page(results: list[dict[str, Any]], *, last: bool) -> aiohttp.web.Response:
+        """Return a page of bookmarks.
+
+        Args:
+        ----
+            results: The bookmarks on the page.
+            last: Whether this is the last page.
+
+        Returns:
+        -------
+            A response.
+
+        """
+        return aiohttp.web_response.json_response(
+            {
+                "count": 4,
+                "next": None if last else f"{TEST_URL}/api/bookmarks/",
+                "previous": None,
+                "results": results,
+            },
+            status=200,
+        )
+
+    async with authenticated_linkding_api_server:
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/",
+            "get",
+            response=page(bookmarks[:2], last=False),
+        )
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/",
+            "get",
+            response=aresponses.Response(text="Server error", status=500),
+        )
+        # The first bookmark is deleted before the export is resumed, which shifts
+        # every later bookmark back by one:
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/",
+            "get",
+            response=page(bookmarks[1:3], last=False),
+        )
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/",
+            "get",
+            response=page(bookmarks[3:], last=True),
+        )
+
+        async with aiohttp.ClientSession() as session:
+            client = await async_get_client(TEST_URL, TEST_TOKEN, session=session)
+
+            fp = io.StringIO()
+            with pytest.raises(RequestError):
+                await client.bookmarks.async_export(
+                    fp, include_archived=False, page_size=2, checkpoint=Checkpoint(path)
+                )
+            progress = await client.bookmarks.async_export(
+                fp, include_archived=False, page_size=2, checkpoint=Checkpoint(path)
+            )
+
+    assert progress.processed == 2
+    assert not path.exists()
+
+    fp.seek(0)
+    assert [bookmark["id"] for bookmark in iter_bookmarks(fp, ExportFormat.NDJSON)] == [
+        1,
+        2,
+        3,
+        4,
+    ]
+
+    aresponses.assert_plan_strictly_followed()
@@ -0,0 +1,287 @@
+"""Define tests for the adaptive concurrency limiter."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import aiohttp
+from aresponses import ResponsesMockServer
+import pytest
+
+from aiolinkding import Client, async_get_client
+from aiolinkding.errors import RequestError
+from aiolinkding.util.limiter import AdaptiveLimiter
+
+from .common import TEST_TOKEN, TEST_URL
+
+
+@pytest.mark.asyncio
+async def test_additive_increase() -> None:
+    """Test that the limit grows while latency stays flat and the limit is reached."""
+    limiter = AdaptiveLimiter(initial_limit=2, max_limit=3, window_size=2)
+    assert limiter.p95_latency is None
+
+    async def request() -> None:
+        """Simulate a request."""
+        async with limiter.slot():
+            await asyncio.sleep(0)
+
+    for _ in range(3):
+        await asyncio.gather(request(), request())
+
+    assert limiter.limit == 3
+    assert limiter.in_flight == 0
+    assert limiter.p95_latency is not None
+
+
+@pytest.mark.asyncio
+async def test_no_increase_below_limit() -> None:
+    """Test that the limit doesn't grow while it isn't reached."""
+    limiter = AdaptiveLimiter(initial_limit=2, window_size=2)
+
+    for _ in range(6):
+        async with limiter.slot():
+            pass
+
+    assert limiter.limit == 2
+
+
+@pytest.mark.asyncio
+async def test_backoff_on_latency(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the limit is cut when p95 latency rises.
+
+    Args:
+    ----
+        monkeypatch: The pytest monkeypatch fixture.
+
+    """
+    now = 0.0
+
+    def monotonic() -> float:
+        """Return a fake monotonic time."""
+        return now
+
+    monkeypatch.setattr("aiolinkding.util.limiter.time.monotonic", monotonic)
+    limiter = AdaptiveLimiter(initial_limit=1, window_size=1, latency_tolerance=1.5)
+
+    for latency in (1.0, 1.0):
+        async with limiter.slot():
+            now += latency
+    # Only the first (saturated) window grows the limit:
+    assert limiter.limit == 2
+
+    async with limiter.slot():
+        now += 5.0
+    assert limiter.limit == 1
+
+
+@pytest.mark.asyncio
+async def test_backoff_on_overload() -> None:
+    """Test that the limit is cut when the server signals overload."""
+    limiter = AdaptiveLimiter(initial_limit=8, min_limit=3)
+
+    async with limiter.slot() as slot:
+        slot.overloaded = True
+    assert limiter.limit == 4
+
+    async with limiter.slot() as slot:
+        slot.overloaded = True
+    assert limiter.limit == 3
+
+
+@pytest.mark.asyncio
+async def test_single_backoff_per_burst() -> None:
+    """Test that concurrent overloads only cut the limit once."""
+    limiter = AdaptiveLimiter(initial_limit=8)
+    release = asyncio.Event()
+
+    async def request() -> None:
+        """Simulate a request that the server rejects as overloaded."""
+        async with limiter.slot() as slot:
+            await release.wait()
+            slot.overloaded = True
+
+    burst = [asyncio.create_task(request()) for _ in range(4)]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(*burst)
+    assert limiter.limit == 4
+
+    # Requests sent under the new limit can cut it again:
+    async with limiter.slot() as slot:
+        slot.overloaded = True
+    assert limiter.limit == 2
+
+
+@pytest.mark.asyncio
+async def test_enforces_limit() -> None:
+    """Test that no more than the limit of requests can be in flight."""
+    limiter = AdaptiveLimiter(initial_limit=2, max_limit=2)
+    peak = 0
+
+    async def request() -> None:
+        """Simulate a request."""
+        nonlocal peak
+        async with limiter.slot():
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0)
+
+    waiting = asyncio.create_task(request())
+    await asyncio.gather(*(request() for _ in range(10)))
+    await waiting
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter() -> None:
+    """Test that cancelling a waiting request doesn't leak a slot."""
+    limiter = AdaptiveLimiter(initial_limit=1, max_limit=1)
+
+    async with limiter.slot():
+        waiter = asyncio.create_task(limiter._async_acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+    async with limiter.slot():
+        assert limiter.in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_after_wakeup() -> None:
+    """Test that a waiter cancelled after being woken up passes the slot along."""
+    limiter = AdaptiveLimiter(initial_limit=1, max_limit=1)
+
+    async with limiter.slot():
+        first = asyncio.create_task(limiter._async_acquire())
+        second = asyncio.create_task(limiter._async_acquire())
+        await asyncio.sleep(0)
+
+    # The first waiter has been woken up, but is cancelled before taking the slot:
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+    await second
+    assert limiter.in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_client_backoff_on_server_error(
+    aresponses: ResponsesMockServer,
+    authenticated_linkding_api_server: ResponsesMockServer,
+    bookmarks_async_get_single_response: dict[str, Any],
+) -> None:
+    """Test that a client's limiter backs off upon an HTTP 5xx.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_linkding_api_server: A mock authenticated linkding API server.
+        bookmarks_async_get_single_response: An API response payload.
+
+    """
+    async with authenticated_linkding_api_server:
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/1/",
+            "get",
+            response=aiohttp.web_response.json_response(
+                {"detail": "Server error"}, status=503
+            ),
+        )
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/1/",
+            "get",
+            response=aiohttp.web_response.json_response(
+                {"detail": "Not found"}, status=400
+            ),
+        )
+
+        async with aiohttp.ClientSession() as session:
+            client = await async_get_client(
+                TEST_URL,
+                TEST_TOKEN,
+                session=session,
+                concurrency_limiter=AdaptiveLimiter(initial_limit=8),
+            )
+            assert client.concurrency_limit == 8
+
+            with pytest.raises(RequestError):
+                await client.bookmarks.async_get_single(1)
+            assert client.concurrency_limit == 4
+
+            # A client error isn't an overload signal:
+            with pytest.raises(RequestError):
+                await client.bookmarks.async_get_single(1)
+            assert client.concurrency_limit == 4
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_client_static_limit() -> None:
+    """Test the concurrency limit of a client with a static cap."""
+    client = Client(TEST_URL, TEST_TOKEN, max_concurrent_requests=2)
+    assert client.concurrency_limit == 2
+
+
+@pytest.mark.asyncio
+async def test_client_bulk_concurrency(
+    aresponses: ResponsesMockServer,
+    authenticated_linkding_api_server: ResponsesMockServer,
+    bookmarks_async_get_single_response: dict[str, Any],
+) -> None:
+    """Test that bulk operations take their concurrency from the adaptive limiter.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_linkding_api_server: A mock authenticated linkding API server.
+        bookmarks_async_get_single_response: An API response payload.
+
+    """
+    limiter = AdaptiveLimiter(initial_limit=12)
+    received = 0
+    release = asyncio.Event()
+
+    async def slow_response(_: aiohttp.web.Request) -> aiohttp.web.Response:
+        """Respond once every request is in flight.
+
+        Returns
+        -------
+            A response.
+
+        """
+        nonlocal received
+        received += 1
+        if received == limiter.limit:
+            release.set()
+        await release.wait()
+        return aiohttp.web_response.json_response(
+            bookmarks_async_get_single_response, status=200
+        )
+
+    async with authenticated_linkding_api_server:
+        for bookmark_id in range(1, 13):
+            authenticated_linkding_api_server.add(
+                "127.0.0.1:8000",
+                f"/api/bookmarks/{bookmark_id}/",
+                "get",
+                response=slow_response,
+            )
+
+        async with aiohttp.ClientSession() as session:
+            client = await async_get_client(
+                TEST_URL, TEST_TOKEN, session=session, concurrency_limiter=limiter
+            )
+            # More requests than the default bulk concurrency (8) are sent at once,
+            # or the responses would never be released:
+            async with asyncio.timeout(1):
+                batch = await client.bookmarks.async_get_many(range(1, 13), max_age=0)
+
+    assert len(batch.bookmarks) == 12
+    aresponses.assert_plan_strictly_followed()
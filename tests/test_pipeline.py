@@ -0,0 +1,229 @@
+"""Define tests for transform-and-write pipelines."""
+
+from __future__ import annotations
+
+import asyncio
+from functools import partial
+from typing import Any
+
+import aiohttp
+from aresponses import ResponsesMockServer
+import pytest
+
+from aiolinkding import async_get_client
+from aiolinkding.util.pipeline import Pipeline
+
+from .common import TEST_TOKEN, TEST_URL
+
+
+@pytest.mark.asyncio
+async def test_pipeline_backpressure() -> None:
+    """Test that a slow sink bounds how far ahead the source reads."""
+    gate = asyncio.Event()
+    written: list[int] = []
+
+    async def double(item: int) -> int | None:
+        """Double odd numbers and drop even ones.
+
+        Args:
+        ----
+            item: A number.
+
+        Returns:
+        -------
+            The doubled number (or None).
+
+        """
+        return item * 2 if item % 2 else None
+
+    async def write(item: int) -> None:
+        """Write a number once the gate opens.
+
+        Args:
+        ----
+            item: A number.
+
+        """
+        await gate.wait()
+        written.append(item)
+
+    pipeline = (
+        Pipeline(range(100), queue_size=2)
+        .stage(double, concurrency=2)
+        .sink(write, concurrency=1)
+    )
+    assert all(stage.throughput == 0 for stage in pipeline.stats)
+
+    run = asyncio.create_task(pipeline.async_run())
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+    # Every queue is full and the source is blocked:
+    source, double_stats, sink_stats = pipeline.stats
+    assert source.processed < 20
+    assert double_stats.queue_depth == 2
+    assert sink_stats.queue_depth == 2
+    assert sink_stats.active == 1
+
+    gate.set()
+    stats = await run
+
+    assert sorted(written) == [item * 2 for item in range(1, 100, 2)]
+    assert [(stage.name, stage.processed, stage.dropped) for stage in stats] == [
+        ("source", 100, 0),
+        ("double", 50, 50),
+        ("sink", 50, 0),
+    ]
+    assert all(stage.max_queue_depth <= 2 for stage in stats)
+    assert all(stage.queue_depth == 0 for stage in stats)
+    assert all(stage.throughput > 0 for stage in stats)
+
+    # Once the run is over, the stats no longer change:
+    await asyncio.sleep(0.01)
+    assert pipeline.stats == stats
+    assert [stage.throughput for stage in pipeline.stats] == [
+        stage.throughput for stage in stats
+    ]
+
+
+@pytest.mark.asyncio
+async def test_pipeline_stage_names() -> None:
+    """Test naming stages that have no name of their own after their position."""
+
+    async def write(item: int) -> None:
+        """Write a number.
+
+        Args:
+        ----
+            item: A number.
+
+        """
+
+    pipeline = (
+        Pipeline(range(3))
+        .stage(partial(asyncio.sleep, 0))
+        .stage(partial(asyncio.sleep, 0), name="nap")
+        .sink(write)
+    )
+    await pipeline.async_run()
+    assert [stage.name for stage in pipeline.stats] == [
+        "source",
+        "stage1",
+        "nap",
+        "sink",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_pipeline_error() -> None:
+    """Test that a failing stage cancels the pipeline and raises its error."""
+    cancelled = asyncio.Event()
+
+    async def fail(item: int) -> int:
+        """Fail on a particular number.
+
+        Args:
+        ----
+            item: A number.
+
+        Returns:
+        -------
+            The number.
+
+        Raises:
+        ------
+            ValueError: Raised on the number 3.
+
+        """
+        if item == 3:
+            msg = "Bad item"
+            raise ValueError(msg)
+        return item
+
+    async def hang(_: int) -> None:
+        """Wait until cancelled."""
+        try:
+            await asyncio.Event().wait()
+        finally:
+            cancelled.set()
+
+    with pytest.raises(ValueError, match="Bad item"):
+        await Pipeline(range(10)).stage(fail).sink(hang).async_run()
+
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_pipeline_with_client(
+    aresponses: ResponsesMockServer,
+    authenticated_linkding_api_server: ResponsesMockServer,
+    bookmarks_async_get_all_response: dict[str, Any],
+    bookmarks_async_get_single_response: dict[str, Any],
+) -> None:
+    """Test enriching bookmarks from a paginated read with a pipeline.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_linkding_api_server: A mock authenticated linkding API server.
+        bookmarks_async_get_all_response: An API response payload.
+        bookmarks_async_get_single_response: An API response payload.
+
+    """
+    async with authenticated_linkding_api_server:
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/",
+            "get",
+            response=aiohttp.web_response.json_response(
+                {**bookmarks_async_get_all_response, "next": None}, status=200
+            ),
+        )
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/1/",
+            "patch",
+            response=aiohttp.web_response.json_response(
+                bookmarks_async_get_single_response, status=200
+            ),
+        )
+
+        async with aiohttp.ClientSession() as session:
+            client = await async_get_client(TEST_URL, TEST_TOKEN, session=session)
+
+            async def enrich(bookmark: dict[str, Any]) -> dict[str, Any]:
+                """Uppercase a bookmark's title.
+
+                Args:
+                ----
+                    bookmark: A bookmark.
+
+                Returns:
+                -------
+                    The enriched bookmark.
+
+                """
+                return {**bookmark, "title": bookmark["title"].upper()}
+
+            async def write(bookmark: dict[str, Any]) -> None:
+                """Write an enriched bookmark.
+
+                Args:
+                ----
+                    bookmark: A bookmark.
+
+                """
+                await client.bookmarks.async_update(
+                    bookmark["id"], title=bookmark["title"]
+                )
+
+            stats = (
+                await Pipeline(client.bookmarks.async_iter_all())
+                .stage(enrich)
+                .sink(write)
+                .async_run()
+            )
+
+        assert [stage.processed for stage in stats] == [1, 1, 1]
+
+    aresponses.assert_plan_strictly_followed()
@@ -0,0 +1,257 @@
+"""Define tests for the client pool."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable
+from typing import Any
+
+import aiohttp
+from aresponses import ResponsesMockServer
+import pytest
+
+from aiolinkding import Client, ClientPool
+from aiolinkding.errors import RequestError
+
+from .common import TEST_TOKEN, TEST_URL
+
+TEST_URL_2 = "http://127.0.0.2:8000"
+
+
+@pytest.mark.asyncio
+async def test_fan_out(
+    aresponses: ResponsesMockServer,
+    authenticated_linkding_api_server: ResponsesMockServer,
+    bookmarks_async_get_single_response: dict[str, Any],
+    health_response: dict[str, Any],
+) -> None:
+    """Test fanning a single request out to multiple instances.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_linkding_api_server: A mock authenticated linkding API server.
+        bookmarks_async_get_single_response: An API response payload.
+        health_response: An API response payload.
+
+    """
+    async with authenticated_linkding_api_server:
+        authenticated_linkding_api_server.add(
+            "127.0.0.2:8000",
+            "/health",
+            "get",
+            response=aiohttp.web_response.json_response(health_response, status=200),
+        )
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/1/",
+            "get",
+            response=aiohttp.web_response.json_response(
+                bookmarks_async_get_single_response, status=200
+            ),
+        )
+        authenticated_linkding_api_server.add(
+            "127.0.0.2:8000",
+            "/api/bookmarks/1/",
+            "get",
+            response=aiohttp.web_response.json_response(
+                {"detail": "Server error"}, status=500
+            ),
+        )
+
+        async with ClientPool(max_concurrent_requests=2) as pool:
+            await pool.async_add(TEST_URL, TEST_TOKEN, name="team-a")
+            await pool.async_add(TEST_URL_2, TEST_TOKEN, max_concurrent_requests=1)
+            assert len(pool) == 2
+            assert pool["team-a"] is not pool[TEST_URL_2]
+
+            results = {
+                result.name: result
+                async for result in pool.async_fan_out(
+                    lambda client: client.bookmarks.async_get_single(1)
+                )
+            }
+
+        assert results["team-a"].ok
+        assert results["team-a"].result == bookmarks_async_get_single_response
+        assert not results[TEST_URL_2].ok
+        assert isinstance(results[TEST_URL_2].error, RequestError)
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_fan_out_isolation(
+    aresponses: ResponsesMockServer,
+    authenticated_linkding_api_server: ResponsesMockServer,
+    health_response: dict[str, Any],
+) -> None:
+    """Test that a callable failing synchronously only fails its own instance.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_linkding_api_server: A mock authenticated linkding API server.
+        health_response: An API response payload.
+
+    """
+    cancelled = asyncio.Event()
+
+    async def wait_forever() -> None:
+        """Wait until cancelled."""
+        try:
+            await asyncio.Event().wait()
+        finally:
+            cancelled.set()
+
+    def operation(client: Client) -> Awaitable[None]:
+        """Fail right away on the second instance (and wait on the first).
+
+        Args:
+        ----
+            client: The client to use.
+
+        Returns:
+        -------
+            An awaitable.
+
+        Raises:
+        ------
+            ValueError: Raised on the second instance.
+
+        """
+        if client is pool[TEST_URL_2]:
+            msg = "Unsupported instance"
+            raise ValueError(msg)
+        return wait_forever()
+
+    async with authenticated_linkding_api_server:
+        authenticated_linkding_api_server.add(
+            "127.0.0.2:8000",
+            "/health",
+            "get",
+            response=aiohttp.web_response.json_response(health_response, status=200),
+        )
+
+        async with ClientPool() as pool:
+            await pool.async_add(TEST_URL, TEST_TOKEN)
+            await pool.async_add(TEST_URL_2, TEST_TOKEN)
+
+            stream = pool.async_fan_out(operation)
+            result = await anext(stream)
+            assert result.name == TEST_URL_2
+            assert isinstance(result.error, ValueError)
+
+            # Leaving early cancels (and waits for) the other instances:
+            await stream.aclose()
+            assert cancelled.is_set()
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_fan_out_iter(
+    aresponses: ResponsesMockServer,
+    authenticated_linkding_api_server: ResponsesMockServer,
+    bookmarks_async_get_all_response: dict[str, Any],
+    health_response: dict[str, Any],
+) -> None:
+    """Test merging paginated streams from multiple instances.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_linkding_api_server: A mock authenticated linkding API server.
+        bookmarks_async_get_all_response: An API response payload.
+        health_response: An API response payload.
+
+    """
+    async with authenticated_linkding_api_server:
+        authenticated_linkding_api_server.add(
+            "127.0.0.2:8000",
+            "/health",
+            "get",
+            response=aiohttp.web_response.json_response(health_response, status=200),
+        )
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/",
+            "get",
+            response=aiohttp.web_response.json_response(
+                {**bookmarks_async_get_all_response, "next": None}, status=200
+            ),
+        )
+        authenticated_linkding_api_server.add(
+            "127.0.0.2:8000",
+            "/api/bookmarks/",
+            "get",
+            response=aiohttp.web_response.json_response(
+                {"detail": "Server error"}, status=500
+            ),
+        )
+
+        async with aiohttp.ClientSession() as session:
+            pool = ClientPool(session=session)
+            await pool.async_add(TEST_URL, TEST_TOKEN)
+            await pool.async_add(TEST_URL_2, TEST_TOKEN)
+
+            results = [
+                result
+                async for result in pool.async_fan_out_iter(
+                    lambda client: client.bookmarks.async_iter_all(fields=["id"])
+                )
+            ]
+            await pool.async_close()
+            assert not session.closed
+
+        successes = [result for result in results if result.ok]
+        failures = [result for result in results if not result.ok]
+        assert [(result.name, result.result) for result in successes] == [
+            (TEST_URL, {"id": 1})
+        ]
+        assert [result.name for result in failures] == [TEST_URL_2]
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_fan_out_iter_early_exit(
+    aresponses: ResponsesMockServer,
+    authenticated_linkding_api_server: ResponsesMockServer,
+) -> None:
+    """Test that leaving a merged stream early stops every instance's pump.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_linkding_api_server: A mock authenticated linkding API server.
+
+    """
+
+    async def count(_: Client) -> AsyncIterator[int]:
+        """Yield more items than the merge queue can hold.
+
+        Yields
+        ------
+            Integers.
+
+        """
+        for number in range(10):
+            yield number
+
+    async with authenticated_linkding_api_server, aiohttp.ClientSession() as session:
+        pool = ClientPool(session=session)
+        await pool.async_add(TEST_URL, TEST_TOKEN)
+
+        # A name can only be used once:
+        with pytest.raises(ValueError, match="already in the pool"):
+            await pool.async_add(TEST_URL, TEST_TOKEN)
+
+        stream = pool.async_fan_out_iter(count, queue_size=1)
+        assert (await anext(stream)).result == 0
+
+        # The pump is blocked on a full queue; closing the stream must not hang:
+        async with asyncio.timeout(1):
+            await stream.aclose()
+
+    aresponses.assert_plan_strictly_followed()
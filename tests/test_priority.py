@@ -0,0 +1,203 @@
+"""Define tests for request priorities and the priority scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import aiohttp
+from aresponses import ResponsesMockServer
+import pytest
+
+from aiolinkding import async_get_client
+from aiolinkding.util.priority import (
+    Priority,
+    PriorityScheduler,
+    background_priority,
+    current_priority,
+    priority,
+)
+
+from .common import TEST_TOKEN, TEST_URL
+
+
+class RecordingScheduler(PriorityScheduler):
+    """Define a scheduler that records the priority class of every request."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        super().__init__()
+        self.levels: list[Priority] = []
+
+    async def _async_acquire(self, level: Priority) -> None:
+        """Record the priority class of a request and wait for a slot.
+
+        Args:
+        ----
+            level: The priority class of the request.
+
+        """
+        self.levels.append(level)
+        await super()._async_acquire(level)
+
+
+def test_priority_context() -> None:
+    """Test setting priority classes within (nested) contexts."""
+    assert current_priority() is Priority.NORMAL
+
+    with background_priority():
+        assert current_priority() is Priority.BULK
+
+    with priority(Priority.INTERACTIVE):
+        # Background work started from an interactive context stays interactive:
+        with background_priority():
+            assert current_priority() is Priority.INTERACTIVE
+        with priority("bulk"):
+            assert current_priority() is Priority.BULK
+        assert current_priority() is Priority.INTERACTIVE
+
+    assert current_priority() is Priority.NORMAL
+
+
+@pytest.mark.asyncio
+async def test_weighted_fair_queuing() -> None:
+    """Test that busy priority classes share slots in proportion to their weights."""
+    scheduler = PriorityScheduler(max_in_flight=1)
+    order: list[Priority] = []
+    gate = asyncio.Event()
+
+    async def hold() -> None:
+        """Hold the only slot until the gate opens."""
+        async with scheduler.slot(Priority.NORMAL):
+            await gate.wait()
+
+    async def request(level: Priority) -> None:
+        """Run a request at a priority class.
+
+        Args:
+        ----
+            level: The priority class.
+
+        """
+        async with scheduler.slot(level):
+            order.append(level)
+            await asyncio.sleep(0)
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    tasks = [
+        asyncio.create_task(request(level))
+        for level in (Priority.BULK, Priority.INTERACTIVE)
+        for _ in range(18)
+    ]
+    await asyncio.sleep(0)
+    assert scheduler.queued[Priority.BULK] == 18
+    assert scheduler.queued[Priority.INTERACTIVE] == 18
+
+    gate.set()
+    await asyncio.gather(holder, *tasks)
+
+    # With weights of 8:1, bulk requests get one of every nine slots (rather than
+    # waiting for every interactive request to finish):
+    assert order[:18].count(Priority.BULK) == 2
+    assert scheduler.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter() -> None:
+    """Test that a cancelled, queued request doesn't leak a slot."""
+    scheduler = PriorityScheduler(max_in_flight=1)
+
+    async with scheduler.slot():
+        waiter = asyncio.create_task(scheduler.slot().__aenter__())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+    assert scheduler.in_flight == 0
+    assert scheduler.queued[Priority.NORMAL] == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_after_grant() -> None:
+    """Test that a request cancelled after being granted a slot hands it on."""
+    scheduler = PriorityScheduler(max_in_flight=1)
+
+    async with scheduler.slot():
+        granted = asyncio.create_task(scheduler.slot().__aenter__())
+        next_in_line = asyncio.create_task(scheduler.slot().__aenter__())
+        await asyncio.sleep(0)
+
+    # The slot was just granted to the first waiter, which is cancelled before it
+    # gets to run:
+    granted.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await granted
+
+    await next_in_line
+    assert scheduler.in_flight == 1
+    assert scheduler.queued[Priority.NORMAL] == 0
+
+
+@pytest.mark.asyncio
+async def test_bulk_helpers_use_bulk_priority(
+    aresponses: ResponsesMockServer,
+    authenticated_linkding_api_server: ResponsesMockServer,
+    bookmarks_async_get_all_response: dict[str, Any],
+    bookmarks_async_get_single_response: dict[str, Any],
+) -> None:
+    """Test that paginated helpers default to bulk priority.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_linkding_api_server: A mock authenticated linkding API server.
+        bookmarks_async_get_all_response: An API response payload.
+        bookmarks_async_get_single_response: An API response payload.
+
+    """
+    async with authenticated_linkding_api_server:
+        for _ in range(2):
+            authenticated_linkding_api_server.add(
+                "127.0.0.1:8000",
+                "/api/bookmarks/",
+                "get",
+                response=aiohttp.web_response.json_response(
+                    {**bookmarks_async_get_all_response, "next": None}, status=200
+                ),
+            )
+        for _ in range(2):
+            authenticated_linkding_api_server.add(
+                "127.0.0.1:8000",
+                "/api/bookmarks/1/",
+                "get",
+                response=aiohttp.web_response.json_response(
+                    bookmarks_async_get_single_response, status=200
+                ),
+            )
+
+        scheduler = RecordingScheduler()
+        async with aiohttp.ClientSession() as session:
+            client = await async_get_client(
+                TEST_URL, TEST_TOKEN, session=session, scheduler=scheduler
+            )
+            async for _ in client.bookmarks.async_iter_all():
+                # The priority doesn't leak into the consumer's context:
+                assert current_priority() is Priority.NORMAL
+                await client.bookmarks.async_get_single(1)
+
+            with priority(Priority.INTERACTIVE):
+                async for _ in client.bookmarks.async_iter_all():
+                    pass
+                await client.bookmarks.async_get_single(1)
+
+        assert scheduler.levels == [
+            Priority.NORMAL,
+            Priority.BULK,
+            Priority.NORMAL,
+            Priority.INTERACTIVE,
+            Priority.INTERACTIVE,
+        ]
+
+    aresponses.assert_plan_strictly_followed()
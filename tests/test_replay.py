@@ -0,0 +1,184 @@
+"""Define tests for recording and replaying API traffic."""
+
+from __future__ import annotations
+
+import gzip
+from pathlib import Path
+from typing import Any
+
+import aiohttp
+from aresponses import ResponsesMockServer
+import pytest
+
+from aiolinkding import Client, async_get_client
+from aiolinkding.errors import RateLimitedError, RequestError
+from aiolinkding.util.replay import RecordingTransport, ReplayTransport
+
+from .common import TEST_TOKEN, TEST_URL
+
+
+@pytest.mark.asyncio
+async def test_record_and_replay(
+    aresponses: ResponsesMockServer,
+    authenticated_linkding_api_server: ResponsesMockServer,
+    bookmarks_async_get_all_response: dict[str, Any],
+    bookmarks_async_get_single_response: dict[str, Any],
+    tmp_path: Path,
+) -> None:
+    """Test recording traffic and replaying it without a server.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_linkding_api_server: A mock authenticated linkding API server.
+        bookmarks_async_get_all_response: An API response payload.
+        bookmarks_async_get_single_response: An API response payload.
+        tmp_path: A temporary directory.
+
+    """
+    recording = tmp_path / "linkding.ndjson.gz"
+
+    async with authenticated_linkding_api_server:
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/",
+            "get",
+            response=aiohttp.web_response.json_response(
+                bookmarks_async_get_all_response, status=200
+            ),
+        )
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/1/",
+            "get",
+            response=aiohttp.web_response.json_response(
+                bookmarks_async_get_single_response, status=200
+            ),
+        )
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/1/archive/",
+            "post",
+            response=aresponses.Response(status=204),
+        )
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/2/",
+            "get",
+            response=aiohttp.web_response.json_response(
+                {"detail": f"Server error ({TEST_TOKEN})"}, status=500
+            ),
+        )
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/3/",
+            "get",
+            response=aiohttp.web_response.json_response(
+                {"detail": "Request was throttled."},
+                status=429,
+                headers={"Retry-After": "7"},
+            ),
+        )
+
+        async with aiohttp.ClientSession() as session:
+            with RecordingTransport(session, recording) as transport:
+                client = await async_get_client(
+                    TEST_URL, TEST_TOKEN, transport=transport
+                )
+                await client.bookmarks.async_get_all(limit=10)
+                await client.bookmarks.async_get_single(1)
+                await client.bookmarks.async_archive(1)
+                with pytest.raises(RequestError):
+                    await client.bookmarks.async_get_single(2)
+                with pytest.raises(RateLimitedError):
+                    await client.bookmarks.async_get_single(3)
+
+    aresponses.assert_plan_strictly_followed()
+
+    with gzip.open(recording, "rt", encoding="utf-8") as fp:
+        contents = fp.read()
+    assert len(contents.splitlines()) == 6
+    assert TEST_TOKEN not in contents
+
+    # Blank lines (e.g., from a hand-edited recording) are skipped:
+    with gzip.open(recording, "at", encoding="utf-8") as fp:
+        fp.write("\n")
+
+    # Replay against a different host, with no server at all (and no delay, since
+    # the recorded latencies are scaled down to nothing):
+    client = Client(
+        "http://linkding.invalid",
+        "other_token",
+        transport=ReplayTransport(recording, simulate_latency=True, latency_scale=0),
+    )
+    assert (
+        await client.bookmarks.async_get_all(limit=10)
+        == bookmarks_async_get_all_response
+    )
+    assert (
+        await client.bookmarks.async_get_single(1)
+        == bookmarks_async_get_single_response
+    )
+    await client.bookmarks.async_archive(1)
+    with pytest.raises(RequestError):
+        await client.bookmarks.async_get_single(2)
+
+    # Response headers are replayed too:
+    with pytest.raises(RateLimitedError) as err:
+        await client.bookmarks.async_get_single(3)
+    assert err.value.retry_after == 7
+
+    # Requests that were never recorded are refused:
+    with pytest.raises(RequestError, match="No recorded response"):
+        await client.bookmarks.async_get_all(limit=20)
+
+
+@pytest.mark.asyncio
+async def test_replay_embedded_query(
+    aresponses: ResponsesMockServer,
+    authenticated_linkding_api_server: ResponsesMockServer,
+    tmp_path: Path,
+) -> None:
+    """Test that a query string embedded in an endpoint tells requests apart.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_linkding_api_server: A mock authenticated linkding API server.
+        tmp_path: A temporary directory.
+
+    """
+    recording = tmp_path / "linkding.ndjson.gz"
+
+    async with authenticated_linkding_api_server:
+        for query in ("a", "b"):
+            authenticated_linkding_api_server.add(
+                "127.0.0.1:8000",
+                f"/api/bookmarks/?q={query}",
+                "get",
+                response=aiohttp.web_response.json_response(
+                    {"count": 0, "results": [], "query": query}, status=200
+                ),
+                match_querystring=True,
+            )
+
+        async with aiohttp.ClientSession() as session:
+            with RecordingTransport(session, recording) as transport:
+                client = await async_get_client(
+                    TEST_URL, TEST_TOKEN, transport=transport
+                )
+                await client.async_request("get", "/api/bookmarks/?q=a")
+                await client.async_request("get", "/api/bookmarks/?q=b")
+
+    aresponses.assert_plan_strictly_followed()
+
+    client = Client(
+        "http://linkding.invalid", "other_token", transport=ReplayTransport(recording)
+    )
+    for query in ("b", "a"):
+        data = await client.async_request("get", f"/api/bookmarks/?q={query}")
+        assert data["query"] == query
+
+    # An embedded query string matches the same query passed via params:
+    data = await client.async_request("get", "/api/bookmarks/", params={"q": "a"})
+    assert data["query"] == "a"
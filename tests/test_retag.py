@@ -0,0 +1,185 @@
+"""Define tests for batched tag mutation."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import aiohttp
+from aresponses import ResponsesMockServer
+import pytest
+
+from aiolinkding import async_get_client
+from aiolinkding.util import retag
+
+from .common import TEST_TOKEN, TEST_URL
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "expected"),
+    [
+        ({}, ["a", "b", "c"]),
+        ({"add": ["d", "a"]}, ["a", "b", "c", "d"]),
+        ({"remove": ["b", "z"]}, ["a", "c"]),
+        ({"rename": {"b": "x"}}, ["a", "x", "c"]),
+        # Merging two tags:
+        ({"rename": {"a": "c"}}, ["c", "b"]),
+        # Additions win over removals:
+        ({"add": ["b"], "remove": ["b"]}, ["a", "c", "b"]),
+    ],
+)
+def test_retag(kwargs: dict[str, Any], expected: list[str]) -> None:
+    """Test computing new tag names.
+
+    Args:
+    ----
+        kwargs: The retag kwargs.
+        expected: The expected tag names.
+
+    """
+    assert retag(["a", "b", "c"], **kwargs) == expected
+
+
+@pytest.mark.asyncio
+async def test_retag_by_query(
+    aresponses: ResponsesMockServer,
+    authenticated_linkding_api_server: ResponsesMockServer,
+    bookmarks_async_get_all_response: dict[str, Any],
+    bookmarks_async_get_single_response: dict[str, Any],
+) -> None:
+    """Test retagging bookmarks that match a query.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_linkding_api_server: A mock authenticated linkding API server.
+        bookmarks_async_get_all_response: An API response payload.
+        bookmarks_async_get_single_response: An API response payload.
+
+    """
+    patches: list[tuple[str, dict[str, Any]]] = []
+
+    async def patch(request: aiohttp.web.Request) -> aiohttp.web.Response:
+        """Record a patch.
+
+        Args:
+        ----
+            request: The incoming request.
+
+        Returns:
+        -------
+            A response.
+
+        """
+        patches.append((request.path, await request.json()))
+        return aiohttp.web_response.json_response(
+            bookmarks_async_get_single_response, status=200
+        )
+
+    bookmark = bookmarks_async_get_all_response["results"][0]
+
+    async with authenticated_linkding_api_server:
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/?q=%23tag1&limit=100&offset=0&sort=added_asc",
+            "get",
+            response=aiohttp.web_response.json_response(
+                {
+                    **bookmarks_async_get_all_response,
+                    "next": None,
+                    "results": [bookmark, {**bookmark, "id": 2, "tag_names": ["x"]}],
+                },
+                status=200,
+            ),
+            match_querystring=True,
+        )
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/archived/?q=%23tag1&limit=100&offset=0&sort=added_asc",
+            "get",
+            response=aiohttp.web_response.json_response(
+                {
+                    **bookmarks_async_get_all_response,
+                    "next": None,
+                    "results": [{**bookmark, "id": 3, "tag_names": ["tag2"]}],
+                },
+                status=200,
+            ),
+            match_querystring=True,
+        )
+        for path in ("/api/bookmarks/1/", "/api/bookmarks/3/"):
+            authenticated_linkding_api_server.add(
+                "127.0.0.1:8000", path, "patch", response=patch
+            )
+
+        async with aiohttp.ClientSession() as session:
+            client = await async_get_client(TEST_URL, TEST_TOKEN, session=session)
+            progress = await client.bookmarks.async_retag(
+                "#tag1", add=["x"], remove=["tag2"], rename={"tag1": "renamed"}
+            )
+
+    assert progress.processed == 2
+    # Bookmark #2's tags don't change, so it isn't patched:
+    assert progress.skipped == 1
+    assert sorted(patches) == [
+        ("/api/bookmarks/1/", {"tag_names": ["renamed", "x"]}),
+        ("/api/bookmarks/3/", {"tag_names": ["x"]}),
+    ]
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_retag_by_ids(
+    aresponses: ResponsesMockServer,
+    authenticated_linkding_api_server: ResponsesMockServer,
+    bookmarks_async_get_single_response: dict[str, Any],
+) -> None:
+    """Test retagging bookmarks by ID.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_linkding_api_server: A mock authenticated linkding API server.
+        bookmarks_async_get_single_response: An API response payload.
+
+    """
+    patches: list[dict[str, Any]] = []
+
+    async def patch(request: aiohttp.web.Request) -> aiohttp.web.Response:
+        """Record a patch.
+
+        Args:
+        ----
+            request: The incoming request.
+
+        Returns:
+        -------
+            A response.
+
+        """
+        patches.append(await request.json())
+        return aiohttp.web_response.json_response(
+            bookmarks_async_get_single_response, status=200
+        )
+
+    async with authenticated_linkding_api_server:
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/1/",
+            "get",
+            response=aiohttp.web_response.json_response(
+                bookmarks_async_get_single_response, status=200
+            ),
+        )
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000", "/api/bookmarks/1/", "patch", response=patch
+        )
+
+        async with aiohttp.ClientSession() as session:
+            client = await async_get_client(TEST_URL, TEST_TOKEN, session=session)
+            progress = await client.bookmarks.async_retag([1], remove=["tag1"])
+
+    assert progress.processed == 1
+    assert patches == [{"tag_names": ["tag2"]}]
+
+    aresponses.assert_plan_strictly_followed()
@@ -0,0 +1,129 @@
+"""Define tests for session helpers."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import socket
+from unittest.mock import patch
+
+from aiohttp import TCPConnector
+from aiohttp.abc import AbstractResolver, ResolveResult
+import pytest
+
+from aiolinkding.util.session import (
+    CachingResolver,
+    DNSCache,
+    clear_dns_cache,
+    create_session,
+)
+
+
+class CountingResolver(AbstractResolver):
+    """Define a fake resolver that counts lookups."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.closed = False
+        self.lookups = 0
+
+    async def close(self) -> None:
+        """Close the resolver."""
+        self.closed = True
+
+    async def resolve(
+        self, host: str, port: int = 0, family: socket.AddressFamily = socket.AF_INET
+    ) -> list[ResolveResult]:
+        """Resolve a host.
+
+        Args:
+        ----
+            host: The host to resolve.
+            port: The port to resolve.
+            family: The address family.
+
+        Returns:
+        -------
+            A list of resolved addresses.
+
+        """
+        self.lookups += 1
+        return [
+            {
+                "hostname": host,
+                "host": "127.0.0.1",
+                "port": port,
+                "family": family,
+                "proto": 0,
+                "flags": 0,
+            }
+        ]
+
+
+@pytest.mark.asyncio
+async def test_caching_resolver() -> None:
+    """Test that DNS results are cached (and shared) until they expire."""
+    cache: DNSCache = OrderedDict()
+    inner = CountingResolver()
+    first = CachingResolver(ttl=60, resolver=inner, cache=cache)
+    second = CachingResolver(ttl=60, resolver=inner, cache=cache)
+
+    with patch("aiolinkding.util.session.time.monotonic", return_value=100.0):
+        await first.resolve("linkding.local", 443)
+        await second.resolve("linkding.local", 443)
+        assert inner.lookups == 1
+
+        await first.resolve("linkding.local", 80)
+        assert inner.lookups == 2
+
+    with patch("aiolinkding.util.session.time.monotonic", return_value=161.0):
+        results = await second.resolve("linkding.local", 443)
+        assert inner.lookups == 3
+        assert results[0]["host"] == "127.0.0.1"
+
+
+@pytest.mark.asyncio
+async def test_caching_resolver_max_size() -> None:
+    """Test that the least recently used result is evicted once the cache is full."""
+    cache: DNSCache = OrderedDict()
+    inner = CountingResolver()
+    resolver = CachingResolver(max_size=2, resolver=inner, cache=cache)
+
+    await resolver.resolve("a.local")
+    await resolver.resolve("b.local")
+    await resolver.resolve("a.local")
+    await resolver.resolve("c.local")
+    assert inner.lookups == 3
+    assert [host for host, _, _ in cache] == ["a.local", "c.local"]
+
+    await resolver.resolve("b.local")
+    assert inner.lookups == 4
+
+    await resolver.close()
+    assert inner.closed
+
+
+@pytest.mark.asyncio
+async def test_clear_dns_cache() -> None:
+    """Test clearing the process-wide DNS cache."""
+    inner = CountingResolver()
+    resolver = CachingResolver(resolver=inner)
+
+    clear_dns_cache()
+    await resolver.resolve("linkding.local", 443)
+    await resolver.resolve("linkding.local", 443)
+    assert inner.lookups == 1
+
+    clear_dns_cache()
+    await resolver.resolve("linkding.local", 443)
+    assert inner.lookups == 2
+    clear_dns_cache()
+
+
+@pytest.mark.asyncio
+async def test_create_session() -> None:
+    """Test creating a session that caches DNS results in a single layer."""
+    async with create_session() as session:
+        connector = session.connector
+        assert isinstance(connector, TCPConnector)
+        assert isinstance(connector._resolver, CachingResolver)
+        assert not connector.use_dns_cache
@@ -0,0 +1,123 @@
+"""Define tests for columnar bookmark snapshots."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import aiohttp
+from aresponses import ResponsesMockServer
+import pytest
+
+from aiolinkding import async_get_client
+from aiolinkding.util.columnar import MISSING_TIMESTAMP, BookmarkSnapshot
+
+from .common import TEST_TOKEN, TEST_URL
+
+
+def test_aggregations() -> None:
+    """Test aggregating a snapshot's columns."""
+    snapshot = BookmarkSnapshot()
+    snapshot.append(
+        {
+            "id": 1,
+            "url": "https://Example.com/a",
+            "tag_names": ["python", "async"],
+            "date_added": "2024-01-01T10:00:00Z",
+        }
+    )
+    snapshot.append(
+        {
+            "id": 2,
+            "url": "https://example.com/b",
+            "tag_names": ["python"],
+            "date_added": "2024-01-01T23:00:00Z",
+            "is_archived": True,
+        }
+    )
+    snapshot.append(
+        {
+            "id": 3,
+            "url": "https://docs.python.org",
+            "tag_names": [],
+            "date_added": "2024-01-03T00:00:00Z",
+        }
+    )
+
+    assert len(snapshot) == 3
+    assert snapshot.nbytes > 0
+    assert snapshot.tags == ["python", "async"]
+    assert snapshot.tag_names(0) == ["python", "async"]
+    assert snapshot.tag_names(2) == []
+    assert snapshot.top_tags(1) == [("python", 2)]
+    assert snapshot.domain_counts() == {"example.com": 2, "docs.python.org": 1}
+    assert list(snapshot.is_archived) == [0, 1, 0]
+    assert snapshot.date_histogram() == {1704067200: 2, 1704240000: 1}
+
+    with pytest.raises(ValueError, match="Unknown timestamp field"):
+        snapshot.date_histogram(field="url")
+
+    # Unparseable timestamps are left out of histograms:
+    snapshot.append({"id": 4, "url": "https://example.com", "date_added": "today"})
+    assert snapshot.date_added[3] == MISSING_TIMESTAMP
+    assert snapshot.date_histogram() == {1704067200: 2, 1704240000: 1}
+
+
+@pytest.mark.asyncio
+async def test_get_snapshot(
+    aresponses: ResponsesMockServer,
+    authenticated_linkding_api_server: ResponsesMockServer,
+    bookmarks_async_get_all_response: dict[str, Any],
+) -> None:
+    """Test loading every bookmark into a snapshot.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_linkding_api_server: A mock authenticated linkding API server.
+        bookmarks_async_get_all_response: An API response payload.
+
+    """
+    archived_bookmark = {
+        **bookmarks_async_get_all_response["results"][0],
+        "id": 2,
+        "url": "https://archived.example.com",
+        "is_archived": True,
+        "tag_names": ["tag2"],
+    }
+
+    async with authenticated_linkding_api_server:
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/",
+            "get",
+            response=aiohttp.web_response.json_response(
+                {**bookmarks_async_get_all_response, "next": None}, status=200
+            ),
+        )
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/archived/",
+            "get",
+            response=aiohttp.web_response.json_response(
+                {
+                    **bookmarks_async_get_all_response,
+                    "next": None,
+                    "results": [archived_bookmark],
+                },
+                status=200,
+            ),
+        )
+
+        async with aiohttp.ClientSession() as session:
+            client = await async_get_client(TEST_URL, TEST_TOKEN, session=session)
+            snapshot = await client.bookmarks.async_get_snapshot()
+
+        assert list(snapshot.ids) == [1, 2]
+        assert snapshot.top_tags() == [("tag2", 2), ("tag1", 1)]
+        assert snapshot.domain_counts() == {
+            "example.com": 1,
+            "archived.example.com": 1,
+        }
+        assert list(snapshot.date_added) == [1601113583, 1601113583]
+
+    aresponses.assert_plan_strictly_followed()
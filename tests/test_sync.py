@@ -0,0 +1,162 @@
+"""Define tests for the blocking client."""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import aiohttp
+from aresponses import ResponsesMockServer
+import pytest
+
+from aiolinkding import SyncClient
+from aiolinkding.errors import ClientClosedError, InvalidServerVersionError
+
+from .common import TEST_TOKEN, TEST_URL
+
+
+@pytest.mark.asyncio
+async def test_sync_client(
+    aresponses: ResponsesMockServer,
+    authenticated_linkding_api_server: ResponsesMockServer,
+    bookmarks_async_get_single_response: dict[str, Any],
+    tags_async_get_single_response: dict[str, Any],
+) -> None:
+    """Test using the blocking client from multiple threads.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_linkding_api_server: A mock authenticated linkding API server.
+        bookmarks_async_get_single_response: An API response payload.
+        tags_async_get_single_response: An API response payload.
+
+    """
+    async with authenticated_linkding_api_server:
+        for _ in range(4):
+            authenticated_linkding_api_server.add(
+                "127.0.0.1:8000",
+                "/api/bookmarks/1/",
+                "get",
+                response=aiohttp.web_response.json_response(
+                    bookmarks_async_get_single_response, status=200
+                ),
+            )
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/tags/1/",
+            "get",
+            response=aiohttp.web_response.json_response(
+                tags_async_get_single_response, status=200
+            ),
+        )
+
+        def run() -> None:
+            """Use the blocking client (outside of the test's event loop)."""
+            with SyncClient(TEST_URL, TEST_TOKEN) as client:
+                with ThreadPoolExecutor(max_workers=4) as executor:
+                    bookmarks = list(executor.map(client.bookmarks.get_single, [1] * 4))
+                assert bookmarks == [bookmarks_async_get_single_response] * 4
+                assert client.request("get", "/api/tags/1/") == (
+                    tags_async_get_single_response
+                )
+
+            with pytest.raises(ClientClosedError):
+                client.tags.get_single(1)
+
+            # Closing multiple times is a no-op:
+            client.close()
+
+        await asyncio.to_thread(run)
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_sync_iterators(
+    aresponses: ResponsesMockServer,
+    authenticated_linkding_api_server: ResponsesMockServer,
+    bookmarks_async_get_all_response: dict[str, Any],
+) -> None:
+    """Test that async generator methods become regular iterators.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_linkding_api_server: A mock authenticated linkding API server.
+        bookmarks_async_get_all_response: An API response payload.
+
+    """
+    bookmark = bookmarks_async_get_all_response["results"][0]
+    page = {
+        **bookmarks_async_get_all_response,
+        "next": None,
+        "results": [bookmark, {**bookmark, "id": 2}],
+    }
+
+    async with authenticated_linkding_api_server:
+        for _ in range(3):
+            authenticated_linkding_api_server.add(
+                "127.0.0.1:8000",
+                "/api/bookmarks/",
+                "get",
+                response=aiohttp.web_response.json_response(page, status=200),
+            )
+
+        def run() -> None:
+            """Use the blocking client (outside of the test's event loop)."""
+            with SyncClient(TEST_URL, TEST_TOKEN) as client:
+                assert [item["id"] for item in client.bookmarks.iter_all()] == [1, 2]
+
+                # Stopping early closes the underlying async generator:
+                iterator = client.bookmarks.iter_all()
+                assert next(iterator)["id"] == 1
+                iterator.close()
+
+                # ...unless the client has been closed in the meantime:
+                iterator = client.bookmarks.iter_all()
+                assert next(iterator)["id"] == 1
+
+                client.user.invalidate_profile()
+
+                with pytest.raises(AttributeError, match="use 'get_single'"):
+                    _ = client.bookmarks.async_get_single
+                with pytest.raises(AttributeError, match="missing"):
+                    _ = client.bookmarks.missing
+
+            iterator.close()
+
+        await asyncio.to_thread(run)
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_sync_client_setup_error(
+    aresponses: ResponsesMockServer,
+) -> None:
+    """Test that a client that fails to set up is closed.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+
+    """
+    aresponses.add(
+        "127.0.0.1:8000",
+        "/health",
+        "get",
+        response=aiohttp.web_response.json_response(
+            {"version": "1.0.0", "status": "healthy"}, status=200
+        ),
+    )
+
+    def run() -> None:
+        """Create the blocking client (outside of the test's event loop)."""
+        with pytest.raises(InvalidServerVersionError):
+            SyncClient(TEST_URL, TEST_TOKEN)
+
+    await asyncio.to_thread(run)
+
+    aresponses.assert_plan_strictly_followed()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 import aiohttp
@@ -9,6 +10,7 @@ from aresponses import ResponsesMockServer
 import pytest
 
 from aiolinkding import async_get_client
+from aiolinkding.errors import RequestError
 
 from .common import TEST_TOKEN, TEST_URL
 
@@ -112,3 +114,185 @@ async def test_get_single(
             assert single_tag == tags_async_get_single_response
 
     aresponses.assert_plan_strictly_followed()
+
+
+def _tag_page(
+    start: int, stop: int, *, count: int, has_next: bool
+) -> aiohttp.web_response.Response:
+    """Return a mock response containing a page of tags.
+
+    Args:
+    ----
+        start: The first tag ID in the page.
+        stop: The tag ID after the last one in the page.
+        count: The total number of tags reported by the server.
+        has_next: Whether the page links to a next page.
+
+    Returns:
+    -------
+        An aiohttp response.
+
+    """
+    return aiohttp.web_response.json_response(
+        {
+            "count": count,
+            "next": "http://127.0.0.1:8000/api/tags/?next" if has_next else None,
+            "previous": None,
+            "results": [
+                {"id": tag_id, "name": f"Tag{tag_id}", "date_added": None}
+                for tag_id in range(start, stop)
+            ],
+        },
+        status=200,
+    )
+
+
+@pytest.mark.asyncio
+async def test_fetch_all(
+    aresponses: ResponsesMockServer,
+    authenticated_linkding_api_server: ResponsesMockServer,
+) -> None:
+    """Test fetching every tag with sharded, concurrent page requests.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_linkding_api_server: A mock authenticated linkding API server.
+
+    """
+    async with authenticated_linkding_api_server:
+        for offset, stop, has_next in ((0, 2, True), (2, 4, True), (4, 5, False)):
+            authenticated_linkding_api_server.add(
+                "127.0.0.1:8000",
+                f"/api/tags/?limit=2&offset={offset}",
+                "get",
+                response=_tag_page(offset, stop, count=5, has_next=has_next),
+                match_querystring=True,
+            )
+
+        async with aiohttp.ClientSession() as session:
+            client = await async_get_client(TEST_URL, TEST_TOKEN, session=session)
+            tags = await client.tags.async_fetch_all(page_size=2, read_ahead=2)
+            assert [tag["id"] for tag in tags] == [0, 1, 2, 3, 4]
+
+            # Name lookups (and fresh enough fetches) are served from the cache:
+            tag = await client.tags.async_get_by_name("tag3")
+            assert tag is not None
+            assert tag["id"] == 3
+            assert await client.tags.async_get_by_name("missing") is None
+            assert len(await client.tags.async_fetch_all(max_age=60)) == 5
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_get_by_name_shared_refresh(
+    aresponses: ResponsesMockServer,
+    authenticated_linkding_api_server: ResponsesMockServer,
+) -> None:
+    """Test that concurrent lookups share a single refresh of a stale tag cache.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_linkding_api_server: A mock authenticated linkding API server.
+
+    """
+    async with authenticated_linkding_api_server:
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/tags/?limit=100&offset=0",
+            "get",
+            response=_tag_page(0, 3, count=3, has_next=False),
+            match_querystring=True,
+        )
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/tags/?limit=100&offset=0",
+            "get",
+            response=aiohttp.web_response.json_response(
+                {"detail": "Server error"}, status=500
+            ),
+            match_querystring=True,
+        )
+
+        async with aiohttp.ClientSession() as session:
+            client = await async_get_client(TEST_URL, TEST_TOKEN, session=session)
+            tags = await asyncio.gather(
+                *(client.tags.async_get_by_name(f"tag{tag_id}") for tag_id in range(3))
+            )
+            assert [tag["id"] for tag in tags if tag is not None] == [0, 1, 2]
+
+            # A failed refresh is raised to every waiting caller (and not reused):
+            results = await asyncio.gather(
+                client.tags.async_get_by_name("tag0", max_age=0),
+                client.tags.async_get_by_name("tag1", max_age=0),
+                return_exceptions=True,
+            )
+            assert all(isinstance(result, RequestError) for result in results)
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_iter_all_stale_count(
+    aresponses: ResponsesMockServer,
+    authenticated_linkding_api_server: ResponsesMockServer,
+) -> None:
+    """Test that tags added after the first page are still iterated over.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_linkding_api_server: A mock authenticated linkding API server.
+
+    """
+    async with authenticated_linkding_api_server:
+        for offset, stop, has_next in ((0, 2, True), (2, 4, True), (4, 5, False)):
+            authenticated_linkding_api_server.add(
+                "127.0.0.1:8000",
+                f"/api/tags/?limit=2&offset={offset}",
+                "get",
+                response=_tag_page(offset, stop, count=3, has_next=has_next),
+                match_querystring=True,
+            )
+
+        async with aiohttp.ClientSession() as session:
+            client = await async_get_client(TEST_URL, TEST_TOKEN, session=session)
+            tag_ids = [
+                tag["id"] async for tag in client.tags.async_iter_all(page_size=2)
+            ]
+            assert tag_ids == [0, 1, 2, 3, 4]
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_iter_all_early_exit(
+    aresponses: ResponsesMockServer,
+    authenticated_linkding_api_server: ResponsesMockServer,
+) -> None:
+    """Test that read-ahead requests are cancelled when iteration stops early.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_linkding_api_server: A mock authenticated linkding API server.
+
+    """
+    async with authenticated_linkding_api_server:
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/tags/?limit=2&offset=0",
+            "get",
+            response=_tag_page(0, 2, count=6, has_next=True),
+            match_querystring=True,
+        )
+
+        async with aiohttp.ClientSession() as session:
+            client = await async_get_client(TEST_URL, TEST_TOKEN, session=session)
+            tags = client.tags.async_iter_all(page_size=2, read_ahead=2)
+            assert (await anext(tags))["id"] == 0
+            await tags.aclose()
+
+    aresponses.assert_plan_strictly_followed()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 import aiohttp
@@ -44,3 +45,180 @@ async def test_get_profile(
             assert profile_info == user_async_get_profile_response
 
     aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_get_profile_cached(
+    aresponses: ResponsesMockServer,
+    authenticated_linkding_api_server: ResponsesMockServer,
+    user_async_get_profile_response: dict[str, Any],
+) -> None:
+    """Test that the profile is cached (and shared by concurrent callers).
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_linkding_api_server: A mock authenticated linkding API server.
+        user_async_get_profile_response: An API response payload.
+
+    """
+    async with authenticated_linkding_api_server:
+        for _ in range(2):
+            authenticated_linkding_api_server.add(
+                "127.0.0.1:8000",
+                "/api/user/profile/",
+                "get",
+                response=aiohttp.web_response.json_response(
+                    user_async_get_profile_response, status=200
+                ),
+            )
+
+        async with aiohttp.ClientSession() as session:
+            client = await async_get_client(TEST_URL, TEST_TOKEN, session=session)
+            profiles = await asyncio.gather(
+                *(client.user.async_get_profile() for _ in range(3))
+            )
+            assert all(
+                profile == user_async_get_profile_response for profile in profiles
+            )
+            assert await client.user.async_get_search_preferences() == {
+                "sort": "title_asc",
+                "shared": "off",
+                "unread": "off",
+            }
+
+            # A max age of 0 forces a refresh:
+            await client.user.async_get_profile(max_age=0)
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_get_profile_failed(
+    aresponses: ResponsesMockServer,
+    authenticated_linkding_api_server: ResponsesMockServer,
+    user_async_get_profile_response: dict[str, Any],
+) -> None:
+    """Test that a failed profile request isn't reused (even with no one awaiting it).
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_linkding_api_server: A mock authenticated linkding API server.
+        user_async_get_profile_response: An API response payload.
+
+    """
+    failed = asyncio.Event()
+
+    async def fail(_: aiohttp.web.Request) -> aiohttp.web.Response:
+        """Fail slowly.
+
+        Returns
+        -------
+            An aiohttp response.
+
+        """
+        await asyncio.sleep(0.1)
+        failed.set()
+        return aiohttp.web_response.Response(status=500)
+
+    async with authenticated_linkding_api_server:
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000", "/api/user/profile/", "get", response=fail
+        )
+        for _ in range(2):
+            authenticated_linkding_api_server.add(
+                "127.0.0.1:8000",
+                "/api/user/profile/",
+                "get",
+                response=aiohttp.web_response.json_response(
+                    user_async_get_profile_response, status=200
+                ),
+            )
+
+        async with aiohttp.ClientSession() as session:
+            client = await async_get_client(TEST_URL, TEST_TOKEN, session=session)
+
+            # The only caller gives up before the request fails:
+            with pytest.raises(TimeoutError):
+                async with asyncio.timeout(0.01):
+                    await client.user.async_get_profile()
+            await failed.wait()
+            await asyncio.sleep(0.01)
+
+            profile = await client.user.async_get_profile()
+            assert profile == user_async_get_profile_response
+
+            await client.user.async_invalidate_profile()
+            await client.user.async_get_profile()
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_profile_defaults(
+    aresponses: ResponsesMockServer,
+    authenticated_linkding_api_server: ResponsesMockServer,
+    bookmarks_async_get_all_response: dict[str, Any],
+    user_async_get_profile_response: dict[str, Any],
+) -> None:
+    """Test picking default bookmark sort orders from the user profile.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_linkding_api_server: A mock authenticated linkding API server.
+        bookmarks_async_get_all_response: An API response payload.
+        user_async_get_profile_response: An API response payload.
+
+    """
+    async with authenticated_linkding_api_server:
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/user/profile/",
+            "get",
+            response=aiohttp.web_response.json_response(
+                user_async_get_profile_response, status=200
+            ),
+        )
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/?sort=title_asc",
+            "get",
+            response=aiohttp.web_response.json_response(
+                bookmarks_async_get_all_response, status=200
+            ),
+            match_querystring=True,
+        )
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/archived/?sort=title_asc",
+            "get",
+            response=aiohttp.web_response.json_response(
+                bookmarks_async_get_all_response, status=200
+            ),
+            match_querystring=True,
+        )
+        # Multi-page scans use an order that is stable while bookmarks are added:
+        authenticated_linkding_api_server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/?limit=100&offset=0&sort=added_asc",
+            "get",
+            response=aiohttp.web_response.json_response(
+                {**bookmarks_async_get_all_response, "next": None}, status=200
+            ),
+            match_querystring=True,
+        )
+
+        async with aiohttp.ClientSession() as session:
+            client = await async_get_client(
+                TEST_URL, TEST_TOKEN, session=session, use_profile_defaults=True
+            )
+            await client.bookmarks.async_get_all()
+            await client.bookmarks.async_get_archived()
+            bookmarks = [
+                bookmark async for bookmark in client.bookmarks.async_iter_all()
+            ]
+            assert len(bookmarks) == 1
+
+    aresponses.assert_plan_strictly_followed()
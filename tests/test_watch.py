@@ -0,0 +1,291 @@
+"""Define tests for the bookmark watcher."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from typing import Any
+
+import aiohttp
+from aresponses import ResponsesMockServer
+import pytest
+
+from aiolinkding import async_get_client
+from aiolinkding.watch import BookmarkEvent, BookmarkEventType, BookmarkWatcher
+
+from .common import TEST_TOKEN, TEST_URL
+
+OLD_DATE = "2020-09-26T16:01:14.275335Z"
+NEW_DATE = "2020-09-27T16:01:14.275335Z"
+
+
+def _bookmark(bookmark_id: int, *, date: str, archived: bool) -> dict[str, Any]:
+    """Return a minimal bookmark.
+
+    Args:
+    ----
+        bookmark_id: The bookmark ID.
+        date: The modification date.
+        archived: Whether the bookmark is archived.
+
+    Returns:
+    -------
+        A bookmark dict.
+
+    """
+    return {
+        "id": bookmark_id,
+        "url": f"https://example.com/{bookmark_id}",
+        "date_modified": date,
+        "is_archived": archived,
+    }
+
+
+def _page(*bookmarks: dict[str, Any], count: int | None = None) -> aiohttp.web.Response:
+    """Return a response containing a single page of bookmarks.
+
+    Args:
+    ----
+        *bookmarks: The bookmarks on the page.
+        count: The total count (defaults to the number of bookmarks).
+
+    Returns:
+    -------
+        A response.
+
+    """
+    return aiohttp.web_response.json_response(
+        {
+            "count": len(bookmarks) if count is None else count,
+            "next": None,
+            "previous": None,
+            "results": list(bookmarks),
+        },
+        status=200,
+    )
+
+
+@pytest.mark.asyncio
+async def test_poll(
+    aresponses: ResponsesMockServer,
+    authenticated_linkding_api_server: ResponsesMockServer,
+) -> None:
+    """Test detecting every kind of change.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_linkding_api_server: A mock authenticated linkding API server.
+
+    """
+    modified_since: list[str | None] = []
+
+    def changes(
+        *bookmarks: dict[str, Any],
+    ) -> Callable[[aiohttp.web.Request], aiohttp.web.Response]:
+        """Return a handler that records the modified_since parameter.
+
+        Args:
+        ----
+            *bookmarks: The bookmarks to return.
+
+        Returns:
+        -------
+            A request handler.
+
+        """
+
+        def handler(request: aiohttp.web.Request) -> aiohttp.web.Response:
+            """Handle a request.
+
+            Args:
+            ----
+                request: The incoming request.
+
+            Returns:
+            -------
+                A response.
+
+            """
+            modified_since.append(request.query.get("modified_since"))
+            return _page(*bookmarks)
+
+        return handler
+
+    server = authenticated_linkding_api_server
+    active_path = "/api/bookmarks/"
+    archived_path = "/api/bookmarks/archived/"
+
+    async with server:
+        # Snapshot:
+        server.add(
+            "127.0.0.1:8000",
+            active_path,
+            "get",
+            response=_page(
+                _bookmark(1, date=OLD_DATE, archived=False),
+                _bookmark(3, date=OLD_DATE, archived=False),
+            ),
+        )
+        server.add(
+            "127.0.0.1:8000",
+            archived_path,
+            "get",
+            response=_page(_bookmark(2, date=OLD_DATE, archived=True)),
+        )
+        # First poll: #1 is updated, #3 is archived, #4 is added, #2 is deleted:
+        server.add(
+            "127.0.0.1:8000",
+            active_path,
+            "get",
+            response=changes(
+                _bookmark(1, date=NEW_DATE, archived=False),
+                _bookmark(4, date=NEW_DATE, archived=False),
+            ),
+        )
+        server.add(
+            "127.0.0.1:8000",
+            archived_path,
+            "get",
+            response=changes(_bookmark(3, date=NEW_DATE, archived=True)),
+        )
+        server.add("127.0.0.1:8000", active_path, "get", response=_page(count=2))
+        server.add("127.0.0.1:8000", archived_path, "get", response=_page(count=1))
+        server.add(
+            "127.0.0.1:8000",
+            active_path,
+            "get",
+            response=_page(
+                _bookmark(1, date=NEW_DATE, archived=False),
+                _bookmark(4, date=NEW_DATE, archived=False),
+            ),
+        )
+        server.add(
+            "127.0.0.1:8000",
+            archived_path,
+            "get",
+            response=_page(_bookmark(3, date=NEW_DATE, archived=True)),
+        )
+        # Second poll: nothing has changed:
+        server.add(
+            "127.0.0.1:8000",
+            active_path,
+            "get",
+            response=changes(_bookmark(4, date=NEW_DATE, archived=False)),
+        )
+        server.add("127.0.0.1:8000", archived_path, "get", response=changes())
+        server.add("127.0.0.1:8000", active_path, "get", response=_page(count=2))
+        server.add("127.0.0.1:8000", archived_path, "get", response=_page(count=1))
+
+        async with aiohttp.ClientSession() as session:
+            client = await async_get_client(TEST_URL, TEST_TOKEN, session=session)
+            watcher = BookmarkWatcher(
+                client.bookmarks,
+                min_interval=1,
+                max_interval=3,
+                backoff=2,
+                page_size=100,
+            )
+            await watcher.async_snapshot()
+
+            events = await watcher.async_poll()
+            assert [(event.type, event.bookmark_id) for event in events] == [
+                (BookmarkEventType.UPDATED, 1),
+                (BookmarkEventType.ADDED, 4),
+                (BookmarkEventType.ARCHIVED, 3),
+                (BookmarkEventType.DELETED, 2),
+            ]
+            assert events[0].bookmark == _bookmark(1, date=NEW_DATE, archived=False)
+            assert events[3].bookmark is None
+            assert watcher.interval == 1
+
+            assert await watcher.async_poll() == []
+            assert watcher.interval == 2
+
+    assert modified_since == [OLD_DATE, OLD_DATE, NEW_DATE, NEW_DATE]
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_watch(
+    aresponses: ResponsesMockServer,
+    authenticated_linkding_api_server: ResponsesMockServer,
+) -> None:
+    """Test watching for changes via the bookmark manager.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_linkding_api_server: A mock authenticated linkding API server.
+
+    """
+    server = authenticated_linkding_api_server
+    unarchived = _bookmark(1, date=NEW_DATE, archived=False)
+
+    async with server:
+        server.add("127.0.0.1:8000", "/api/bookmarks/", "get", response=_page())
+        server.add(
+            "127.0.0.1:8000",
+            "/api/bookmarks/archived/",
+            "get",
+            response=_page(_bookmark(1, date=OLD_DATE, archived=True)),
+        )
+        server.add(
+            "127.0.0.1:8000", "/api/bookmarks/", "get", response=_page(unarchived)
+        )
+        server.add(
+            "127.0.0.1:8000", "/api/bookmarks/archived/", "get", response=_page()
+        )
+        server.add("127.0.0.1:8000", "/api/bookmarks/", "get", response=_page(count=1))
+        server.add(
+            "127.0.0.1:8000", "/api/bookmarks/archived/", "get", response=_page()
+        )
+
+        async with aiohttp.ClientSession() as session:
+            client = await async_get_client(TEST_URL, TEST_TOKEN, session=session)
+            watch = client.bookmarks.async_watch(min_interval=0)
+            event = await anext(watch)
+
+            # Closing the client stops the watcher at its next poll:
+            await client.async_close()
+            with pytest.raises(StopAsyncIteration):
+                await anext(watch)
+
+    assert event == BookmarkEvent(BookmarkEventType.UNARCHIVED, 1, unarchived)
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_watch_woken_by_drain(
+    aresponses: ResponsesMockServer,
+    authenticated_linkding_api_server: ResponsesMockServer,
+) -> None:
+    """Test that draining the client wakes up a sleeping watcher.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_linkding_api_server: A mock authenticated linkding API server.
+
+    """
+    server = authenticated_linkding_api_server
+
+    async with server:
+        server.add("127.0.0.1:8000", "/api/bookmarks/", "get", response=_page())
+        server.add(
+            "127.0.0.1:8000", "/api/bookmarks/archived/", "get", response=_page()
+        )
+
+        async with aiohttp.ClientSession() as session:
+            client = await async_get_client(TEST_URL, TEST_TOKEN, session=session)
+            watch = client.bookmarks.async_watch(min_interval=300, max_interval=300)
+            event = asyncio.ensure_future(anext(watch))
+            await asyncio.sleep(0.01)
+            assert not event.done()
+
+            async with asyncio.timeout(1):
+                assert await client.async_drain() is True
+                with pytest.raises(StopAsyncIteration):
+                    await event
+
+    aresponses.assert_plan_strictly_followed()